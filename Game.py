@@ -3,44 +3,80 @@ import logging
 import pygame
 import sys
 import os
+import time
 
 from ConfigLoader import ConfigLoader
 from src.EventHandler import EventHandler
+from src.GameMechanics.Configs.ConfigCompiler import ConfigCompiler
+from src.GameMechanics.Configs.ConfigRecords import CompiledConfig
+from src.Utils.AssetCache import AssetCache
+from src.Utils.AssetPreloader import AssetPreloader
+from src.Utils.Button import Button
+from src.Utils.TextCache import TextCache
 from src.Utils.GradientUtils import GradientUtils
 from src.Scenes.GameScene import GameScene
+from src.Scenes.LoadingScene import LoadingScene
 from src.Scenes.MainMenuScene import MainMenuScene
 
 
 class Main:
-    def __init__(self):
+    def __init__(self, headless: bool = False):
+        self.__startTime = time.perf_counter()
         self.__running = True
+        self.__headless = headless
+        if headless:
+            # No window and no audio device, used by the simulation runner
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.init()
 
-        try:
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-            print("Mixer initialized successfully.")
-        except pygame.error as e:
-            print(f"Mixer initialization failed: {e}")
-            # Handle the error or exit
-            pygame.quit()
-            exit()
+        if not headless:
+            try:
+                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+                print("Mixer initialized successfully.")
+            except pygame.error as e:
+                print(f"Mixer initialization failed: {e}")
+                # Handle the error or exit
+                pygame.quit()
+                exit()
 
         self.__projectRoot = os.path.dirname(os.path.abspath(__file__))
         self.__config = ConfigLoader(os.path.join(self.__projectRoot, "config", "config.json"))
+        self.__configCompiler = ConfigCompiler(self.__projectRoot)
+        self.__compiledConfig = self.__configCompiler.load()
         self.__eventHandler = EventHandler(self)
         self.__screen = None
         #self.__screen_width = self.__config.getScreenWidth()
         #self.__screen_height = self.__config.getScreenHeight()
         self.__gradientUtils = GradientUtils()
+        self.__assetCache = AssetCache(self.__projectRoot)
         self.__initScreen__()
         self.__fontCache = {}
+        self.__textCache = TextCache(self.getFont)
+        self.__frameStats = {
+            "sim_ms": 0.0, "draw_ms": 0.0, "substeps": 0.0, "dropped_steps": 0,
+            "button_hits": 0.0, "button_rebuilds": 0.0
+        }
 
+        self.__startupStats = {"init_ms": 0.0, "first_frame_ms": 0.0}
+
+        # The game scene is built the first time it is entered, see setCurrentScene()
+        self.__gameStage = "default"
         self.__scenes = {
-            "game": GameScene(self),
-            "main": MainMenuScene(self)
+            "game": None,
+            "main": MainMenuScene(self),
+            "loading": LoadingScene(self)
         }
 
         self.__currentScene = self.__scenes["main"]
+        self.__currentSceneName = "main"
+
+        # Decode the game scene's images and sounds while the player is on the menu
+        self.__assetPreloader = None
+        if not headless:
+            self.__assetPreloader = AssetPreloader(self.__assetCache, lambda: GameScene.collectAssets(self.__compiledConfig))
+            self.__assetPreloader.start()
+        self.__startupStats["init_ms"] = (time.perf_counter() - self.__startTime) * 1000
 
     def __initScreen__(self):
         try:
@@ -56,34 +92,117 @@ class Main:
 
     def run(self):
         clock = pygame.time.Clock()
+        timeStep = 1.0 / (self.__config.getGameSettings("simulation_rate") or 60)
+        maxSubsteps = self.__config.getGameSettings("max_substeps") or 5
+        accumulator = 0.0
         while self.__running:
+            accumulator += clock.tick(60) / 1000.0
             self.__eventHandler.handle()
-            self.__currentScene.tick(clock.tick(60) / 1000.0)
+
+            # Advance the simulation in fixed steps, capped so a slow frame can't make us spiral
+            simStart = time.perf_counter()
+            substeps = 0
+            while accumulator >= timeStep and substeps < maxSubsteps:
+                self.__currentScene.update(timeStep)
+                accumulator -= timeStep
+                substeps += 1
+            if accumulator >= timeStep:
+                self.__frameStats["dropped_steps"] += int(accumulator / timeStep)
+                accumulator %= timeStep
+
+            drawStart = time.perf_counter()
+            self.__currentScene.draw(accumulator / timeStep)
 
             # Update the display
             try:
-                pygame.display.flip()
+                self.__currentScene.present()
             except Exception as e:
                 logging.error(f"Error updating display: {e}")
+            drawEnd = time.perf_counter()
+            self.__recordFrame((drawStart - simStart) * 1000, (drawEnd - drawStart) * 1000, substeps)
+            if not self.__startupStats["first_frame_ms"]:
+                self.__startupStats["first_frame_ms"] = (drawEnd - self.__startTime) * 1000
+                logging.info(f"Startup stats: {self.getStartupStats()}")
 
+        logging.info(f"Asset cache stats: {self.__assetCache.getStats()}")
+        logging.info(f"Text cache stats: {self.__textCache.getStats()}")
+        logging.info(f"Gradient cache stats: {self.__gradientUtils.get_stats()}")
+        logging.info(f"Frame stats: {self.getFrameStats()}")
+        logging.info(f"Startup stats: {self.getStartupStats()}")
         pygame.time.delay(1000)
         pygame.quit()
         sys.exit()
 
+    def __recordFrame(self, simMs: float, drawMs: float, substeps: int):
+        # Exponential moving averages, so the numbers follow the current load
+        smoothing = 0.05
+        stats = self.__frameStats
+        stats["sim_ms"] += (simMs - stats["sim_ms"]) * smoothing
+        stats["draw_ms"] += (drawMs - stats["draw_ms"]) * smoothing
+        stats["substeps"] += (substeps - stats["substeps"]) * smoothing
+        buttons = Button.pop_render_stats()
+        stats["button_hits"] += (buttons["hits"] - stats["button_hits"]) * smoothing
+        stats["button_rebuilds"] += (buttons["rebuilds"] - stats["button_rebuilds"]) * smoothing
+
+    def getFrameStats(self) -> dict:
+        """
+        Return the averaged simulation and draw cost per frame in milliseconds,
+        the average number of fixed steps per frame, how many steps were dropped,
+        and how many Button draws per frame reused their cached surface or rebuilt it.
+        """
+        return dict(self.__frameStats)
+
+    def getStartupStats(self) -> dict:
+        """
+        Return the time in milliseconds from the start of __init__ until it returned and until the
+        first frame was presented, how long asset preloading took (0.0 while still running),
+        and whether the compiled config came from its cache and how long loading it took.
+        """
+        stats = dict(self.__startupStats)
+        configStats = self.__configCompiler.getStats()
+        stats["config_source"] = configStats["source"]
+        stats["config_ms"] = configStats["ms"]
+        stats["preload_ms"] = self.__assetPreloader.getElapsedMs() if self.__assetPreloader is not None else 0.0
+        return stats
+
     def getConfig(self) -> ConfigLoader:
         return self.__config
 
+    def getCompiledConfig(self) -> CompiledConfig:
+        """
+        Return the validated tower, enemy, stage and inventory records.
+        """
+        return self.__compiledConfig
+
     def getFont(self, size: int) -> pygame.font.Font:
         if size not in self.__fontCache:
             self.__fontCache[size] = pygame.font.Font('Kanit-Regular.ttf', size)
         return self.__fontCache[size]
 
+    def getTextCache(self) -> TextCache:
+        return self.__textCache
+
     def getGradientUtils(self) -> GradientUtils:
         return self.__gradientUtils
 
+    def getAssetCache(self) -> AssetCache:
+        return self.__assetCache
+
+    def getAssetPreloader(self) -> AssetPreloader | None:
+        """
+        Return the background asset preloader, or None when running headless.
+        """
+        return self.__assetPreloader
+
     def getProjectRoot(self) -> str:
         return self.__projectRoot
 
+    def getEventHandler(self) -> EventHandler:
+        return self.__eventHandler
+
+    def isHeadless(self) -> bool:
+        return self.__headless
+
     def setRunning(self, running: bool):
         self.__running = running
 
@@ -91,25 +210,55 @@ class Main:
         return self.__currentScene
 
     def getCurrentSceneName(self):
-        for key, value in self.__scenes.items():
-            if value == self.__currentScene:
-                return key
+        # None once the current scene object has been replaced by resetScene()
+        if self.__scenes.get(self.__currentSceneName) is self.__currentScene:
+            return self.__currentSceneName
         return None
 
     def setCurrentScene(self, sceneName: str):
-        if sceneName in self.__scenes:
-            self.__currentScene = self.__scenes[sceneName]
+        if sceneName not in self.__scenes:
+            raise ValueError(f"Scene {sceneName} does not exist.")
+        if self.__scenes[sceneName] is None:
+            self.__scenes[sceneName] = self.__buildScene(sceneName)
+        scene = self.__scenes[sceneName]
+        entered = scene is not self.__currentScene
+        self.__currentScene = scene
+        self.__currentSceneName = sceneName
+        if entered:
+            scene.onEnter()
+
+    def __buildScene(self, sceneName: str):
+        start = time.perf_counter()
+        if sceneName == "game":
+            scene = GameScene(self, self.__gameStage)
+        elif sceneName == "main":
+            scene = MainMenuScene(self)
+        elif sceneName == "loading":
+            scene = LoadingScene(self)
         else:
             raise ValueError(f"Scene {sceneName} does not exist.")
+        logging.info(f"Built scene '{sceneName}' in {(time.perf_counter() - start) * 1000:.1f} ms.")
+        return scene
 
     def getScreen(self):
         return self.__screen
 
-    def resetScene(self, sceneName: str):
-        self.__scenes[sceneName] = None
+    def resetScene(self, sceneName: str, stage: str = "default"):
+        """
+        Start the scene over. A game scene on the same stage only resets its run and keeps
+        its configs, assets and sounds, and one that was never entered is built on first entry;
+        any other scene is built again.
+        """
+        if sceneName not in self.__scenes:
+            raise ValueError(f"Scene {sceneName} does not exist.")
+        scene = self.__scenes[sceneName]
         if sceneName == "game":
-            self.__scenes[sceneName] = GameScene(self)
-        elif sceneName == "main":
-            self.__scenes[sceneName] = MainMenuScene(self)
-        else:
-            raise ValueError(f"Scene {sceneName} does not exist.")
\ No newline at end of file
+            if scene is None:
+                self.__gameStage = stage
+                return
+            if scene.getStage() == stage:
+                scene.reset()
+                return
+            self.__gameStage = stage
+        self.__scenes[sceneName] = None
+        self.__scenes[sceneName] = self.__buildScene(sceneName)
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Measure loading the tower, enemy, stage and inventory configs: parsing and validating the JSON
+files versus loading the compiled records from the on-disk cache, and a tower stat lookup from
+the raw JSON dicts versus the compiled records.
+
+Run from the project root: python -m benchmarks.config_benchmark
+"""
+import json
+import logging
+import os
+import time
+
+from src.GameMechanics.Configs.ConfigCompiler import ConfigCompiler
+
+REPEAT = 50
+LOOKUPS = 100000
+
+
+def timeMs(function, repeat: int = REPEAT) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.ERROR)
+    projectRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    compiler = ConfigCompiler(projectRoot)
+    compiler.load()  # Make sure the cache exists
+
+    compileMs = timeMs(compiler.compile)
+    cachedMs = timeMs(compiler.load)
+
+    with open(os.path.join(projectRoot, "config", "towers", "steve.json")) as f:
+        raw = json.load(f)
+    level = 1
+    rawMs = timeMs(lambda: raw.get(str(level)).get("damage", 0), LOOKUPS)
+    tower = compiler.load().towers["steve"]
+    compiledMs = timeMs(lambda: tower.getLevel(level).damage, LOOKUPS)
+
+    print(f"Config load in ms, averaged over {REPEAT} loads")
+    print(f"parse and validate: {compileMs:.2f}")
+    print(f"compiled cache:     {cachedMs:.2f}")
+    print(f"Tower damage lookup in ns, averaged over {LOOKUPS} lookups")
+    print(f"raw JSON dict:      {rawMs * 1e6:.0f}")
+    print(f"compiled record:    {compiledMs * 1e6:.0f}")
@@ -0,0 +1,42 @@
+"""
+Measure the headless simulation cost per frame of the sprite and numpy enemy engines.
+
+Run from the project root: python -m benchmarks.enemy_engine_benchmark
+"""
+import logging
+import time
+
+from src.Simulation.HeadlessRunner import HeadlessRunner
+
+FRAMES = 120
+TIME_STEP = 1 / 60
+
+
+def measure(runner: HeadlessRunner, engine: str, enemyCount: int) -> float:
+    main = runner.getMain()
+    main.getConfig().getGameSettings()["enemy_engine"] = engine
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    scene = main.getCurrentScene()
+    scene.getUIManager().waveChangeUI.canStart = True
+
+    waveManager = scene.getWaveManager()
+    for _ in range(enemyCount):
+        waveManager.spawnEnemy("netherite")
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        scene.update(TIME_STEP)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+if __name__ == "__main__":
+    runner = HeadlessRunner()
+    runner.getMain()
+    logging.getLogger().setLevel(logging.WARNING)
+    print(f"Headless update cost in ms per frame, averaged over {FRAMES} frames (16.7 ms = 60 FPS)")
+    print(f"{'enemies':>8} {'sprite ms':>10} {'numpy ms':>10}")
+    for count in (100, 1000, 5000, 10000):
+        spriteMs = measure(runner, "sprite", count)
+        numpyMs = measure(runner, "numpy", count)
+        print(f"{count:>8} {spriteMs:>10.2f} {numpyMs:>10.2f}")
@@ -0,0 +1,45 @@
+"""
+Measure the batched enemy overlay pass (health bars and debuff tints) for growing enemy counts.
+Half of the enemies are damaged and slowed, so every one of them gets a bar and half get a tint.
+
+Run from the project root: python -m benchmarks.enemy_overlay_benchmark
+Set SDL_VIDEODRIVER=dummy (and SDL_AUDIODRIVER=dummy) to run it without a display.
+"""
+import logging
+import time
+
+from Game import Main
+
+REPEAT = 50
+
+
+def measure(main: Main, enemyCount: int) -> tuple[float, bool]:
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    scene = main.getCurrentScene()
+    waveManager = scene.getWaveManager()
+    pathLength = scene.getStageManager().getStageConfig().getCompiledPath().getTotalLength()
+    for _ in range(enemyCount):
+        waveManager.spawnEnemy("netherite")
+    for index, enemy in enumerate(waveManager.getEnemies()):
+        enemy.spawn((index * 37) % pathLength)  # Spread them along the path
+        enemy.setHealth(enemy.getMaxHealth() // 2)
+        if index % 2:
+            enemy.setSpeedMultiplier("slow_benchmark", 0.5, 100000)
+
+    overlay = scene.getUIManager().enemyOverlayUI
+    overlay.display()
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        overlay.display()
+    return (time.perf_counter() - start) * 1000 / REPEAT, overlay.isLowDetail()
+
+
+if __name__ == "__main__":
+    main = Main()
+    logging.getLogger().setLevel(logging.WARNING)
+    print(f"Enemy overlay pass in ms, averaged over {REPEAT} passes")
+    print(f"{'enemies':>8} {'ms':>8} {'low detail':>11}")
+    for count in (10, 100, 300, 1000, 3000):
+        elapsed, lowDetail = measure(main, count)
+        print(f"{count:>8} {elapsed:>8.2f} {str(lowDetail):>11}")
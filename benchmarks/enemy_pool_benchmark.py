@@ -0,0 +1,70 @@
+"""
+Measure memory per live enemy and the allocations made by spawning from a cold and a warm EnemyPool.
+
+Run from the project root: python -m benchmarks.enemy_pool_benchmark
+"""
+import gc
+import logging
+import time
+import tracemalloc
+
+from src.Simulation.HeadlessRunner import HeadlessRunner
+
+ENEMY_COUNT = 2000
+
+
+def freshWaveManager(runner: HeadlessRunner, engine: str):
+    main = runner.getMain()
+    main.getConfig().getGameSettings()["enemy_engine"] = engine
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    scene = main.getCurrentScene()
+    scene.getUIManager().waveChangeUI.canStart = True
+    return scene.getWaveManager()
+
+
+def spawnMeasured(waveManager, count: int) -> tuple[float, float]:
+    """
+    Spawn count enemies and return (bytes allocated per spawn, microseconds per spawn).
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    for _ in range(count):
+        waveManager.spawnEnemy("copper")
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return allocated / count, elapsed * 1_000_000 / count
+
+
+def killAll(waveManager):
+    for enemy in list(waveManager.getEnemies()):
+        enemy.killEnemy()
+    waveManager.update(0.0)  # Hands the dead enemies back to the pool
+
+
+def measure(runner: HeadlessRunner, engine: str):
+    waveManager = freshWaveManager(runner, engine)
+    waveManager.spawnEnemy("copper")  # Build the archetype and warm the asset cache
+    killAll(waveManager)
+    waveManager.getPool().clear()
+
+    coldBytes, coldUs = spawnMeasured(waveManager, ENEMY_COUNT)
+    killAll(waveManager)
+    warmBytes, warmUs = spawnMeasured(waveManager, ENEMY_COUNT)
+    stats = waveManager.getPool().getStats()
+    return coldBytes, coldUs, warmBytes, warmUs, stats
+
+
+if __name__ == "__main__":
+    runner = HeadlessRunner()
+    runner.getMain()
+    logging.getLogger().setLevel(logging.WARNING)
+    print(f"Spawning {ENEMY_COUNT} enemies from an empty pool (cold) and from a full pool (warm)")
+    print(f"{'engine':>8} {'cold B/enemy':>13} {'cold us':>8} {'warm B/enemy':>13} {'warm us':>8}  pool")
+    for engine in ("sprite", "numpy"):
+        coldBytes, coldUs, warmBytes, warmUs, stats = measure(runner, engine)
+        print(f"{engine:>8} {coldBytes:>13.0f} {coldUs:>8.1f} {warmBytes:>13.0f} {warmUs:>8.1f}  {stats}")
@@ -0,0 +1,42 @@
+"""
+Compare building each gradient type with the NumPy path and the line/pixel drawing fallback.
+
+Run from the project root: python -m benchmarks.gradient_benchmark
+"""
+import time
+
+from src.Utils.GradientUtils import GradientUtils
+
+COLORS = [(255, 0, 0), (255, 128, 0), (255, 255, 0)]
+SIZES = [(120, 40), (300, 100), (959, 704)]
+
+
+def timeMs(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def measure(kind: str, width: int, height: int) -> tuple[float, float]:
+    gradientUtils = GradientUtils()
+    build = getattr(gradientUtils, f"get_{kind}_gradient")
+    draw = getattr(gradientUtils, f"_draw_{kind}_gradient")
+    extra = ((width // 2, height // 2),) if kind == "radial" else ()
+    # Per-pixel fallbacks take seconds at screen size, so run them once there
+    repeat = 1 if kind in ("diagonal", "radial") and width * height > 100_000 else 5
+
+    def vectorized():
+        gradientUtils.clear_cache()
+        build(width, height, COLORS, *extra)
+
+    return timeMs(vectorized, repeat), timeMs(lambda: draw(width, height, COLORS, *extra), repeat)
+
+
+if __name__ == "__main__":
+    print("Gradient build cost in ms (cache cleared before every build)")
+    print(f"{'type':>10} {'size':>9} {'numpy':>9} {'fallback':>10} {'speedup':>8}")
+    for kind in ("vertical", "horizontal", "diagonal", "radial"):
+        for width, height in SIZES:
+            fastMs, slowMs = measure(kind, width, height)
+            print(f"{kind:>10} {f'{width}x{height}':>9} {fastMs:>9.2f} {slowMs:>10.2f} {slowMs / fastMs:>7.0f}x")
@@ -0,0 +1,93 @@
+"""
+Measure tower range queries on the stage path: SpatialHashGrid radius queries with a Euclidean
+distance check (as towers did before path coverage) versus ProgressIndex coverage queries, which
+look up each tower's precomputed coverage intervals in the enemies ordered by travelled distance.
+Also reports the one-off cost of computing a tower's coverage.
+
+Run from the project root: python -m benchmarks.path_coverage_benchmark
+Set SDL_VIDEODRIVER=dummy (and SDL_AUDIODRIVER=dummy) to run it without a display.
+"""
+import logging
+import random
+import time
+
+from Game import Main
+from src.GameMechanics.Engine.ProgressIndex import ProgressIndex
+from src.Utils.SpatialHash import SpatialHashGrid
+
+FRAMES = 20
+
+
+class PathPoint:
+    """
+    Stand-in for an enemy at a fixed distance along the path, with what ProgressIndex reads.
+    """
+    def __init__(self, distance: float):
+        self.distance = distance
+
+    def getDistance(self) -> float:
+        return self.distance
+
+    def getHealth(self) -> float:
+        return 100.0
+
+    def alive(self) -> bool:
+        return True
+
+    def isAlive(self) -> bool:
+        return True
+
+
+def measure(path, gridSize: int, towers: list, coverages: list, enemyCount: int) -> tuple[float, float, int]:
+    rng = random.Random(enemyCount)
+    spatialIndex = SpatialHashGrid(gridSize)
+    progressIndex = ProgressIndex(path.getTotalLength())
+    for _ in range(enemyCount):
+        enemy = PathPoint(rng.uniform(0, path.getTotalLength()))
+        x, y, _ = path.positionAt(enemy.distance)
+        spatialIndex.insert(enemy, x, y)
+        progressIndex.add(enemy)
+    progressIndex.update()
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        radiusHits = sum(len(spatialIndex.queryRadius(x, y, radius)) for x, y, radius in towers)
+    radiusMs = (time.perf_counter() - start) * 1000 / FRAMES
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        coverageHits = sum(len(progressIndex.queryCoverage(coverage)) for coverage in coverages)
+    coverageMs = (time.perf_counter() - start) * 1000 / FRAMES
+
+    if radiusHits != coverageHits:
+        raise AssertionError(f"Radius and coverage queries disagree: {radiusHits} != {coverageHits}")
+    return radiusMs, coverageMs, radiusHits
+
+
+if __name__ == "__main__":
+    main = Main()
+    logging.getLogger().setLevel(logging.WARNING)
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    scene = main.getCurrentScene()
+    stageConfig = scene.getStageManager().getStageConfig()
+    path = stageConfig.getCompiledPath()
+    gridSize = stageConfig.getGridSize()
+    rangeCells = scene.getTowerConfig().getTowerLevelConfig("steve", 1).range
+
+    # One tower on every buildable cell
+    half = gridSize / 2
+    cells = scene.getPlacementManager().getBuildableCells()
+    towers = [(x * gridSize + half, y * gridSize + half, rangeCells * gridSize) for x, y in cells]
+
+    start = time.perf_counter()
+    coverages = [path.getCoverage(x, y, radius) for x, y, radius in towers]
+    coverageUs = (time.perf_counter() - start) * 1e6 / len(towers)
+
+    print(f"{len(towers)} towers with range {rangeCells} cells, path of {path.getTotalLength():.0f} px")
+    print(f"coverage computed once per tower (place/upgrade): {coverageUs:.1f} us")
+    print("Range queries of every tower in ms per frame")
+    print(f"{'enemies':>8} {'radius':>8} {'coverage':>9} {'hits':>7}")
+    for enemyCount in (100, 1000, 5000):
+        radiusMs, coverageMs, hits = measure(path, gridSize, towers, coverages, enemyCount)
+        print(f"{enemyCount:>8} {radiusMs:>8.2f} {coverageMs:>9.2f} {hits:>7}")
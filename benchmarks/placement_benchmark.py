@@ -0,0 +1,55 @@
+"""
+Measure tower placement checks: testing a cell against the expanded walk path (as placement did
+before the occupancy grid) versus one occupancy grid lookup, and placement attempts on every cell
+of the stage, most of which are rejected.
+
+Run from the project root: python -m benchmarks.placement_benchmark
+Set SDL_VIDEODRIVER=dummy (and SDL_AUDIODRIVER=dummy) to run it without a display.
+"""
+import logging
+import time
+
+from pygame import Vector2
+
+from Game import Main
+
+REPEAT = 20
+
+
+def timeUs(function, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    return (time.perf_counter() - start) * 1e6 / (REPEAT * count)
+
+
+if __name__ == "__main__":
+    main = Main()
+    logging.getLogger().setLevel(logging.WARNING)
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    scene = main.getCurrentScene()
+    path = scene.getStageManager().getPath()
+    grid = scene.getPlacementManager().getOccupancyGrid()
+    cells = [(x, y) for y in range(grid.getRows()) for x in range(grid.getColumns())]
+
+    pathScanUs = timeUs(lambda: [Vector2(*cell) in path.getFullPathCoordinates() for cell in cells], len(cells))
+    gridUs = timeUs(lambda: [grid.isBuildable(*cell) for cell in cells], len(cells))
+
+    scene.getCurrencyManager().deposit("gold", 1000000)
+    scene.getInventoryManager().setSelectedTower("steve")
+
+    def placeEverywhere():
+        main.resetScene("game")
+        scene.getCurrencyManager().deposit("gold", 1000000)
+        scene.getInventoryManager().setSelectedTower("steve")
+        placed = [scene.getPlacementManager().place(cell) for cell in cells]
+        return placed
+
+    placed = sum(placeEverywhere())
+    placeUs = timeUs(placeEverywhere, len(cells))
+
+    print(f"Placement check cost in us per cell, {len(cells)} cells, averaged over {REPEAT} passes")
+    print(f"path scan:      {pathScanUs:.2f}")
+    print(f"occupancy grid: {gridUs:.3f}")
+    print(f"place() on every cell ({placed} placed), including resets: {placeUs:.2f}")
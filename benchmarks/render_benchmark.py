@@ -0,0 +1,53 @@
+"""
+Compare the cost of drawing and presenting a frame with the full and the dirty-rect renderer.
+
+Run from the project root on the target machine: python -m benchmarks.render_benchmark
+Set SDL_VIDEODRIVER=dummy (and SDL_AUDIODRIVER=dummy) to run it without a display.
+"""
+import logging
+import time
+
+from Game import Main
+
+FRAMES = 300
+TIME_STEP = 1 / 60
+TOWERS = [("steve", (2, 5)), ("snow_golem", (4, 5)), ("lava", (6, 5)), ("steve", (2, 3))]
+
+
+def measure(main: Main, renderMode: str, enemyCount: int) -> tuple[float, dict | None]:
+    main.getConfig().getGameSettings()["render_mode"] = renderMode
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    scene = main.getCurrentScene()
+    scene.getUIManager().waveChangeUI.canStart = True
+    scene.getUIManager().waveChangeUI.tick(5)  # Skip the wave title overlay
+    scene.getCurrencyManager().deposit("gold", 10000)
+    for name, position in TOWERS:
+        scene.getInventoryManager().setSelectedTower(name)
+        scene.getPlacementManager().place(position)
+
+    waveManager = scene.getWaveManager()
+    for _ in range(enemyCount):
+        waveManager.spawnEnemy("netherite")
+        scene.update(0.2)  # Spread the enemies along the path
+
+    elapsed = 0.0
+    for _ in range(FRAMES):
+        scene.update(TIME_STEP)
+        start = time.perf_counter()
+        scene.draw(1.0)
+        scene.present()
+        elapsed += time.perf_counter() - start
+    renderer = scene.getStageManager().getRenderer()
+    return elapsed * 1000 / FRAMES, renderer.getStats() if renderer else None
+
+
+if __name__ == "__main__":
+    main = Main()
+    logging.getLogger().setLevel(logging.WARNING)
+    print(f"Draw + present cost in ms per frame, averaged over {FRAMES} frames")
+    print(f"{'enemies':>8} {'full ms':>9} {'dirty ms':>9} {'pushed':>7}")
+    for count in (0, 10, 50, 200):
+        fullMs, _ = measure(main, "full", count)
+        dirtyMs, stats = measure(main, "dirty", count)
+        print(f"{count:>8} {fullMs:>9.2f} {dirtyMs:>9.2f} {stats['pushed_ratio']:>7.1%}")
@@ -0,0 +1,41 @@
+"""
+Measure restarting a run: building a new GameScene versus resetting the existing one,
+each followed by the first frame of the new run.
+
+Run from the project root: python -m benchmarks.scene_reset_benchmark
+Set SDL_VIDEODRIVER=dummy (and SDL_AUDIODRIVER=dummy) to run it without a display.
+"""
+import logging
+import time
+
+from Game import Main
+from src.Scenes.GameScene import GameScene
+
+REPEAT = 20
+TARGET_MS = 5.0  # Restart budget, well under one frame at 60 FPS
+
+
+def timeMs(function) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    return (time.perf_counter() - start) * 1000 / REPEAT
+
+
+if __name__ == "__main__":
+    main = Main()
+    logging.getLogger().setLevel(logging.WARNING)
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    main.getCurrentScene().draw(1.0)
+
+    rebuildMs = timeMs(lambda: GameScene(main).draw(1.0))
+
+    def restart():
+        main.resetScene("game")
+        main.getCurrentScene().draw(1.0)
+
+    resetMs = timeMs(restart)
+    print(f"Restart cost in ms, averaged over {REPEAT} restarts")
+    print(f"new GameScene: {rebuildMs:.2f}")
+    print(f"reset:         {resetMs:.2f} (target {TARGET_MS:.1f}, {'met' if resetMs <= TARGET_MS else 'missed'})")
@@ -0,0 +1,65 @@
+"""
+Compare tower range queries done by scanning every enemy against SpatialHashGrid queries.
+
+Run from the project root: python -m benchmarks.spatial_hash_benchmark
+"""
+import random
+import time
+
+import pygame
+
+from src.Utils.SpatialHash import SpatialHashGrid
+
+WIDTH, HEIGHT = 959, 704
+GRID_SIZE = 64
+TOWERS = 50
+RANGE = 2.5 * GRID_SIZE
+FRAMES = 20
+
+
+def bruteForce(towers, enemies):
+    hits = 0
+    for tower in towers:
+        for enemy in enemies:
+            if pygame.math.Vector2(enemy).distance_to(tower) <= RANGE:
+                hits += 1
+    return hits
+
+
+def gridQuery(towers, index):
+    hits = 0
+    for tower in towers:
+        hits += len(index.queryRadius(tower.x, tower.y, RANGE))
+    return hits
+
+
+def measure(enemyCount: int):
+    rng = random.Random(enemyCount)
+    enemies = [(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)) for _ in range(enemyCount)]
+    towers = [pygame.math.Vector2(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)) for _ in range(TOWERS)]
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        bruteForce(towers, enemies)
+    bruteMs = (time.perf_counter() - start) * 1000 / FRAMES
+
+    index = SpatialHashGrid(GRID_SIZE)
+    for i, position in enumerate(enemies):
+        index.insert(i, *position)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        # Every enemy moves a little each frame, as it would in game
+        for i, (x, y) in enumerate(enemies):
+            index.move(i, x + 1, y)
+        gridQuery(towers, index)
+    gridMs = (time.perf_counter() - start) * 1000 / FRAMES
+
+    return bruteMs, gridMs
+
+
+if __name__ == "__main__":
+    print(f"{TOWERS} towers, range {RANGE:.0f}px, ms per frame averaged over {FRAMES} frames")
+    print(f"{'enemies':>8} {'brute ms':>10} {'grid ms':>10} {'speedup':>8}")
+    for count in (100, 500, 1000, 5000, 10000):
+        bruteMs, gridMs = measure(count)
+        print(f"{count:>8} {bruteMs:>10.2f} {gridMs:>10.2f} {bruteMs / gridMs:>7.1f}x")
@@ -0,0 +1,49 @@
+"""
+Measure the cost of picking the spawns of a large wave: the old spawn list, expanded from the
+wave's counts with random.choice and list.remove per spawn, versus the SpawnTimeline, which
+shuffles as it goes and hands out every spawn due in a step at once.
+
+Run from the project root: python -m benchmarks.spawn_timeline_benchmark
+"""
+import random
+import time
+
+from src.GameMechanics.Configs.ConfigRecords import SpawnGroup, WaveDefinition
+from src.GameMechanics.Engine.SpawnTimeline import SpawnTimeline
+
+SIZES = (1000, 10000, 50000)
+TYPES = ("copper", "coal", "iron", "gold", "diamond")
+DT = 1 / 60
+
+
+def drainList(wave: WaveDefinition) -> float:
+    enemies = []
+    for group in wave.groups:
+        for enemyType, count in group.enemies:
+            enemies.extend([enemyType] * count)
+    start = time.perf_counter()
+    while enemies:
+        selected = random.choice(enemies)
+        enemies.remove(selected)
+    return (time.perf_counter() - start) * 1000
+
+
+def drainTimeline(wave: WaveDefinition) -> float:
+    start = time.perf_counter()
+    timeline = SpawnTimeline(wave)
+    while not timeline.isFinished():
+        timeline.advance(DT)
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    random.seed(1)
+    print("ms to pick every spawn of a wave (list / timeline)")
+    for size in SIZES:
+        counts = tuple((enemyType, size // len(TYPES)) for enemyType in TYPES)
+        # Two groups at different rates, both spawning several enemies per step
+        wave = WaveDefinition(number=1, groups=(
+            SpawnGroup(spawnRate=0.002, delay=0.0, enemies=counts[:3]),
+            SpawnGroup(spawnRate=0.005, delay=1.0, enemies=counts[3:])
+        ))
+        print(f"{size:>6} enemies: {drainList(wave):9.2f} / {drainTimeline(wave):7.2f}")
@@ -0,0 +1,41 @@
+"""
+Measure startup: the time to the first presented menu frame with lazily built scenes, how long
+the background asset preloading takes, and what building the game scene costs with and without
+preloaded assets. Building it with a cold cache is what eager construction added to startup.
+
+Run from the project root: python -m benchmarks.startup_benchmark
+Set SDL_VIDEODRIVER=dummy (and SDL_AUDIODRIVER=dummy) to run it without a display.
+"""
+import logging
+import time
+
+from Game import Main
+from src.Scenes.GameScene import GameScene
+
+
+def timeMs(function) -> float:
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    main = Main()
+    main.getCurrentScene().draw(1.0)
+    main.getCurrentScene().present()
+    firstFrameMs = (time.perf_counter() - start) * 1000
+    logging.getLogger().setLevel(logging.WARNING)
+
+    preloader = main.getAssetPreloader()
+    preloader.wait()
+    warmBuildMs = timeMs(lambda: main.setCurrentScene("game"))
+
+    main.getAssetCache().clear()
+    coldBuildMs = timeMs(lambda: GameScene(main))
+
+    print("Startup cost in ms")
+    print(f"first menu frame:               {firstFrameMs:.1f}")
+    print(f"background preload:             {preloader.getElapsedMs():.1f}")
+    print(f"game scene build, preloaded:    {warmBuildMs:.1f}")
+    print(f"game scene build, cold cache:   {coldBuildMs:.1f} (added to the first frame when built eagerly)")
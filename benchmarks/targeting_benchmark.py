@@ -0,0 +1,172 @@
+"""
+Measure target selection for every tower on a stage full of towers.
+
+Sprite engine: picking from the list of enemies in range with max()/min() on distance or health
+(as Tower._selectTarget did) versus ProgressIndex.selectTarget on the progress-ordered enemies.
+Every frame moves the enemies at slightly different speeds and updates the ProgressIndex first,
+so both columns include patching the order and the health trees after overtakes. Speeds are spread
+between 40 and 60 px/s, a worst case with hundreds of overtakes per frame at 5000 enemies.
+Numpy engine: a towers x enemies mask with a masked argmax/argmin (as TargetingKernel did) versus
+TargetingKernel.resolve, which works on ranges of the store's progress order. The kernel column
+also includes applying each tower's (zero) damage, which the mask column leaves out.
+
+Run from the project root: python -m benchmarks.targeting_benchmark
+Set SDL_VIDEODRIVER=dummy (and SDL_AUDIODRIVER=dummy) to run it without a display.
+"""
+import logging
+import random
+import time
+
+import numpy as np
+
+from Game import Main
+from src.GameMechanics.Engine.EnemyStore import EnemyStore
+from src.GameMechanics.Engine.ProgressIndex import ProgressIndex
+from src.GameMechanics.Engine.TargetingKernel import TargetingKernel
+
+PRIORITIES = ("first_enemy", "last_enemy", "lowest_health", "highest_health")
+FRAMES = 10
+DT = 1 / 60
+
+
+class PathPoint:
+    """
+    Stand-in for an enemy moving along the path, with what ProgressIndex reads.
+    """
+    def __init__(self, distance: float, speed: float, health: float):
+        self.distance = distance
+        self.speed = speed
+        self.health = health
+
+    def getDistance(self) -> float:
+        return self.distance
+
+    def getHealth(self) -> float:
+        return self.health
+
+    def alive(self) -> bool:
+        return True
+
+    def isAlive(self) -> bool:
+        return True
+
+
+class BenchTower:
+    """
+    Stand-in for a placed tower that hits for 0 damage, with what TargetingKernel reads.
+    """
+    def __init__(self, coverage, priority: str):
+        self.coverage = coverage
+        self.priority = priority
+
+    def getCoverage(self):
+        return self.coverage
+
+    def getAttackPriority(self) -> str:
+        return self.priority
+
+    def getAttackType(self) -> str:
+        return "single"
+
+    def getTowerName(self) -> str:
+        return "bench"
+
+    def isStickyTarget(self) -> bool:
+        return False
+
+    def getDamage(self) -> float:
+        return 0.0
+
+    def getDebuffs(self) -> dict:
+        return {}
+
+
+def selectByScan(enemies: list, priority: str):
+    if not enemies:
+        return None
+    if priority == "first_enemy":
+        return max(enemies, key=lambda e: e.getDistance())
+    elif priority == "last_enemy":
+        return min(enemies, key=lambda e: e.getDistance())
+    elif priority == "lowest_health":
+        return min(enemies, key=lambda e: e.getHealth())
+    return max(enemies, key=lambda e: e.getHealth())
+
+
+def maskedArgmax(store: EnemyStore, towers: list[BenchTower]):
+    n = store.getSize()
+    distance = store.distance[:n]
+    inRange = np.zeros((len(towers), n), dtype=bool)
+    for row, tower in enumerate(towers):
+        for start, end in tower.getCoverage().getIntervals():
+            inRange[row] |= (distance >= start) & (distance <= end)
+    inRange &= store.active[:n]
+    for priority in PRIORITIES:
+        rows = np.asarray([tower.getAttackPriority() == priority for tower in towers])
+        key = distance if priority in ("first_enemy", "last_enemy") else store.health[:n]
+        if priority in ("first_enemy", "highest_health"):
+            np.where(inRange[rows], key, -np.inf).argmax(axis=1)
+        else:
+            np.where(inRange[rows], key, np.inf).argmin(axis=1)
+
+
+def stepIndex(progressIndex: ProgressIndex, points: list[PathPoint]):
+    for point in points:
+        point.distance += point.speed * DT
+    progressIndex.update()
+
+
+def timeMs(function) -> float:
+    function()  # Warm up, the first call pays for lazy imports
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        function()
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+if __name__ == "__main__":
+    main = Main()
+    logging.getLogger().setLevel(logging.WARNING)
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    scene = main.getCurrentScene()
+    stageConfig = scene.getStageManager().getStageConfig()
+    path = stageConfig.getCompiledPath()
+    gridSize = stageConfig.getGridSize()
+    rangeCells = scene.getTowerConfig().getTowerLevelConfig("steve", 1).range
+    half = gridSize / 2
+    towers = [
+        BenchTower(path.getCoverage(x * gridSize + half, y * gridSize + half, rangeCells * gridSize), PRIORITIES[i % 4])
+        for i, (x, y) in enumerate(scene.getPlacementManager().getBuildableCells())
+    ]
+
+    print(f"Target selection of {len(towers)} towers in ms per frame, priorities mixed evenly")
+    print(f"{'enemies':>8} {'scan':>8} {'ordered':>8} {'mask':>8} {'kernel':>8}")
+    for enemyCount in (100, 1000, 5000):
+        rng = random.Random(enemyCount)
+        points = [
+            PathPoint(rng.uniform(0, path.getTotalLength()), rng.uniform(40.0, 60.0), rng.choice((50.0, 100.0, 150.0)))
+            for _ in range(enemyCount)
+        ]
+        progressIndex = ProgressIndex(path.getTotalLength())
+        store = EnemyStore(path)
+        for point in points:
+            progressIndex.add(point)
+            slot = store.add(point, 0.0, point.health)
+            store.distance[slot] = point.distance
+        progressIndex.update()
+        kernel = TargetingKernel(scene, store)
+
+        def scanFrame():
+            stepIndex(progressIndex, points)
+            return [selectByScan(progressIndex.queryCoverage(t.coverage), t.priority) for t in towers]
+
+        def orderedFrame():
+            stepIndex(progressIndex, points)
+            return [progressIndex.selectTarget(t.coverage, t.priority) for t in towers]
+
+        scanMs = timeMs(scanFrame)
+        orderedMs = timeMs(orderedFrame)
+        maskMs = timeMs(lambda: maskedArgmax(store, towers))
+        kernelMs = timeMs(lambda: kernel.resolve(towers))
+        print(f"{enemyCount:>8} {scanMs:>8.2f} {orderedMs:>8.2f} {maskMs:>8.2f} {kernelMs:>8.2f}")
@@ -0,0 +1,54 @@
+"""
+Measure the per-step tower cost with the stage filled with towers and a few enemies on the path:
+visiting every tower each step (as PlacementManager.tick did before the TowerScheduler, every tower
+counting down its cooldown and looking for targets when ready) versus the scheduler, where towers
+without enemies nearby sleep until one arrives.
+
+Run from the project root: python -m benchmarks.tower_scheduler_benchmark
+Set SDL_VIDEODRIVER=dummy (and SDL_AUDIODRIVER=dummy) to run it without a display.
+"""
+import logging
+import time
+
+from Game import Main
+
+STEPS = 600
+DT = 1 / 60
+
+
+def timeStepUs(function) -> float:
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        function()
+    return (time.perf_counter() - start) * 1e6 / STEPS
+
+
+if __name__ == "__main__":
+    main = Main()
+    logging.getLogger().setLevel(logging.WARNING)
+    main.resetScene("game")
+    main.setCurrentScene("game")
+    scene = main.getCurrentScene()
+    placementManager = scene.getPlacementManager()
+    scene.getCurrencyManager().deposit("gold", 10000000)
+    scene.getInventoryManager().setSelectedTower("steve")
+    for cell in placementManager.getBuildableCells():
+        placementManager.place(cell)
+    towers = list(placementManager.placedTower.values())
+
+    waveManager = scene.getWaveManager()
+    for _ in range(5):
+        waveManager.spawnEnemy("netherite")
+
+    def tickEveryTower():
+        # Only the search for targets, so the enemies are not killed during the measurement
+        for tower in towers:
+            tower._getEnemiesInRange()
+
+    everyTowerUs = timeStepUs(tickEveryTower)
+    schedulerUs = timeStepUs(lambda: placementManager.tick(DT))
+    stats = placementManager.getScheduler().getStats()
+
+    print(f"Tower cost in us per {DT * 1000:.1f} ms step, {len(towers)} towers, {STEPS} steps")
+    print(f"every tower each step: {everyTowerUs:.1f}")
+    print(f"scheduler:             {schedulerUs:.1f}  ({stats['sleeping']} asleep, {stats['queued']} queued)")
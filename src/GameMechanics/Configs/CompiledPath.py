@@ -0,0 +1,117 @@
+import bisect
+import math
+
+from src.GameMechanics.Engine.PathCoverage import PathCoverage
+
+
+class CompiledPath:
+    def __init__(self, walkPath: tuple[tuple[int, int], ...], gridSize: int):
+        """
+        Walk path turned once into pixel waypoints with arc-length data,
+        so positions and progress can be looked up from a travelled distance.
+
+        :param walkPath: Grid coordinates of the stage walk_path, as compiled by ConfigCompiler
+        :param gridSize: Size of a grid cell in pixels
+        """
+        self.__nodes = list(walkPath)
+
+        half = gridSize / 2
+        self.__waypoints = [(x * gridSize + half, y * gridSize + half) for x, y in self.__nodes]
+        self.__segmentLengths = []
+        self.__cumulative = [0.0]
+        for (x1, y1), (x2, y2) in zip(self.__waypoints, self.__waypoints[1:]):
+            length = math.hypot(x2 - x1, y2 - y1)
+            self.__segmentLengths.append(length)
+            self.__cumulative.append(self.__cumulative[-1] + length)
+        self.__totalLength = self.__cumulative[-1]
+
+    def positionAt(self, distance: float, segment: int = 0) -> tuple[float, float, int]:
+        """
+        Return the (x, y) pixel position at the given distance along the path and the segment it lies on.
+
+        :param distance: Distance travelled from the first waypoint in pixels
+        :param segment: Segment the caller was on last time; since enemies only move forward
+                        the search advances from there, which is O(1) per step
+        """
+        waypoints = self.__waypoints
+        if distance <= 0 or len(waypoints) < 2:
+            x, y = waypoints[0] if waypoints else (0.0, 0.0)
+            return x, y, 0
+        if distance >= self.__totalLength:
+            x, y = waypoints[-1]
+            return x, y, len(self.__segmentLengths) - 1
+
+        cumulative = self.__cumulative
+        if cumulative[segment] > distance:
+            segment = bisect.bisect_right(cumulative, distance) - 1
+        while cumulative[segment + 1] < distance:
+            segment += 1
+
+        length = self.__segmentLengths[segment]
+        t = (distance - cumulative[segment]) / length if length else 0.0
+        (x1, y1), (x2, y2) = waypoints[segment], waypoints[segment + 1]
+        return x1 + (x2 - x1) * t, y1 + (y2 - y1) * t, segment
+
+    def getProgress(self, distance: float) -> float:
+        """
+        Return the fraction (0..1) of the path covered at the given distance.
+        """
+        if self.__totalLength <= 0:
+            return 1.0
+        return min(distance / self.__totalLength, 1.0)
+
+    def getCoverage(self, x: float, y: float, radius: float) -> PathCoverage:
+        """
+        Return the stretches of the path within radius pixels of (x, y), e.g. a tower's range.
+        Each segment is intersected with the circle in closed form.
+        """
+        waypoints = self.__waypoints
+        if len(waypoints) < 2:
+            inside = bool(waypoints) and math.hypot(waypoints[0][0] - x, waypoints[0][1] - y) <= radius
+            return PathCoverage(((0.0, math.inf),) if inside else (), self.__totalLength)
+
+        intervals = []
+        for segment, length in enumerate(self.__segmentLengths):
+            if length <= 0:
+                continue
+            (x1, y1), (x2, y2) = waypoints[segment], waypoints[segment + 1]
+            dx, dy = x2 - x1, y2 - y1
+            fx, fy = x1 - x, y1 - y
+            # |start + t * delta - center|^2 <= radius^2, solved for t in [0, 1]
+            a = length * length
+            b = 2 * (fx * dx + fy * dy)
+            c = fx * fx + fy * fy - radius * radius
+            discriminant = b * b - 4 * a * c
+            if discriminant < 0:
+                continue
+            root = math.sqrt(discriminant)
+            t0 = max((-b - root) / (2 * a), 0.0)
+            t1 = min((-b + root) / (2 * a), 1.0)
+            if t0 > t1:
+                continue
+            start = self.__cumulative[segment] + t0 * length
+            end = self.__cumulative[segment] + t1 * length
+            if intervals and start <= intervals[-1][1]:
+                # Continues across a waypoint
+                intervals[-1] = (intervals[-1][0], max(end, intervals[-1][1]))
+            else:
+                intervals.append((start, end))
+
+        if intervals and intervals[-1][1] >= self.__totalLength:
+            intervals[-1] = (intervals[-1][0], math.inf)
+        return PathCoverage(tuple(intervals), self.__totalLength)
+
+    def getGridNodes(self) -> list[tuple[int, int]]:
+        return self.__nodes
+
+    def getWaypoints(self) -> list[tuple[float, float]]:
+        return self.__waypoints
+
+    def getSegmentLengths(self) -> list[float]:
+        return self.__segmentLengths
+
+    def getCumulativeDistances(self) -> list[float]:
+        return self.__cumulative
+
+    def getTotalLength(self) -> float:
+        return self.__totalLength
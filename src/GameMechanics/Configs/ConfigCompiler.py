@@ -0,0 +1,370 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from types import MappingProxyType
+
+from src.GameMechanics.Configs.ConfigRecords import (
+    CompiledConfig, EnemyDefinition, SpawnGroup, StageDefinition, TowerDefinition, TowerLevel, WaveDefinition
+)
+
+
+class ConfigCompiler:
+    CACHE_VERSION = 4  # Bump when the records or the validation rules change
+    CACHE_FILE = os.path.join("cache", "config.pickle")
+    DEBUFF_KEYS = ('slow_percent', 'slow_duration', 'slow_type',
+                   'bleeding_damage', 'bleeding_duration', 'bleeding_type',
+                   'burning_damage', 'burning_duration', 'add_gold_amount')
+    ATTACK_PRIORITIES = ("first_enemy", "last_enemy", "lowest_health", "highest_health", "random")
+    INVENTORY_SLOTS = 9
+
+    def __init__(self, projectRoot: str):
+        """
+        Validates the tower, enemy, stage and inventory configs once and compiles them into
+        immutable records (see ConfigRecords). The result is saved on disk together with the
+        mtime, size and hash of every source file, and later loads reuse it without parsing
+        any JSON as long as the files are unchanged.
+
+        Invalid entries are logged and left out, as the game would have skipped them when used.
+        So are invalid stages, which only raise once they are loaded (see StageConfig); other
+        files that are not valid JSON raise.
+
+        :param projectRoot: Directory holding the config folder
+        """
+        self.__projectRoot = projectRoot
+        self.__stats = {"source": None, "ms": 0.0}
+
+    def load(self) -> CompiledConfig:
+        """
+        Return the compiled config, from the on-disk cache when every source file is unchanged.
+        """
+        start = time.perf_counter()
+        sources = self.__listSources()
+        compiled = self.__loadCache(sources)
+        if compiled is not None:
+            self.__stats = {"source": "cache", "ms": (time.perf_counter() - start) * 1000}
+            logging.info(f"Loaded compiled config from cache in {self.__stats['ms']:.1f} ms.")
+            return self.__freeze(compiled)
+
+        compiled = self.compile()
+        self.__saveCache(sources, compiled)
+        self.__stats = {"source": "compiled", "ms": (time.perf_counter() - start) * 1000}
+        logging.info(f"Compiled config in {self.__stats['ms']:.1f} ms.")
+        return compiled
+
+    def compile(self) -> CompiledConfig:
+        """
+        Parse and validate every config file, without using or updating the cache.
+        """
+        enemies = {}
+        for name, data in self.__readJson(os.path.join("config", "enemies.json")).items():
+            enemy = self.__compileEnemy(name, data)
+            if enemy is not None:
+                enemies[name] = enemy
+
+        towers = {}
+        for file in self.__listJson(os.path.join("config", "towers")):
+            name = os.path.splitext(os.path.basename(file))[0]
+            tower = self.__compileTower(name, self.__readJson(file))
+            if tower is not None:
+                towers[name] = tower
+
+        stages = {}
+        invalidStages = {}
+        for file in self.__listJson(os.path.join("config", "stage")):
+            name = os.path.splitext(os.path.basename(file))[0]
+            # A broken stage must not keep the game from starting, only from playing that stage
+            try:
+                stages[name] = self.__compileStage(name, self.__readJson(file), enemies)
+            except (ValueError, TypeError, AttributeError) as e:
+                logging.error(f"Invalid stage '{name}': {e}. Skipping.")
+                invalidStages[name] = str(e)
+
+        mainConfig = self.__readJson(os.path.join("config", "config.json"))
+        inventory = self.__compileInventory(mainConfig.get("inventory") or {}, towers)
+        return self.__freeze(CompiledConfig(towers=towers, enemies=enemies, stages=stages,
+                                            inventory=inventory, invalidStages=invalidStages))
+
+    # noinspection PyMethodMayBeStatic
+    def __freeze(self, compiled: CompiledConfig) -> CompiledConfig:
+        return compiled._replace(towers=MappingProxyType(dict(compiled.towers)),
+                                 enemies=MappingProxyType(dict(compiled.enemies)),
+                                 stages=MappingProxyType(dict(compiled.stages)),
+                                 invalidStages=MappingProxyType(dict(compiled.invalidStages)))
+
+    def getStats(self) -> dict:
+        """
+        Return whether the last load() came from the cache or was compiled, and how long it took in ms.
+        """
+        return dict(self.__stats)
+
+    def getCachePath(self) -> str:
+        return os.path.join(self.__projectRoot, self.CACHE_FILE)
+
+    # Cache
+
+    def __listSources(self) -> list[str]:
+        return ([os.path.join("config", "config.json"), os.path.join("config", "enemies.json")]
+                + self.__listJson(os.path.join("config", "towers"))
+                + self.__listJson(os.path.join("config", "stage")))
+
+    def __listJson(self, directory: str) -> list[str]:
+        fullPath = os.path.join(self.__projectRoot, directory)
+        if not os.path.isdir(fullPath):
+            logging.error(f"Configuration directory not found: {fullPath}")
+            raise FileNotFoundError(f"Configuration directory not found: {fullPath}")
+        return [os.path.join(directory, file) for file in sorted(os.listdir(fullPath)) if file.endswith(".json")]
+
+    def __fingerprint(self, file: str) -> tuple[int, int]:
+        stat = os.stat(os.path.join(self.__projectRoot, file))
+        return stat.st_mtime_ns, stat.st_size
+
+    def __hash(self, file: str) -> str:
+        with open(os.path.join(self.__projectRoot, file), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def __loadCache(self, sources: list[str]) -> CompiledConfig | None:
+        cachePath = self.getCachePath()
+        if not os.path.exists(cachePath):
+            return None
+        try:
+            with open(cachePath, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("version") != self.CACHE_VERSION:
+                return None
+            manifest = cached["manifest"]
+            if sorted(manifest) != sorted(sources):
+                return None
+            touched = False
+            for file in sources:
+                mtime, size, digest = manifest[file]
+                if self.__fingerprint(file) == (mtime, size):
+                    continue
+                if self.__hash(file) != digest:
+                    return None
+                # A touched but unchanged file (same content hash) keeps the cache valid
+                touched = True
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable config cache '{cachePath}': {e}")
+            return None
+        if touched:
+            # Record the new mtimes and sizes, so later launches do not hash the touched files again
+            self.__saveCache(sources, cached["config"])
+        return cached["config"]
+
+    def __saveCache(self, sources: list[str], compiled: CompiledConfig):
+        cachePath = self.getCachePath()
+        manifest = {file: (*self.__fingerprint(file), self.__hash(file)) for file in sources}
+        try:
+            os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+            temporaryPath = f"{cachePath}.tmp"
+            with open(temporaryPath, "wb") as f:
+                # Read-only views cannot be pickled, so the cache holds plain dicts
+                plain = compiled._replace(towers=dict(compiled.towers), enemies=dict(compiled.enemies),
+                                          stages=dict(compiled.stages), invalidStages=dict(compiled.invalidStages))
+                pickle.dump({"version": self.CACHE_VERSION, "manifest": manifest, "config": plain}, f)
+            os.replace(temporaryPath, cachePath)
+        except OSError as e:
+            logging.warning(f"Could not write config cache '{cachePath}': {e}")
+
+    # Validation
+
+    def __readJson(self, file: str) -> dict:
+        fullPath = os.path.normpath(os.path.join(self.__projectRoot, file))
+        if not os.path.exists(fullPath):
+            logging.error(f"Configuration file not found: {fullPath}")
+            raise FileNotFoundError(f"Configuration file not found: {fullPath}")
+        try:
+            with open(fullPath, "r") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            logging.error(f"Error parsing configuration file '{fullPath}': {e}")
+            raise
+        if not isinstance(data, dict):
+            logging.error(f"Configuration file '{fullPath}' must contain a JSON object.")
+            raise ValueError(f"Configuration file '{fullPath}' must contain a JSON object.")
+        return data
+
+    # noinspection PyMethodMayBeStatic
+    def __number(self, data: dict, key: str, default, context: str):
+        value = data.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            logging.warning(f"Invalid {key} '{value}' in {context}. Using default {default}.")
+            return default
+        return value
+
+    def __compileEnemy(self, name: str, data) -> EnemyDefinition | None:
+        context = f"enemy '{name}'"
+        if not isinstance(data, dict):
+            logging.error(f"Configuration of {context} must be an object. Skipping.")
+            return None
+        image = data.get("image")
+        if not isinstance(image, str) or not image:
+            logging.error(f"No image specified for {context}. Skipping.")
+            return None
+        return EnemyDefinition(
+            name=name,
+            health=self.__number(data, "health", 100, context),
+            damage=self.__number(data, "damage", 10, context),
+            speed=self.__number(data, "speed", 100, context),
+            reward=self.__number(data, "reward", 10, context),
+            image=image
+        )
+
+    def __compileTower(self, name: str, data: dict) -> TowerDefinition | None:
+        context = f"tower '{name}'"
+        maxLevel = data.get("max_level", 1)
+        if isinstance(maxLevel, bool) or not isinstance(maxLevel, int) or maxLevel < 1:
+            logging.warning(f"Invalid max_level '{maxLevel}' in {context}. Using 1.")
+            maxLevel = 1
+        attackPriority = data.get("attack_priority", "first_enemy")
+        if attackPriority not in self.ATTACK_PRIORITIES:
+            logging.warning(f"Unknown attack_priority '{attackPriority}' in {context}. Targeting the first enemy.")
+        stickyTarget = data.get("sticky_target", False)
+        if not isinstance(stickyTarget, bool):
+            logging.warning(f"Invalid sticky_target '{stickyTarget}' in {context}. Using false.")
+            stickyTarget = False
+
+        towerImage = data.get("image")
+        levels = []
+        for level in range(1, maxLevel + 1):
+            levelData = data.get(str(level))
+            if not isinstance(levelData, dict):
+                break
+            levelContext = f"{context} level {level}"
+            image = levelData.get("image") or towerImage
+            if not image:
+                logging.error(f"No image specified for {levelContext}.")
+                break
+            levels.append(TowerLevel(
+                level=level,
+                damage=self.__number(levelData, "damage", 0, levelContext),
+                speed=self.__number(levelData, "speed", 0, levelContext),
+                range=self.__number(levelData, "range", 0, levelContext),
+                cost=self.__number(levelData, "cost", 0, levelContext),
+                image=image,
+                blastRadius=self.__number(levelData, "blast_radius", 0, levelContext),
+                blastDamage=self.__number(levelData, "blast_damage", 0, levelContext),
+                debuffs=tuple((key, levelData[key]) for key in self.DEBUFF_KEYS if key in levelData)
+            ))
+
+        if not levels:
+            logging.error(f"No usable level 1 config for {context}. Skipping.")
+            return None
+        if len(levels) < maxLevel:
+            logging.warning(f"{context.capitalize()} declares max_level {maxLevel} but only levels up to {len(levels)} are usable.")
+        return TowerDefinition(
+            name=name,
+            maxLevel=len(levels),
+            image=towerImage or levels[0].image,
+            attackType=data.get("attack_type", "single_target"),
+            attackPriority=attackPriority,
+            stickyTarget=stickyTarget,
+            levels=tuple(levels)
+        )
+
+    def __compileStage(self, name: str, data: dict, enemies: dict[str, EnemyDefinition]) -> StageDefinition:
+        context = f"stage '{name}'"
+        gridSize = data.get("grid_size", 64)
+        if isinstance(gridSize, bool) or not isinstance(gridSize, int) or gridSize <= 0:
+            logging.warning(f"Invalid grid_size '{gridSize}' in {context}. Setting to default value 64.")
+            gridSize = 64
+
+        try:
+            walkPath = tuple(tuple(map(int, coord.split(","))) for coord in data.get("walk_path", []))
+        except (AttributeError, ValueError) as e:
+            logging.error(f"Error parsing walk_path coordinates of {context}: {e}")
+            raise ValueError(f"Error parsing walk_path coordinates of {context}: {e}")
+        if any(len(node) != 2 for node in walkPath):
+            logging.error(f"walk_path coordinates of {context} must be 'x,y' pairs.")
+            raise ValueError(f"walk_path coordinates of {context} must be 'x,y' pairs.")
+
+        backgroundColor = (data.get("game_settings") or {}).get("background_color", [0, 0, 0])
+        waves = self.__compileWaves(data.get("waves") or {}, enemies, context)
+        return StageDefinition(
+            name=name,
+            background=data.get("background", ""),
+            path=data.get("path", ""),
+            gridSize=gridSize,
+            backgroundColor=tuple(backgroundColor),
+            walkPath=walkPath,
+            waves=waves
+        )
+
+    def __compileWaves(self, data: dict, enemies: dict[str, EnemyDefinition], context: str) -> tuple[WaveDefinition, ...]:
+        # Waves are played from "1" upwards and the run is won at the first missing number
+        waves = []
+        while str(len(waves) + 1) in data:
+            number = len(waves) + 1
+            waveData = data[str(number)]
+            waveContext = f"wave {number} of {context}"
+            spawnRate = self.__compileSpawnRate(waveData, 2.0, waveContext)
+
+            # The wave's own "enemies" are its first spawn group; "groups" adds more with their own rate and delay
+            groups = []
+            if waveData.get("enemies"):
+                groups.append(SpawnGroup(spawnRate=spawnRate, delay=0.0,
+                                         enemies=self.__compileWaveEnemies(waveData["enemies"], enemies, waveContext)))
+            groupData = waveData.get("groups") or []
+            if not isinstance(groupData, list):
+                logging.warning(f"groups of {waveContext} must be a list. Ignoring them.")
+                groupData = []
+            for index, group in enumerate(groupData, start=1):
+                groupContext = f"group {index} of {waveContext}"
+                if not isinstance(group, dict):
+                    logging.warning(f"Invalid {groupContext}. Skipping.")
+                    continue
+                delay = group.get("delay", 0.0)
+                if isinstance(delay, bool) or not isinstance(delay, (int, float)) or delay < 0:
+                    logging.warning(f"Invalid delay '{delay}' in {groupContext}. Using 0.")
+                    delay = 0.0
+                groups.append(SpawnGroup(spawnRate=self.__compileSpawnRate(group, spawnRate, groupContext), delay=float(delay),
+                                         enemies=self.__compileWaveEnemies(group.get("enemies") or {}, enemies, groupContext)))
+
+            groups = [group for group in groups if group.enemies]
+            if not groups:
+                logging.warning(f"No enemies defined for {waveContext}.")
+            waves.append(WaveDefinition(number=number, groups=tuple(groups)))
+
+        ignored = len(data) - len(waves)
+        if ignored:
+            logging.warning(f"Ignoring {ignored} wave(s) of {context} that do not follow on from wave {len(waves)}.")
+        return tuple(waves)
+
+    def __compileSpawnRate(self, data: dict, default: float, context: str) -> float:
+        spawnRate = data.get("spawn_rate", default)
+        if isinstance(spawnRate, bool) or not isinstance(spawnRate, (int, float)) or spawnRate <= 0:
+            logging.warning(f"Invalid spawn_rate '{spawnRate}' in {context}. Using default {default}.")
+            spawnRate = default
+        return spawnRate
+
+    def __compileWaveEnemies(self, data: dict, enemies: dict[str, EnemyDefinition], context: str) -> tuple[tuple[str, int], ...]:
+        waveEnemies = []
+        for enemyType, count in data.items():
+            if enemyType not in enemies:
+                logging.error(f"Enemy type '{enemyType}' in {context} not defined in enemies configuration.")
+                continue
+            if isinstance(count, bool) or not isinstance(count, int) or count <= 0:
+                logging.warning(f"Invalid count '{count}' for enemy '{enemyType}' in {context}. Skipping.")
+                continue
+            waveEnemies.append((enemyType, count))
+        return tuple(waveEnemies)
+
+    def __compileInventory(self, data: dict, towers: dict[str, TowerDefinition]) -> tuple[tuple[int, str], ...]:
+        slots = []
+        for slot, towerName in (data.get("slots") or {}).items():
+            try:
+                index = int(slot)
+            except ValueError:
+                logging.error(f"Invalid inventory slot '{slot}'. Skipping.")
+                continue
+            if not 0 <= index < self.INVENTORY_SLOTS:
+                logging.error(f"Inventory slot {index} is outside the hotbar. Skipping.")
+                continue
+            if towerName not in towers:
+                logging.error(f"InventoryManager tower not found: {towerName}")
+                continue
+            slots.append((index, towerName))
+        return tuple(slots)
@@ -0,0 +1,79 @@
+from typing import NamedTuple, Any, Mapping
+
+
+class TowerLevel(NamedTuple):
+    """
+    Stats of one tower level. image is the level's image, or the tower's when the level has none.
+    """
+    level: int
+    damage: float
+    speed: float
+    range: float
+    cost: int
+    image: str
+    blastRadius: float
+    blastDamage: float
+    debuffs: tuple[tuple[str, Any], ...]  # (key, value) pairs, e.g. ("slow_percent", 0.25)
+
+
+class TowerDefinition(NamedTuple):
+    name: str
+    maxLevel: int
+    image: str
+    attackType: str
+    attackPriority: str
+    stickyTarget: bool              # Keep attacking the same enemy until it dies or leaves range
+    levels: tuple[TowerLevel, ...]  # levels[0] is level 1
+
+    def getLevel(self, level: int) -> TowerLevel | None:
+        if 1 <= level <= len(self.levels):
+            return self.levels[level - 1]
+        return None
+
+
+class EnemyDefinition(NamedTuple):
+    name: str
+    health: int
+    damage: int
+    speed: float
+    reward: int
+    image: str
+
+
+class SpawnGroup(NamedTuple):
+    """
+    Enemies of a wave that spawn in shuffled order, one every spawnRate seconds after delay seconds.
+    """
+    spawnRate: float
+    delay: float
+    enemies: tuple[tuple[str, int], ...]  # (enemy type, count) pairs in config order
+
+
+class WaveDefinition(NamedTuple):
+    number: int
+    groups: tuple[SpawnGroup, ...]  # Spawn in parallel, each at its own rate
+
+    def getEnemyCount(self) -> int:
+        return sum(count for group in self.groups for _, count in group.enemies)
+
+
+class StageDefinition(NamedTuple):
+    name: str
+    background: str
+    path: str
+    gridSize: int
+    backgroundColor: tuple[int, int, int]
+    walkPath: tuple[tuple[int, int], ...]  # Grid coordinates of the path corners
+    waves: tuple[WaveDefinition, ...]      # waves[0] is wave 1
+
+
+class CompiledConfig(NamedTuple):
+    """
+    Every validated tower, enemy, stage and inventory record, as built by ConfigCompiler.
+    The mappings are read-only views (types.MappingProxyType).
+    """
+    towers: Mapping[str, TowerDefinition]
+    enemies: Mapping[str, EnemyDefinition]
+    stages: Mapping[str, StageDefinition]
+    inventory: tuple[tuple[int, str], ...]  # (hotbar slot, tower name) pairs
+    invalidStages: Mapping[str, str]        # Stage name -> why it was left out
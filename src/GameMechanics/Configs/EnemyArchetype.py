@@ -0,0 +1,15 @@
+from typing import NamedTuple
+
+import pygame
+
+
+class EnemyArchetype(NamedTuple):
+    """
+    Immutable per-type enemy data shared by every enemy of that type.
+    """
+    name: str
+    health: int
+    damage: int
+    speed: float
+    reward: int
+    image: pygame.Surface
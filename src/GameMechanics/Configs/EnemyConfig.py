@@ -1,8 +1,10 @@
-import json
 import logging
-import os
-import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Mapping
+
+import pygame
+
+from src.GameMechanics.Configs.ConfigRecords import EnemyDefinition
+from src.GameMechanics.Configs.EnemyArchetype import EnemyArchetype
 
 if TYPE_CHECKING:
     from src.Scenes.GameScene import GameScene
@@ -10,28 +12,38 @@ if TYPE_CHECKING:
 class EnemyConfig:
     def __init__(self, gameScene: 'GameScene'):
         self.main = gameScene
-        self.__loadEnemiesConfig()
+        self.__archetypes: dict[str, EnemyArchetype] = {}
+        self.__config: Mapping[str, EnemyDefinition] = gameScene.getCompiledConfig().enemies
 
-    def __loadEnemiesConfig(self):
-        enemies_config_path = os.path.join(self.main.getProjectRoot(), "config", "enemies.json")
-        enemies_config_path = os.path.normpath(enemies_config_path)
-        logging.info(f"Loading Enemies Config from: {enemies_config_path}")
+    def getConfig(self) -> Mapping[str, EnemyDefinition]:
+        return self.__config
 
-        if not os.path.exists(enemies_config_path):
-            logging.error(f"Enemies configuration file not found: {enemies_config_path}")
-            sys.exit(1)
+    def getArchetype(self, enemyType: str) -> EnemyArchetype:
+        """
+        Return the shared archetype (stats and scaled image) for an enemy type, building it on first use.
+        """
+        archetype = self.__archetypes.get(enemyType)
+        if archetype is not None:
+            return archetype
 
+        config = self.__config.get(enemyType)
+        if not config:
+            logging.error(f"No configuration found for enemy type '{enemyType}'.")
+            raise ValueError(f"No configuration found for enemy type '{enemyType}'.")
+
+        size = int(self.main.getStageManager().getStageConfig().getGridSize() * 0.8)
         try:
-            with open(enemies_config_path, "r") as f:
-                enemies_config = json.load(f)
-                logging.info("Enemies configuration loaded successfully.")
-                self.__config = enemies_config
-        except json.JSONDecodeError as e:
-            logging.error(f"Error parsing enemies configuration: {e}")
-            sys.exit(1)
-        except Exception as e:
-            logging.error(f"Unexpected error loading enemies configuration: {e}")
-            sys.exit(1)
-
-    def getConfig(self):
-        return self.__config
\ No newline at end of file
+            image = self.main.getAssetCache().getImage(config.image, (size, size))
+        except pygame.error as e:
+            raise pygame.error(f"Error loading enemy image '{config.image}': {e}")
+
+        archetype = EnemyArchetype(
+            name=enemyType,
+            health=config.health,
+            damage=config.damage,
+            speed=config.speed,
+            reward=config.reward,
+            image=image
+        )
+        self.__archetypes[enemyType] = archetype
+        return archetype
\ No newline at end of file
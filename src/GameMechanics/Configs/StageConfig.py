@@ -1,42 +1,58 @@
-import json
 import logging
 import os
 
+from src.GameMechanics.Configs.CompiledPath import CompiledPath
+from src.GameMechanics.Configs.ConfigRecords import CompiledConfig, StageDefinition, WaveDefinition
+
 class StageConfig:
-    def __init__(self, project_root, stage):
+    def __init__(self, project_root, stage, compiledConfig: CompiledConfig):
         config_path = os.path.join(project_root, "config", "stage", f"{stage}.json")
         config_path = os.path.normpath(config_path)  # Normalize the path
+        self.__configPath = config_path
         logging.info(f"Loading Stage Config from: {config_path}")
 
-        if not os.path.exists(config_path):
+        self.config: StageDefinition = compiledConfig.stages.get(stage)
+        if self.config is None and stage in compiledConfig.invalidStages:
+            logging.error(f"Stage configuration '{stage}' is invalid: {compiledConfig.invalidStages[stage]}")
+            raise ValueError(f"Stage configuration '{stage}' is invalid: {compiledConfig.invalidStages[stage]}")
+        if self.config is None:
             logging.error(f"Stage configuration file not found: {config_path}")
             raise FileNotFoundError(f"Stage configuration file not found: {config_path}")
+        logging.info(f"Stage configuration '{stage}' loaded successfully.")
+        self.__compiledPath = None
 
-        try:
-            with open(config_path, "r") as f:
-                self.config = json.load(f)
-                logging.info(f"Stage configuration '{stage}' loaded successfully.")
-        except json.JSONDecodeError as e:
-            logging.error(f"Error parsing stage configuration: {e}")
-            raise
+    def getConfigPath(self) -> str:
+        return self.__configPath
 
-    def getGridSize(self):
-        if self.config.get("grid_size", 64) <= 0:
-            logging.warning(f"Invalid grid_size '{self.config.get('grid_size', 64)}'. Setting to default value 64.")
-            return 64
-        return self.config.get("grid_size", 64)
+    def getGridSize(self) -> int:
+        return self.config.gridSize
 
     def getBackgroundImage(self) -> str:
-        return self.config.get("background", "")
+        return self.config.background
 
     def getPathImage(self) -> str:
-        return self.config.get("path", "")
-
-    def getWalkPath(self) -> list[str]:
-        return self.config.get("walk_path", [])
-
-    def getWaveConfig(self) -> list:
-        return self.config.get("waves", [])
-
-    def getConfig(self):
-        return self.config
\ No newline at end of file
+        return self.config.path
+
+    def getBackgroundColor(self) -> tuple[int, int, int]:
+        return self.config.backgroundColor
+
+    def getWalkPath(self) -> tuple[tuple[int, int], ...]:
+        return self.config.walkPath
+
+    def getCompiledPath(self) -> CompiledPath:
+        """
+        Return the walk path compiled into pixel waypoints and cumulative distances.
+        It is built on first use and shared by every enemy of the stage.
+        """
+        if self.__compiledPath is None:
+            self.__compiledPath = CompiledPath(self.getWalkPath(), self.getGridSize())
+        return self.__compiledPath
+
+    def getWaves(self) -> tuple[WaveDefinition, ...]:
+        """
+        Return the validated wave schedule; waves[0] is wave 1.
+        """
+        return self.config.waves
+
+    def getConfig(self) -> StageDefinition:
+        return self.config
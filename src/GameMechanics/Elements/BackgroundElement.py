@@ -20,7 +20,7 @@ class BackgroundElement:
         self.stage_config = stageConfig
         self.main_config = mainConfig
         self.screen = screen
-        self.drawBackground()
+        self.__loaded = False  # The image is loaded on first draw, the baked stage layer may not need it
 
     def drawBackground(self):
         """
@@ -45,17 +45,28 @@ class BackgroundElement:
         else:
             logging.error(f"Background image not found: {background_path}")
             self.background_img = None
-        self.draw()
+        self.__loaded = True
 
-    def draw(self):
+    def getImagePath(self) -> str:
+        """
+        Return the absolute path of the background image, which may not exist.
+        """
+        return os.path.normpath(os.path.join(self.main_config.getProjectRoot(), self.stage_config.getBackgroundImage()))
+
+    def draw(self, surface: pygame.Surface = None):
         """
         Draw the background onto the screen.
+
+        :param surface: Surface to draw onto instead of the screen
         """
+        if not self.__loaded:
+            self.drawBackground()
+        target = surface if surface is not None else self.screen
         try:
             if self.background_img:
-                self.screen.blit(self.background_img, (0, 0))
+                target.blit(self.background_img, (0, 0))
             else:
-                bg_color = self.stage_config.getConfig().get("game_settings", {}).get("background_color", [0, 0, 0])
-                self.screen.fill(bg_color)  # Fallback to configured background color or black
+                bg_color = self.stage_config.getBackgroundColor()
+                target.fill(bg_color)  # Fallback to configured background color or black
         except Exception as e:
             logging.error(f"Error drawing background: {e}")
@@ -14,6 +14,7 @@ class InventoryUI:
     def __init__(self, gameScene: 'GameScene'):
         self.selected_slot = None
         self.__main = gameScene
+        self.__frameBaked = False  # The hotbar frame is part of the static stage layer
         self.__font = gameScene.getFont(14)
         self.__slotDisplays: dict[int, dict] = {
             0: {},
@@ -39,7 +40,8 @@ class InventoryUI:
             logging.error(f"InventoryUI image not found: {image_path}")
             raise FileNotFoundError(f"InventoryUI image not found: {image_path}")
 
-        original_image = pygame.image.load(image_path)
+        self.__imagePath = image_path
+        original_image = self.__main.getAssetCache().getImage(image_path, pixelFormat="raw")
         original_width, original_height = original_image.get_size()
 
         self.__new_width = 584
@@ -110,6 +112,11 @@ class InventoryUI:
         logging.info(f"Initialized {len(self.__buttons)} buttons.")
         self.selected_slot = None
 
+    def clearSelection(self):
+        for button in self.__buttons:
+            button.selected = False
+        self.selected_slot = None
+
     def selectSlot(self, slot_index):
         # Deselect all buttons
         for idx, button in enumerate(self.__buttons):
@@ -122,12 +129,30 @@ class InventoryUI:
         event_data = {"slot": slot_index, "tower": self.__slotDisplays[slot_index].get("name")}
         pygame.event.post(pygame.event.Event(PLAYER_INVENTORY_SELECTED, data=event_data))
 
+    def getImagePath(self) -> str:
+        return self.__imagePath
+
+    def drawFrame(self, surface: pygame.Surface) -> pygame.Rect:
+        """
+        Draw the hotbar frame without its slots, e.g. into the static stage layer.
+        """
+        return surface.blit(self.__image, (self.x_position, self.y_position))
+
+    def setFrameBaked(self, baked: bool):
+        """
+        Set whether the frame is already on the static stage layer, so display() only draws the slots.
+        """
+        self.__frameBaked = baked
+
     def display(self):
         screen = self.__main.getScreen()
-        screen.blit(self.__image, (self.x_position, self.y_position))
+        if self.__frameBaked:
+            rect = self.__image.get_rect(topleft=(self.x_position, self.y_position))
+        else:
+            rect = self.drawFrame(screen)
         for idx, button in enumerate(self.__buttons):
             if self.__slotDisplays[idx].get("image"):
-                text = "€"+str(self.__main.getTowerConfig().getTowerConfig(self.__slotDisplays[idx].get('name')).get('1')['cost'])
+                text = "€"+str(self.__main.getTowerConfig().getTowerLevelConfig(self.__slotDisplays[idx].get('name'), 1).cost)
                 button.alpha = 255
                 button.image = self.__slotDisplays[idx].get("image")
                 button.color = (0, 0, 0, 255)
@@ -138,7 +163,9 @@ class InventoryUI:
                 button.alpha = 0
                 button.color = (0, 0, 0, 128)
                 button.transparent = True
+            rect.union_ip(button.rect)
             button.draw(screen)
+        return rect
 
     def handle_event(self, event):
         for button in self.__buttons:
@@ -14,10 +14,10 @@ class PathElement:
         self.__main = gameScene
         self.__screen = screen
         self.__grid_size = self.__stageConfig.getGridSize()
-        self.__loadPathImage()
+        self.path_surface = None
+        self.__imagePath = self.__findPathImage()
 
-    def __loadPathImage(self):
-        # Load and scale the path image once
+    def __findPathImage(self) -> str:
         path_image_relative = self.__stageConfig.getPathImage()
         if not path_image_relative:
             logging.error("No 'path' specified in stage configuration.")
@@ -30,7 +30,14 @@ class PathElement:
         if not os.path.exists(path_image_path):
             logging.error(f"Path image not found: {path_image_path}")
             raise FileNotFoundError(f"Path image not found: {path_image_path}")
+        return path_image_path
+
+    def getImagePath(self) -> str:
+        return self.__imagePath
 
+    def __loadPathImage(self):
+        # Load and scale the path image once, on first draw; the baked stage layer may not need it
+        path_image_path = self.__imagePath
         try:
             self.path_img = pygame.image.load(path_image_path).convert_alpha()
             self.path_img = pygame.transform.scale(self.path_img, (self.__grid_size, self.__grid_size))
@@ -52,18 +59,11 @@ class PathElement:
         """
         Draw the walk path on the path surface.
         """
-        path = self.__stageConfig.getConfig().get("walk_path", [])
-        if not path:
+        path_coords = self.__stageConfig.getCompiledPath().getGridNodes()
+        if not path_coords:
             logging.warning("No walk_path defined in the stage configuration.")
             return  # No path to draw
-
-        # Convert all path coordinates to tuples of integers
-        try:
-            path_coords = [tuple(map(int, coord.split(','))) for coord in path]
-            logging.info(f"Walk Path Coordinates: {path_coords}")
-        except ValueError as e:
-            logging.error(f"Error parsing walk_path coordinates: {e}")
-            raise
+        logging.info(f"Walk Path Coordinates: {path_coords}")
 
         # Iterate through consecutive pairs of coordinates
         for i in range(len(path_coords) - 1):
@@ -112,24 +112,21 @@ class PathElement:
         """
         Return the walk path as a list of (x, y) tuples.
         """
-        path = self.__stageConfig.getConfig().get("walk_path", [])
-        if not path:
+        path_coords = self.__stageConfig.getCompiledPath().getGridNodes()
+        if not path_coords:
             logging.warning("No walk_path defined in the stage configuration.")
-            return []
-        try:
-            path_coords = [tuple(map(int, coord.split(','))) for coord in path]
-            logging.info(f"Walk Path Coordinates: {path_coords}")
-            return path_coords
-        except ValueError as e:
-            logging.error(f"Error parsing walk_path coordinates: {e}")
-            return []
+        return list(path_coords)
 
-    def draw(self):
+    def draw(self, surface: pygame.Surface = None):
         """
-        Blit the background and path surfaces onto the main screen.
+        Blit the path surface onto the main screen.
+
+        :param surface: Surface to draw onto instead of the screen
         """
+        if self.path_surface is None:
+            self.__loadPathImage()
         try:
-            screen = self.__main.getScreen()
+            screen = surface if surface is not None else self.__main.getScreen()
             screen.blit(self.path_surface, (0, 0))
         except Exception as e:
             logging.error(f"Error during StageManager draw: {e}")
@@ -139,15 +136,16 @@ class PathElement:
         Returns a list of pygame.math.Vector2 instances representing
         each grid position that the path passes through.
         """
-        path = self.__stageConfig.getConfig().get("walk_path", [])
-        if not path:
+        return [pygame.math.Vector2(pos) for pos in self.getPathCells()]
+
+    def getPathCells(self) -> list[tuple[int, int]]:
+        """
+        Returns every grid position that the path passes through, as (x, y) tuples.
+        """
+        path_coords = self.__stageConfig.getCompiledPath().getGridNodes()
+        if not path_coords:
             logging.warning("No walk_path defined in the stage configuration.")
             return []
-        try:
-            path_coords = [tuple(map(int, coord.split(','))) for coord in path]
-        except ValueError as e:
-            logging.error(f"Error parsing walk_path coordinates: {e}")
-            return []
 
         full_path = []
         for i in range(len(path_coords) - 1):
@@ -158,8 +156,7 @@ class PathElement:
                 # Avoid duplicating the starting point of each segment except the first one
                 segment_positions = segment_positions[1:]
             full_path.extend(segment_positions)
-        # Convert tuples to pygame.math.Vector2 instances
-        return [pygame.math.Vector2(pos) for pos in full_path]
+        return full_path
 
     def __get_segment_positions(self, start, end):
         """
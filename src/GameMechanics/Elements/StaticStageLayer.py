@@ -0,0 +1,97 @@
+import hashlib
+import logging
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from src.Scenes.GameScene import GameScene
+    from src.GameMechanics.Elements.BackgroundElement import BackgroundElement
+    from src.GameMechanics.Elements.PathElement import PathElement
+
+
+class StaticStageLayer:
+    CACHE_VERSION = 1  # Bump when the way the layer is composed changes
+    CACHE_DIRECTORY = os.path.join("cache", "stage_layers")
+
+    def __init__(self, gameScene: 'GameScene', background: 'BackgroundElement', path: 'PathElement'):
+        """
+        The parts of a stage that never change while it is played (background, path tiles and
+        the hotbar frame) merged into one opaque surface in display format. The merged image is
+        saved on disk, keyed by a hash of the stage JSON and the image files, and loaded from
+        there the next time the stage is opened.
+
+        The layer is built on first use, since it needs the display and the UI.
+        """
+        self.__main = gameScene
+        self.__background = background
+        self.__path = path
+        self.__surface: pygame.Surface | None = None
+        self.__cacheKey: str | None = None
+
+    def draw(self):
+        self.__main.getScreen().blit(self.getSurface(), (0, 0))
+
+    def getSurface(self) -> pygame.Surface:
+        if self.__surface is None:
+            self.__surface = self.__build()
+        return self.__surface
+
+    def invalidate(self):
+        """
+        Drop the in-memory layer so it is rebuilt (or reloaded) on the next draw.
+        """
+        self.__surface = None
+        self.__cacheKey = None
+
+    def getCacheKey(self) -> str:
+        """
+        Return the hash the on-disk cache entry is stored under.
+        """
+        if self.__cacheKey is None:
+            screen = self.__main.getScreen()
+            digest = hashlib.sha256(f"{self.CACHE_VERSION}:{screen.get_width()}x{screen.get_height()}".encode())
+            files = [
+                self.__main.getStageManager().getStageConfig().getConfigPath(),
+                self.__background.getImagePath(),
+                self.__path.getImagePath(),
+                self.__main.getUIManager().hotbarUI.getImagePath()
+            ]
+            for file in files:
+                digest.update(file.encode())
+                if os.path.exists(file):
+                    with open(file, "rb") as f:
+                        digest.update(f.read())
+            self.__cacheKey = digest.hexdigest()
+        return self.__cacheKey
+
+    def getCachePath(self) -> str:
+        return os.path.join(self.__main.getProjectRoot(), self.CACHE_DIRECTORY, f"{self.getCacheKey()}.png")
+
+    def __build(self) -> pygame.Surface:
+        start = time.perf_counter()
+        cachePath = self.getCachePath()
+        self.__main.getUIManager().hotbarUI.setFrameBaked(True)
+
+        if os.path.exists(cachePath):
+            try:
+                surface = pygame.image.load(cachePath).convert()
+                logging.info(f"Loaded static stage layer from cache in {(time.perf_counter() - start) * 1000:.1f} ms.")
+                return surface
+            except pygame.error as e:
+                logging.warning(f"Ignoring unreadable stage layer cache '{cachePath}': {e}")
+
+        surface = pygame.Surface(self.__main.getScreen().get_size()).convert()
+        self.__background.draw(surface)
+        self.__path.draw(surface)
+        self.__main.getUIManager().hotbarUI.drawFrame(surface)
+        logging.info(f"Composed static stage layer in {(time.perf_counter() - start) * 1000:.1f} ms.")
+
+        try:
+            os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+            pygame.image.save(surface, cachePath)
+        except (OSError, pygame.error) as e:
+            logging.warning(f"Could not write stage layer cache '{cachePath}': {e}")
+        return surface
@@ -0,0 +1,70 @@
+import math
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from src.Scenes.GameScene import GameScene
+
+
+class CoverageHeatmapUI:
+    UNCOVERED_COLOR = (255, 0, 0, 70)
+    COVERED_COLOR = (255, 200, 0)
+    LEVELS = 4          # Shades between the least and the most covered parts of the path
+    MAX_ALPHA = 150
+
+    def __init__(self, gameScene: 'GameScene'):
+        """
+        Tints the path by how many towers cover it, from PlacementManager.getCoverageHeatmap():
+        red where no tower reaches, and stronger shades of yellow where more towers overlap.
+        Toggled with the H key.
+        """
+        self.__main = gameScene
+        stageConfig = gameScene.getStageManager().getStageConfig()
+        self.__gridSize = stageConfig.getGridSize()
+        self.__path = stageConfig.getCompiledPath()
+        self.__positions: list[tuple[int, int]] = []
+        self.__tints: dict[int, pygame.Surface] = {}
+        self.__visible = False
+
+    def reset(self):
+        self.__visible = False
+
+    def toggle(self):
+        self.__visible = not self.__visible
+
+    def isVisible(self) -> bool:
+        return self.__visible
+
+    def draw(self) -> list[pygame.Rect]:
+        if not self.__visible:
+            return []
+        counts = self.__main.getPlacementManager().getCoverageHeatmap()
+        positions = self.__getPositions(len(counts))
+        highest = max(counts, default=0)
+        blits = []
+        for position, count in zip(positions, counts):
+            level = math.ceil(count * self.LEVELS / highest) if count else 0
+            blits.append((self.__getTint(level), position))
+        return self.__main.getScreen().blits(blits)
+
+    def __getPositions(self, count: int) -> list[tuple[int, int]]:
+        # Top-left corner of a grid_size square centered on each heatmap sample
+        if len(self.__positions) != count:
+            half = self.__gridSize / 2
+            self.__positions = []
+            for sample in range(count):
+                x, y, _ = self.__path.positionAt(sample * self.__gridSize)
+                self.__positions.append((round(x - half), round(y - half)))
+        return self.__positions
+
+    def __getTint(self, level: int) -> pygame.Surface:
+        tint = self.__tints.get(level)
+        if tint is None:
+            tint = pygame.Surface((self.__gridSize, self.__gridSize), pygame.SRCALPHA)
+            if level == 0:
+                tint.fill(self.UNCOVERED_COLOR)
+            else:
+                tint.fill((*self.COVERED_COLOR, self.MAX_ALPHA * level // self.LEVELS))
+            self.__tints[level] = tint
+        return tint
@@ -10,9 +10,7 @@ if TYPE_CHECKING:
 class CurrencyUI:
     def __init__(self, gameScene: 'GameScene'):
         self.__main = gameScene
-        self.__font = gameScene.getFont(12)
-        self.__heartImg = pygame.image.load("config/images/UI/gold_ingot.png")
-        self.__heartImg = pygame.transform.scale(self.__heartImg, (30, 30))
+        self.__heartImg = gameScene.getAssetCache().getImage("config/images/UI/gold_ingot.png", (30, 30))
         self.__tick = 0
         self.__maxTick = 0.25
 
@@ -26,25 +24,32 @@ class CurrencyUI:
         self.__background = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
         red_color = max((self.__tick/self.__maxTick) * 255, 1)
         pygame.draw.rect(self.__main.getScreen(), (red_color, 0, 0), self.__background)
-        self.__main.getScreen().blit(self.__heartImg, (bar_x - 14, bar_y-6))
+        heart = self.__main.getScreen().blit(self.__heartImg, (bar_x - 14, bar_y-6))
+        return heart.union(self.__background)
 
 
 
     def __drawText(self):
         screen = self.__main.getScreen()
 
-        text = self.__font.render(f"{self.__main.getCurrencyManager().getCurrency('gold')}", True, (255, 200, 0))
-        text_rect = text.get_rect()
-
+        gold = f"{self.__main.getCurrencyManager().getCurrency('gold')}"
         bar_center = self.__background.center
 
+        # Gold changes often, so draw it from pre-rendered digits instead of rasterizing it
+        atlas = self.__main.getTextCache().getDigitAtlas(12, (255, 200, 0))
+        if atlas.canDraw(gold):
+            return atlas.draw(screen, gold, bar_center)
+
+        text = self.__main.getTextCache().render(12, gold, (255, 200, 0))
+        text_rect = text.get_rect()
         text_rect.center = bar_center
+        return screen.blit(text, text_rect)
 
-        screen.blit(text, text_rect)
+    def display(self) -> pygame.Rect:
+        return self.__drawBar().union(self.__drawText())
 
-    def display(self):
-        self.__drawBar()
-        self.__drawText()
+    def reset(self):
+        self.__tick = 0
 
     def tick(self, dt: float):
         if self.__tick > 0:
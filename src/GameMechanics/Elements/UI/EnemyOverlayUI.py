@@ -0,0 +1,106 @@
+from typing import TYPE_CHECKING
+
+import pygame
+
+from src.GameMechanics.Engine.StatusEffects import SLOW, BLEEDING, BURNING
+
+if TYPE_CHECKING:
+    from src.Scenes.GameScene import GameScene
+
+
+class EnemyOverlayUI:
+    BAR_HEIGHT = 5
+    BAR_OFFSET = 10  # Pixels between the top of the health bar and the top of the enemy
+    FRAME_HEIGHT = 7
+    HEALTH_COLORS = [(0, 128, 0), (0, 255, 0)]
+    SLOWED_HEALTH_COLORS = [(0, 0, 128), (0, 0, 255)]
+
+    def __init__(self, gameScene: 'GameScene'):
+        """
+        Draws the health bars and debuff tints of all enemies in one pass, batched into a single
+        Surface.blits() call. Bar frames and tints are cached surfaces keyed by size and color.
+
+        Above game_settings.enemy_overlay_detail_limit enemies only the health bar fill is drawn,
+        and no more than game_settings.enemy_overlay_limit enemies get an overlay at all.
+        """
+        self.__main = gameScene
+        self.__detailLimit = gameScene.getConfig().getGameSettings("enemy_overlay_detail_limit") or 300
+        self.__enemyLimit = gameScene.getConfig().getGameSettings("enemy_overlay_limit") or 2000
+        self.__frames: dict[int, pygame.Surface] = {}
+        self.__tints: dict[tuple, pygame.Surface] = {}
+        self.__lowDetail = False
+
+    def display(self, alpha: float = 1.0):
+        """
+        Draw the overlays where the enemies are drawn, interpolated like Enemy.draw.
+
+        :param alpha: Fraction of a simulation step elapsed since the last update (0..1)
+        """
+        enemies = self.__main.getWaveManager().getEnemies()
+        lowDetail = len(enemies) > self.__detailLimit
+        self.__lowDetail = lowDetail
+        gradientUtils = self.__main.getGradientUtils()
+        bars = []
+        tints = []
+        for index, enemy in enumerate(enemies):
+            if index >= self.__enemyLimit:
+                break
+            rect = enemy.rect
+            x, y = enemy.getRenderPosition(alpha)
+            left = x - rect.width / 2
+            top = y - rect.height / 2
+            if not lowDetail:
+                debuffs = enemy.getDebuffMask()
+                if debuffs:
+                    tints.append((self.__getTint(rect.width, rect.height, debuffs), (left, top)))
+
+            health = enemy.getHealth()
+            maxHealth = enemy.getMaxHealth()
+            if health == maxHealth:
+                continue
+            width = rect.width
+            current_health_width = max(int(width * health / maxHealth), 1)
+            colors = self.SLOWED_HEALTH_COLORS if enemy.getTotalSpeedMultiplier() > 0 else self.HEALTH_COLORS
+            position = (left, top - self.BAR_OFFSET)
+            bars.append((gradientUtils.get_bar_gradient(width, self.BAR_HEIGHT, colors), position, (0, 0, current_health_width, self.BAR_HEIGHT)))
+            if not lowDetail:
+                bars.append((self.__getFrame(width), position))
+
+        # Tints go over every bar, as when they were drawn in a later pass
+        bars.extend(tints)
+        self.__main.getScreen().blits(bars, False)
+
+    def isLowDetail(self) -> bool:
+        """
+        Return True when the last display() skipped frames and tints because of the enemy count.
+        """
+        return self.__lowDetail
+
+    def __getFrame(self, width: int) -> pygame.Surface:
+        frame = self.__frames.get(width)
+        if frame is None:
+            frame = pygame.Surface((width, self.FRAME_HEIGHT), pygame.SRCALPHA)
+            pygame.draw.rect(frame, (0, 0, 0), frame.get_rect(), 2)
+            self.__frames[width] = frame
+        return frame
+
+    def __getTint(self, width: int, height: int, debuffs: int) -> pygame.Surface:
+        color = self.__getTintColor(debuffs)
+        key = (width, height, color)
+        tint = self.__tints.get(key)
+        if tint is None:
+            tint = pygame.Surface((width, height), pygame.SRCALPHA)
+            tint.fill(color)
+            self.__tints[key] = tint
+        return tint
+
+    # noinspection PyMethodMayBeStatic
+    def __getTintColor(self, debuffs: int) -> tuple:
+        if debuffs & BURNING:
+            return 255, 69, 0, 128  # Orange with alpha for burning
+        elif debuffs & BLEEDING:
+            return 220, 20, 60, 128  # Crimson with alpha for bleeding
+        elif debuffs & SLOW:
+            return 30, 144, 255, 128  # Dodger blue with alpha for slow
+        else:
+            return 255, 0, 0, 128  # Default red color with alpha
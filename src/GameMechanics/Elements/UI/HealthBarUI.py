@@ -10,9 +10,7 @@ if TYPE_CHECKING:
 class HealthBarUI:
     def __init__(self, gameScene: 'GameScene'):
         self.__main = gameScene
-        self.__font = gameScene.getFont(12)
-        self.__heartImg = pygame.image.load("config/images/UI/heart.png")
-        self.__heartImg = pygame.transform.scale(self.__heartImg, (30, 30))
+        self.__heartImg = gameScene.getAssetCache().getImage("config/images/UI/heart.png", (30, 30))
 
     def __drawBar(self):
         player = self.__main.getPlayer()
@@ -26,26 +24,30 @@ class HealthBarUI:
 
         health_ratio = player.getHealth() / player.getMaxHealth()
         current_health_width = max(int(bar_width * health_ratio), 1)
-        currentHealth = self.__main.getGradientUtils().get_horizontal_gradient(current_health_width, bar_height, [(255, 0, 0), (255, 128, 0)])
+        fullHealth = self.__main.getGradientUtils().get_bar_gradient(bar_width, bar_height, [(255, 0, 0), (255, 128, 0)])
 
         pygame.draw.rect(self.__main.getScreen(), (136, 28, 16), self.__maxHealth)
-        self.__main.getScreen().blit(currentHealth, (bar_x, bar_y))
+        self.__main.getScreen().blit(fullHealth, (bar_x, bar_y), (0, 0, current_health_width, bar_height))
         pygame.draw.rect(self.__main.getScreen(), (0, 0, 0), self.__maxHealth, 2)
-        self.__main.getScreen().blit(self.__heartImg, (bar_x - 14, bar_y-2))
+        heart = self.__main.getScreen().blit(self.__heartImg, (bar_x - 14, bar_y-2))
+        return heart.union(self.__maxHealth)
 
     def __drawText(self):
         player = self.__main.getPlayer()
         screen = self.__main.getScreen()
 
-        health_text = self.__font.render(f"{player.getHealth()}/{player.getMaxHealth()}", True, (255, 255, 255))
-        text_rect = health_text.get_rect()
-
+        text = f"{player.getHealth()}/{player.getMaxHealth()}"
         bar_center = self.__maxHealth.center
 
-        text_rect.center = bar_center
+        # Health changes often, so draw it from pre-rendered digits instead of rasterizing it
+        atlas = self.__main.getTextCache().getDigitAtlas(12, (255, 255, 255))
+        if atlas.canDraw(text):
+            return atlas.draw(screen, text, bar_center)
 
-        screen.blit(health_text, text_rect)
+        health_text = self.__main.getTextCache().render(12, text, (255, 255, 255))
+        text_rect = health_text.get_rect()
+        text_rect.center = bar_center
+        return screen.blit(health_text, text_rect)
 
-    def display(self):
-        self.__drawBar()
-        self.__drawText()
+    def display(self) -> pygame.Rect:
+        return self.__drawBar().union(self.__drawText())
@@ -12,14 +12,23 @@ class HurtUI:
         self.__button = Button(0,0,w, h,color=(255,0,0),alpha=0)
         self.__delay = 0
 
+    def reset(self):
+        self.__button.alpha = 0
+        self.__delay = 0
+
     def tick(self, dt):
-        self.__button.draw(self.__gameScene.getScreen())
         if self.__delay > 0:
             self.__delay -= dt
             self.__button.alpha = max(self.__delay/0.25 * 128, 0)
             if self.__delay <= 0:
                 self.__button.alpha = 0
 
+    def draw(self):
+        self.__button.draw(self.__gameScene.getScreen())
+
+    def isVisible(self) -> bool:
+        return self.__button.alpha > 0
+
     def hurt(self):
         self.__button.alpha = 128
         self.__delay = 0.25
\ No newline at end of file
@@ -46,6 +46,14 @@ class PauseUI:
         self.__fadeIn = 0.33
         self.__tick = 0
 
+    def reset(self):
+        self.__tick = 0
+        self.__background.alpha = 0
+        for button in (self.__resumeButton, self.__exitButton):
+            button.visible = False
+            button.hovered = False
+            button.pressed = False
+
     def tick(self, dt: float):
         if self.__scene.getStageManager().isPaused():
             if self.__tick < self.__fadeIn:
@@ -56,10 +64,6 @@ class PauseUI:
             self.__resumeButton.alpha = alpha255
             self.__exitButton.alpha = alpha255
             self.__pauseText.set_alpha(alpha255)
-            self.__background.draw(self.__scene.getScreen())
-            self.__resumeButton.draw(self.__scene.getScreen())
-            self.__exitButton.draw(self.__scene.getScreen())
-            self.__scene.getScreen().blit(self.__pauseText, (self.__width // 2 - self.__pauseText.get_width() // 2, self.__height // 2.5 - self.__pauseText.get_height() // 2))
             self.__resumeButton.visible = True
             self.__exitButton.visible = True
             return
@@ -68,6 +72,14 @@ class PauseUI:
         self.__exitButton.visible = False
         self.__background.alpha = 0
 
+    def draw(self):
+        if not self.__scene.getStageManager().isPaused():
+            return
+        self.__background.draw(self.__scene.getScreen())
+        self.__resumeButton.draw(self.__scene.getScreen())
+        self.__exitButton.draw(self.__scene.getScreen())
+        self.__scene.getScreen().blit(self.__pauseText, (self.__width // 2 - self.__pauseText.get_width() // 2, self.__height // 2.5 - self.__pauseText.get_height() // 2))
+
 
     def handle_event(self, event):
         self.__resumeButton.handle_event(event)
@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING
+
+import pygame
+
+from src.GameMechanics.Engine.OccupancyGrid import EMPTY, HUD, OUT_OF_BOUNDS
+
+if TYPE_CHECKING:
+    from src.Scenes.GameScene import GameScene
+
+
+class PlacementPreviewUI:
+    VALID_COLOR = (0, 255, 0, 60)
+    INVALID_COLOR = (255, 0, 0, 60)
+
+    def __init__(self, gameScene: 'GameScene'):
+        """
+        Tints the cell under the mouse green or red, depending on whether the selected tower can be placed there.
+        """
+        self.__main = gameScene
+        gridSize = gameScene.getStageManager().getStageConfig().getGridSize()
+        self.__valid = pygame.Surface((gridSize, gridSize), pygame.SRCALPHA)
+        self.__valid.fill(self.VALID_COLOR)
+        self.__invalid = pygame.Surface((gridSize, gridSize), pygame.SRCALPHA)
+        self.__invalid.fill(self.INVALID_COLOR)
+
+    def draw(self) -> pygame.Rect | None:
+        towerType = self.__main.getInventoryManager().getSelectedTower()
+        if self.__main.getTowerConfig().getTowerConfig(towerType) is None or not pygame.mouse.get_focused():
+            return None
+
+        grid = self.__main.getPlacementManager().getOccupancyGrid()
+        x, y = grid.cellAt(pygame.mouse.get_pos())
+        state = grid.getState(x, y)
+        if state == HUD or state == OUT_OF_BOUNDS:
+            return None
+        surface = self.__valid if state == EMPTY else self.__invalid
+        gridSize = grid.getGridSize()
+        return self.__main.getScreen().blit(surface, (x * gridSize, y * gridSize))
@@ -14,11 +14,19 @@ class PlayerLostUI:
         self.__width = scene.getScreen().get_width()
         self.__height = scene.getScreen().get_height()
         self.__background = Button(x=0, y=0, w=scene.getScreen().get_width(), h=scene.getScreen().get_height(), color=(0, 0, 0), alpha=0, visible=False)
-        self.__title = self.__scene.getFont(64).render("", True, (255, 255, 255)).convert_alpha()
-        self.__subtitle = self.__scene.getFont(32).render("", True, (255, 255, 255)).convert_alpha()
+        self.__title = self.__scene.getTextCache().render(64, "", (255, 255, 255))
+        self.__subtitle = self.__scene.getTextCache().render(32, "", (255, 255, 255))
+        self.__countdown = None  # Drawn from the digit atlas instead of the subtitle when set
         self.__tick = 0
         self.__fadeIn = 3
 
+    def reset(self):
+        self.__background.visible = False
+        self.__title = self.__scene.getTextCache().render(64, "", (255, 255, 255))
+        self.__subtitle = self.__scene.getTextCache().render(32, "", (255, 255, 255))
+        self.__countdown = None
+        self.__tick = 0
+
     def set(self, tick):
         self.__tick = tick
 
@@ -26,22 +34,32 @@ class PlayerLostUI:
         if self.__scene.getStageManager().isLost:
             self.__tick += dt
             self.__background.visible = True
+            if (10 - int(self.__tick)) <= 0:
+                pygame.event.post(pygame.event.Event(PLAYER_EXIT))
+
+    def draw(self):
+        if self.__scene.getStageManager().isLost:
             self.__setTitle()
             alpha255 = min(255, int(255 * min(self.__fadeIn, self.__tick) / self.__fadeIn))
             alpha200 = min(200, int(200 * min(self.__fadeIn, self.__tick) / self.__fadeIn))
             self.__background.alpha = alpha200
             self.__title.set_alpha(alpha255)
-            self.__subtitle.set_alpha(alpha255)
             self.__background.draw(self.__scene.getScreen())
             self.__scene.getScreen().blit(self.__title, (self.__width // 2 - self.__title.get_width() // 2, self.__height // 2 - self.__title.get_height() // 2))
-            self.__scene.getScreen().blit(self.__subtitle, (self.__width // 2 - self.__subtitle.get_width() // 2, self.__height // 2 + self.__title.get_height() // 2))
-            if (10 - int(self.__tick)) <= 0:
-                pygame.event.post(pygame.event.Event(PLAYER_EXIT))
+            subtitle_y = self.__height // 2 + self.__title.get_height() // 2
+            if self.__countdown is not None:
+                atlas = self.__scene.getTextCache().getDigitAtlas(32, (255, 255, 255))
+                atlas.draw(self.__scene.getScreen(), self.__countdown, (self.__width // 2, subtitle_y + atlas.getSize(self.__countdown)[1] / 2), alpha255)
+            else:
+                self.__subtitle.set_alpha(alpha255)
+                self.__scene.getScreen().blit(self.__subtitle, (self.__width // 2 - self.__subtitle.get_width() // 2, subtitle_y))
 
     def __setTitle(self):
+        textCache = self.__scene.getTextCache()
         if self.__tick < 5:
-            self.__title = self.__scene.getFont(64).render("Lost", True, (255, 0, 0)).convert_alpha()
-            self.__subtitle = self.__scene.getFont(32).render("Better Luck Next Time", True, (255, 255, 255)).convert_alpha()
+            self.__title = textCache.render(64, "Lost", (255, 0, 0))
+            self.__subtitle = textCache.render(32, "Better Luck Next Time", (255, 255, 255))
+            self.__countdown = None
         elif self.__tick >= 5:
-            self.__title = self.__scene.getFont(64).render("Returning to Main Menu in", True, (255, 0, 0)).convert_alpha()
-            self.__subtitle = self.__scene.getFont(32).render(f"{10 - int(self.__tick)}", True, (255, 255, 255)).convert_alpha()
\ No newline at end of file
+            self.__title = textCache.render(64, "Returning to Main Menu in", (255, 0, 0))
+            self.__countdown = f"{10 - int(self.__tick)}"
\ No newline at end of file
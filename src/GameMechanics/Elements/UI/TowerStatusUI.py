@@ -23,6 +23,9 @@ class TowerStatusUI:
         self.__text_surfaces = []  # List to hold rendered text lines
         self.__tower_info = []     # List to hold tower information strings
 
+    def reset(self):
+        self.tick(None)
+
     def tick(self, tower: 'str'):
         if tower is None:
             self.background.alpha = 0
@@ -40,16 +43,16 @@ class TowerStatusUI:
         # Prepare tower information
         self.__tower_info = [
             f"Name: {tower}",
-            f"Damage: {config['damage']}",
-            f"Range: {config['range']}",
-            f"Attack Speed: {config['speed']}",
-            f"Cost: {config['cost']}",
+            f"Damage: {config.damage}",
+            f"Range: {config.range}",
+            f"Attack Speed: {config.speed}",
+            f"Cost: {config.cost}",
         ]
 
         # Render text surfaces
         font = self.__scene.getFont(14)
         self.__text_surfaces = [
-            font.render(line, True, (255, 255, 255)).convert_alpha()
+            self.__scene.getTextCache().render(14, line, (255, 255, 255))
             for line in self.__tower_info
         ]
 
@@ -62,7 +65,7 @@ class TowerStatusUI:
         self.background.height = line_height * len(self.__text_surfaces) + 2 * padding
 
     def draw(self):
-        self.background.draw(self.__scene.getScreen())
+        rect = self.background.draw(self.__scene.getScreen())
 
         if self.__text_surfaces:
             padding = 10
@@ -75,4 +78,4 @@ class TowerStatusUI:
                 )
                 self.__scene.getScreen().blit(text_surface, text_rect)
                 current_y += text_surface.get_height()
-
+        return rect if self.background.alpha > 0 else None
@@ -0,0 +1,452 @@
+import logging
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the sprite engine is used without it
+    np = None
+
+from typing import TYPE_CHECKING
+
+from src.GameMechanics.Engine.StatusEffects import SLOW, DOT_KINDS, DOT_INTERVAL
+
+if TYPE_CHECKING:
+    from src.GameMechanics.Configs.CompiledPath import CompiledPath
+    from src.GameMechanics.Engine.PathCoverage import PathCoverage
+
+
+class EnemyStore:
+    def __init__(self, path: 'CompiledPath', capacity: int = 256):
+        """
+        Struct-of-arrays storage for enemy state, stepped with one vectorized pass per frame.
+        Each live enemy owns a slot (row); ArrayEnemy sprites are thin views over their slot.
+
+        :param path: Compiled walk path the enemies follow
+        :param capacity: Initial number of slots, grown by doubling when full
+        """
+        if np is None:
+            raise ImportError("The numpy enemy engine requires NumPy to be installed.")
+
+        self.__path = path
+        cumulative = path.getCumulativeDistances()
+        waypoints = path.getWaypoints()
+        self.__cumulative = np.asarray(cumulative, dtype=np.float64)
+        self.__segmentLengths = np.asarray(path.getSegmentLengths(), dtype=np.float64)
+        self.__startX = np.asarray([x for x, _ in waypoints[:-1]], dtype=np.float64)
+        self.__startY = np.asarray([y for _, y in waypoints[:-1]], dtype=np.float64)
+        self.__deltaX = np.asarray([x2 - x1 for (x1, _), (x2, _) in zip(waypoints, waypoints[1:])], dtype=np.float64)
+        self.__deltaY = np.asarray([y2 - y1 for (_, y1), (_, y2) in zip(waypoints, waypoints[1:])], dtype=np.float64)
+        self.__totalLength = path.getTotalLength()
+        self.__endX, self.__endY = waypoints[-1] if waypoints else (0.0, 0.0)
+
+        self.__size = 0          # High-water mark, slots past it were never used
+        self.__free = []         # Released slots below the high-water mark
+        self.__owners = []       # Slot -> view object
+        self.__released = []     # Views whose slot was released since the last popReleased()
+
+        # Live slots in progress order (see getProgressOrder), repaired lazily after changes
+        self.__order = np.zeros(0, dtype=np.intp)
+        self.__orderKeys = np.zeros(0, dtype=np.float64)
+        self.__orderValid = True
+        self.__added: list[int] = []   # Slots claimed since the order was last repaired
+        self.__reorders = 0
+
+        # Columns of the 2D effect arrays, one per effect source
+        self.__slowColumns: dict[str, int] = {}
+        self.__dotColumns: dict[tuple[str, str], int] = {}
+        self.__dotColumnKinds: list[tuple[int, int]] = []  # (column, StatusEffects kind flag)
+
+        self.__allocate(capacity)
+
+    def __allocate(self, capacity: int):
+        self.__capacity = capacity
+        self.active = np.zeros(capacity, dtype=bool)
+        self.distance = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.health = np.zeros(capacity, dtype=np.float64)
+        self.maxHealth = np.ones(capacity, dtype=np.float64)
+        self.posX = np.zeros(capacity, dtype=np.float64)
+        self.posY = np.zeros(capacity, dtype=np.float64)
+        self.prevX = np.zeros(capacity, dtype=np.float64)
+        self.prevY = np.zeros(capacity, dtype=np.float64)
+        self.slowTotal = np.zeros(capacity, dtype=np.float64)
+        # Effect times are on a clock per enemy, like StatusEffects, so both engines expire and tick alike
+        self.effectClock = np.zeros(capacity, dtype=np.float64)
+        self.slowMultiplier = np.zeros((capacity, 0), dtype=np.float64)
+        self.slowExpires = np.zeros((capacity, 0), dtype=np.float64)
+        self.dotDamage = np.zeros((capacity, 0), dtype=np.float64)
+        self.dotExpires = np.zeros((capacity, 0), dtype=np.float64)
+        self.dotNextTick = np.zeros((capacity, 0), dtype=np.float64)
+        self.__owners = [None] * capacity
+
+    def __grow(self):
+        old = {name: getattr(self, name) for name in self.__arrayNames()}
+        oldOwners = self.__owners
+        oldCapacity = self.__capacity
+        capacity = oldCapacity * 2
+        self.__allocate(capacity)
+        for name, array in old.items():
+            if array.ndim == 2:
+                grown = np.zeros((capacity, array.shape[1]), dtype=array.dtype)
+            else:
+                grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:oldCapacity] = array
+            setattr(self, name, grown)
+        self.__owners[:oldCapacity] = oldOwners
+        logging.debug(f"EnemyStore grown to {capacity} slots.")
+
+    # noinspection PyMethodMayBeStatic
+    def __arrayNames(self):
+        return ("active", "distance", "speed", "health", "maxHealth", "posX", "posY", "prevX", "prevY",
+                "slowTotal", "effectClock", "slowMultiplier", "slowExpires", "dotDamage", "dotExpires", "dotNextTick")
+
+    def __addColumn(self, names: tuple[str, ...]) -> int:
+        for name in names:
+            array = getattr(self, name)
+            setattr(self, name, np.hstack((array, np.zeros((self.__capacity, 1), dtype=array.dtype))))
+        return getattr(self, names[0]).shape[1] - 1
+
+    def __getSlowColumn(self, key: str) -> int:
+        column = self.__slowColumns.get(key)
+        if column is None:
+            column = self.__addColumn(("slowMultiplier", "slowExpires"))
+            self.__slowColumns[key] = column
+        return column
+
+    def __getDotColumn(self, effectType: str, source: str) -> int:
+        key = (effectType, source)
+        column = self.__dotColumns.get(key)
+        if column is None:
+            column = self.__addColumn(("dotDamage", "dotExpires", "dotNextTick"))
+            self.__dotColumns[key] = column
+            self.__dotColumnKinds.append((column, DOT_KINDS.get(effectType, 0)))
+        return column
+
+    def add(self, owner, speed: float, health: float, distance: float = 0.0) -> int:
+        """
+        Claim a slot for a new enemy and return its index.
+
+        :param distance: Pixels along the path the enemy starts at, 0 being the start of the path
+        """
+        if self.__free:
+            slot = self.__free.pop()
+        else:
+            if self.__size == self.__capacity:
+                self.__grow()
+            slot = self.__size
+            self.__size += 1
+
+        x, y, _ = self.__path.positionAt(distance)
+        self.active[slot] = True
+        self.distance[slot] = distance
+        self.speed[slot] = speed
+        self.health[slot] = health
+        self.maxHealth[slot] = health
+        self.posX[slot] = self.prevX[slot] = x
+        self.posY[slot] = self.prevY[slot] = y
+        self.slowTotal[slot] = 0.0
+        self.effectClock[slot] = 0.0
+        self.__owners[slot] = owner
+        self.__added.append(slot)
+        self.__orderValid = False
+        return slot
+
+    def release(self, slot: int):
+        if not self.active[slot]:
+            return
+        self.active[slot] = False
+        self.speed[slot] = 0.0
+        self.slowTotal[slot] = 0.0
+        self.effectClock[slot] = 0.0
+        self.slowMultiplier[slot] = 0.0
+        self.slowExpires[slot] = 0.0
+        self.dotDamage[slot] = 0.0
+        self.dotExpires[slot] = 0.0
+        self.dotNextTick[slot] = 0.0
+        self.__released.append(self.__owners[slot])
+        self.__owners[slot] = None
+        self.__free.append(slot)
+        self.__orderValid = False
+
+    def getOwner(self, slot: int):
+        return self.__owners[slot]
+
+    def popReleased(self) -> list:
+        """
+        Return the views released since the last call, so they can be handed back to an EnemyPool.
+        """
+        released = self.__released
+        self.__released = []
+        return released
+
+    # An effect is active while it expires after the slot's clock; step() drops the ones that expired
+    def setSlow(self, slot: int, key: str, multiplier: float, durationMs: float):
+        column = self.__getSlowColumn(key)
+        clock = self.effectClock[slot]
+        if self.slowExpires[slot, column] <= clock:
+            self.slowMultiplier[slot, column] = multiplier
+        self.slowExpires[slot, column] = clock + durationMs / 1000
+        self.slowTotal[slot] = self.slowMultiplier[slot].sum()
+
+    def removeSlow(self, slot: int, key: str):
+        column = self.__slowColumns.get(key)
+        if column is None:
+            return
+        self.slowMultiplier[slot, column] = 0.0
+        self.slowExpires[slot, column] = 0.0
+        self.slowTotal[slot] = self.slowMultiplier[slot].sum()
+
+    def getSlow(self, slot: int, key: str) -> float:
+        column = self.__slowColumns.get(key)
+        if column is None or self.slowExpires[slot, column] <= self.effectClock[slot]:
+            raise KeyError(key)
+        return float(self.slowMultiplier[slot, column])
+
+    def applyDot(self, slot: int, effectType: str, source: str, damage: float, durationMs: float):
+        column = self.__getDotColumn(effectType, source)
+        clock = self.effectClock[slot]
+        if self.dotExpires[slot, column] <= clock:
+            self.dotDamage[slot, column] = damage
+            self.dotNextTick[slot, column] = clock + DOT_INTERVAL
+        # Re-applying an active effect only refreshes its duration
+        self.dotExpires[slot, column] = clock + durationMs / 1000
+
+    def damageMany(self, slots, amounts):
+        """
+        Subtract amounts from the health of slots; a slot may appear several times.
+        """
+        np.subtract.at(self.health, slots, amounts)
+
+    def setSlowMany(self, slots, key: str, multiplier: float, durationMs: float):
+        column = self.__getSlowColumn(key)
+        slots = np.unique(slots)
+        clock = self.effectClock[slots]
+        fresh = slots[self.slowExpires[slots, column] <= clock]
+        self.slowMultiplier[fresh, column] = multiplier
+        self.slowExpires[slots, column] = clock + durationMs / 1000
+        self.slowTotal[slots] = self.slowMultiplier[slots].sum(axis=1)
+
+    def applyDotMany(self, slots, effectType: str, source: str, damage: float, durationMs: float):
+        column = self.__getDotColumn(effectType, source)
+        slots = np.unique(slots)
+        clock = self.effectClock[slots]
+        fresh = self.dotExpires[slots, column] <= clock
+        self.dotDamage[slots[fresh], column] = damage
+        self.dotNextTick[slots[fresh], column] = clock[fresh] + DOT_INTERVAL
+        self.dotExpires[slots, column] = clock + durationMs / 1000
+
+    def getKilled(self, slots):
+        """
+        Return the distinct live slots among slots whose health has dropped to zero or below.
+        """
+        slots = np.unique(slots)
+        return slots[self.active[slots] & (self.health[slots] <= 0)]
+
+    def getDebuffMask(self, slot: int) -> int:
+        """
+        Return the active debuff kinds of a slot as StatusEffects flags, without building any containers.
+        """
+        mask = SLOW if self.slowTotal[slot] > 0 else 0
+        expires = self.dotExpires[slot]
+        clock = self.effectClock[slot]
+        for column, kind in self.__dotColumnKinds:
+            if expires[column] > clock:
+                mask |= kind
+        return mask
+
+    def getDebuffs(self, slot: int) -> list[dict]:
+        debuffs = []
+        clock = float(self.effectClock[slot])
+        for key, column in self.__slowColumns.items():
+            if self.slowExpires[slot, column] > clock:
+                debuffs.append({
+                    'type': 'speed_reduction',
+                    'source': key,
+                    'multiplier': float(self.slowMultiplier[slot, column]),
+                    'remaining_duration_ms': (float(self.slowExpires[slot, column]) - clock) * 1000
+                })
+        for (effectType, source), column in self.__dotColumns.items():
+            if self.dotExpires[slot, column] > clock:
+                debuffs.append({
+                    'type': effectType,
+                    'source': source,
+                    'damage': float(self.dotDamage[slot, column]),
+                    'remaining_duration_ms': (float(self.dotExpires[slot, column]) - clock) * 1000,
+                    'time_since_last_application_s': DOT_INTERVAL - (float(self.dotNextTick[slot, column]) - clock)
+                })
+        return debuffs
+
+    def step(self, deltaTime: float, timeScale: float = 1.0):
+        """
+        Advance every live enemy by deltaTime in one vectorized pass:
+        effect timers and damage over time, slow aggregation, movement along the path,
+        then death and end-of-path detection.
+
+        :return: Tuple (killed slots, slots that reached the end), both NumPy index arrays
+        """
+        n = self.__size
+        if n == 0:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        active = self.active[:n]
+        clock = self.effectClock[:n]
+        clock += deltaTime
+
+        # Slows: drop the expired ones and re-aggregate the total per enemy
+        if self.__slowColumns:
+            multiplier = self.slowMultiplier[:n]
+            multiplier[self.slowExpires[:n] <= clock[:, None]] = 0.0
+            np.sum(multiplier, axis=1, out=self.slowTotal[:n])
+
+        # Damage over time: an effect ticks every DOT_INTERVAL seconds until it expires,
+        # and not at all in the step it expires in (see StatusEffects.advance)
+        if self.__dotColumns:
+            expires = self.dotExpires[:n]
+            nextTick = self.dotNextTick[:n]
+            lasting = expires > clock[:, None]
+            ticking = lasting & (nextTick <= clock[:, None])
+            while ticking.any():
+                self.health[:n] -= (self.dotDamage[:n] * ticking).sum(axis=1)
+                nextTick[ticking] += DOT_INTERVAL
+                ticking &= nextTick <= clock[:, None]
+            self.dotDamage[:n][~lasting] = 0.0
+
+        # Like Enemy.update, an enemy that got to the end last step leaves now, before moving
+        distance = self.distance[:n]
+        atEnd = distance >= self.__totalLength
+
+        # Movement along the compiled path
+        speedFactor = 1.0 - np.minimum(self.slowTotal[:n], 1.0)
+        distance += self.speed[:n] * speedFactor * (deltaTime * timeScale)
+        self.prevX[:n] = self.posX[:n]
+        self.prevY[:n] = self.posY[:n]
+        self.__positionsAt(distance, self.posX[:n], self.posY[:n])
+        self.__orderValid = False
+
+        killed = active & (self.health[:n] <= 0)
+        reached = active & ~killed & atEnd
+        return np.flatnonzero(killed), np.flatnonzero(reached)
+
+    def __positionsAt(self, distance, outX, outY):
+        segmentCount = len(self.__segmentLengths)
+        if segmentCount == 0:
+            outX[:] = self.__endX
+            outY[:] = self.__endY
+            return
+        segment = np.searchsorted(self.__cumulative, distance, side="right") - 1
+        np.clip(segment, 0, segmentCount - 1, out=segment)
+        lengths = self.__segmentLengths[segment]
+        t = np.divide(distance - self.__cumulative[segment], lengths, out=np.zeros_like(distance), where=lengths > 0)
+        np.clip(t, 0.0, 1.0, out=t)
+        np.multiply(self.__deltaX[segment], t, out=outX)
+        outX += self.__startX[segment]
+        np.multiply(self.__deltaY[segment], t, out=outY)
+        outY += self.__startY[segment]
+
+    def queryRadius(self, x: float, y: float, radius: float) -> list:
+        """
+        Return the owners of every live slot whose position is within radius of (x, y).
+        """
+        n = self.__size
+        dx = self.posX[:n] - x
+        dy = self.posY[:n] - y
+        inRange = self.active[:n] & (dx * dx + dy * dy <= radius * radius)
+        owners = self.__owners
+        return [owners[slot] for slot in np.flatnonzero(inRange)]
+
+    def getProgressOrder(self):
+        """
+        Return the live slots in progress order, the furthest along first. Slots at the same
+        distance keep their previous order, and new slots go behind the ones already there.
+
+        The order is kept between calls and only re-sorted when movement broke it, e.g. when a
+        slowed enemy was overtaken; NumPy's stable sort is adaptive, so that stays cheap.
+        """
+        self.__repairOrder()
+        return self.__order
+
+    def getProgressKeys(self):
+        """
+        Return the negated distances of the slots in getProgressOrder(), ascending, for np.searchsorted.
+        """
+        self.__repairOrder()
+        return self.__orderKeys
+
+    def __repairOrder(self):
+        if self.__orderValid:
+            return
+        order = self.__order
+        if self.__added:
+            added = np.fromiter(dict.fromkeys(self.__added), dtype=np.intp)
+            self.__added = []
+            # A claimed slot may be a released one that is still in the order
+            fresh = np.zeros(self.__size, dtype=bool)
+            fresh[added] = True
+            order = np.concatenate((order[~fresh[order]], added))
+        order = order[self.active[order]]
+        keys = -self.distance[order]
+        if len(keys) > 1 and (keys[1:] < keys[:-1]).any():
+            sort = np.argsort(keys, kind="stable")
+            order = order[sort]
+            keys = keys[sort]
+            self.__reorders += 1
+        self.__order = order
+        self.__orderKeys = keys
+        self.__orderValid = True
+
+    def getCoverageRanges(self, intervals: tuple[tuple[float, float], ...]) -> list[tuple[int, int]]:
+        """
+        Return the (first, last) position ranges of getProgressOrder() within each coverage interval,
+        the furthest along first, leaving out the empty ones.
+        """
+        keys = self.getProgressKeys()
+        ranges = []
+        for start, end in reversed(intervals):
+            first = int(np.searchsorted(keys, -end, side="left"))
+            last = int(np.searchsorted(keys, -start, side="right"))
+            if first < last:
+                ranges.append((first, last))
+        return ranges
+
+    def queryCoverage(self, coverage: 'PathCoverage') -> list:
+        """
+        Return the owners of every live slot whose travelled distance lies in the coverage intervals,
+        the furthest along first.
+        """
+        order = self.getProgressOrder()
+        owners = self.__owners
+        found = []
+        for first, last in self.getCoverageRanges(coverage.getIntervals()):
+            found.extend(owners[slot] for slot in order[first:last].tolist())
+        return found
+
+    def getOccupiedBuckets(self, bucketSize: float) -> set[int]:
+        """
+        Return the stretches of path (distance // bucketSize) holding at least one live enemy.
+        Distances past the end of the path count as the end, like PathCoverage.getBuckets.
+        """
+        n = self.__size
+        active = self.active[:n]
+        if not active.any():
+            return set()
+        distance = np.minimum(self.distance[:n][active], self.__totalLength)
+        # Deduplicate in NumPy first, there are far fewer buckets than enemies
+        return set(np.unique((distance // bucketSize).astype(np.int64)).tolist())
+
+    def getTotalLength(self) -> float:
+        return self.__totalLength
+
+    def getSize(self) -> int:
+        return self.__size
+
+    def getReorders(self) -> int:
+        """
+        Return how many times the progress order had to be re-sorted because enemies overtook each other.
+        """
+        return self.__reorders
+
+    def __len__(self) -> int:
+        return int(self.active[:self.__size].sum())
+
+    @staticmethod
+    def isAvailable() -> bool:
+        return np is not None
@@ -0,0 +1,79 @@
+EMPTY = 0
+PATH = 1
+HUD = 2
+TOWER = 3
+OUT_OF_BOUNDS = 4
+
+
+class OccupancyGrid:
+    def __init__(self, columns: int, rows: int, gridSize: int):
+        """
+        What occupies each cell of a stage (nothing, the path, the HUD or a tower), one byte per cell,
+        so placement checks are a single index instead of a search through the path or the towers.
+
+        :param columns: Number of cells across the screen
+        :param rows: Number of cells down the screen
+        :param gridSize: Size of a cell in pixels
+        """
+        self.__columns = columns
+        self.__rows = rows
+        self.__gridSize = gridSize
+        self.__cells = bytearray(columns * rows)
+
+    def copy(self) -> 'OccupancyGrid':
+        """
+        Return an independent grid with the same cells, e.g. the stage's static cells for a new run.
+        """
+        grid = OccupancyGrid(self.__columns, self.__rows, self.__gridSize)
+        grid.__cells[:] = self.__cells
+        return grid
+
+    def cellAt(self, position: tuple[float, float]) -> tuple[int, int]:
+        """
+        Return the cell containing a pixel position.
+        """
+        return int(position[0] // self.__gridSize), int(position[1] // self.__gridSize)
+
+    def getState(self, x: int, y: int) -> int:
+        if 0 <= x < self.__columns and 0 <= y < self.__rows:
+            return self.__cells[y * self.__columns + x]
+        return OUT_OF_BOUNDS
+
+    def isBuildable(self, x: int, y: int) -> bool:
+        return self.getState(x, y) == EMPTY
+
+    def mark(self, x: int, y: int, state: int):
+        """
+        Set the state of a cell. Cells outside the grid are ignored.
+        """
+        if 0 <= x < self.__columns and 0 <= y < self.__rows:
+            self.__cells[y * self.__columns + x] = state
+
+    def markAll(self, cells, state: int):
+        for x, y in cells:
+            self.mark(x, y, state)
+
+    def markRows(self, firstRow: int, count: int, state: int):
+        for y in range(firstRow, min(firstRow + count, self.__rows)):
+            start = y * self.__columns
+            self.__cells[start:start + self.__columns] = bytes([state]) * self.__columns
+
+    def getBuildableCells(self) -> list[tuple[int, int]]:
+        """
+        Return every cell a tower can currently be placed on, in row order.
+        """
+        columns = self.__columns
+        cells = self.__cells
+        return [(index % columns, index // columns) for index in range(len(cells)) if cells[index] == EMPTY]
+
+    def countBuildable(self) -> int:
+        return self.__cells.count(EMPTY)
+
+    def getColumns(self) -> int:
+        return self.__columns
+
+    def getRows(self) -> int:
+        return self.__rows
+
+    def getGridSize(self) -> int:
+        return self.__gridSize
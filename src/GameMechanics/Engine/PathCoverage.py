@@ -0,0 +1,66 @@
+import bisect
+import math
+from typing import Iterator
+
+
+class PathCoverage:
+    def __init__(self, intervals: tuple[tuple[float, float], ...], pathLength: float):
+        """
+        The stretches of the walk path within a tower's range, as sorted, disjoint (start, end)
+        intervals of travelled distance. Enemies only move along the path, so an enemy is in
+        range exactly when its distance lies in one of the intervals.
+
+        An interval reaching the end of the path is open-ended (end = inf), since enemies that
+        went past the end are still drawn at the last waypoint.
+
+        :param intervals: Intervals as built by CompiledPath.getCoverage
+        :param pathLength: Total length of the path in pixels
+        """
+        self.__intervals = intervals
+        self.__starts = [start for start, _ in intervals]
+        self.__pathLength = pathLength
+        self.__buckets: dict[float, tuple[int, ...]] = {}
+
+    def contains(self, distance: float) -> bool:
+        index = bisect.bisect_right(self.__starts, distance) - 1
+        return index >= 0 and distance <= self.__intervals[index][1]
+
+    def getIntervals(self) -> tuple[tuple[float, float], ...]:
+        return self.__intervals
+
+    def getBuckets(self, size: float) -> tuple[int, ...]:
+        """
+        Return the indices of the size-pixel stretches of path (distance // size) the intervals overlap.
+        """
+        buckets = self.__buckets.get(size)
+        if buckets is None:
+            found = []
+            for start, end in self.__intervals:
+                first = math.floor(max(start, 0.0) / size)
+                last = math.floor(min(end, self.__pathLength) / size)
+                # Intervals are disjoint but can share a bucket
+                if found and found[-1] >= first:
+                    first = found[-1] + 1
+                found.extend(range(first, last + 1))
+            buckets = tuple(found)
+            self.__buckets[size] = buckets
+        return buckets
+
+    def getSamples(self, spacing: float) -> Iterator[int]:
+        """
+        Yield the indices i of the path samples at distance i * spacing that lie in the intervals.
+        """
+        for start, end in self.__intervals:
+            yield from range(math.ceil(max(start, 0.0) / spacing), math.floor(min(end, self.__pathLength) / spacing) + 1)
+
+    def getPathLength(self) -> float:
+        return self.__pathLength
+
+    def getCoveredLength(self) -> float:
+        """
+        Return how many pixels of the path are in range.
+        """
+        return sum(min(end, self.__pathLength) - start for start, end in self.__intervals)
+
+    def isEmpty(self) -> bool:
+        return not self.__intervals
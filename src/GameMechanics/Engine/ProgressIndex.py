@@ -0,0 +1,305 @@
+import bisect
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.GameMechanics.Engine.PathCoverage import PathCoverage
+    from src.GameMechanics.Entities.Enemy import Enemy
+
+
+class ProgressIndex:
+    COMPACT_MIN = 64  # Dead entries tolerated before compacting, besides a quarter of the entries
+
+    def __init__(self, pathLength: float):
+        """
+        Live enemies kept in progress order, the furthest along first, for the sprite enemy engine.
+
+        Enemies mostly keep their order along the path, so after each step the order is patched
+        with an insertion sort, which only does work for the enemies that overtook another
+        (e.g. because the one ahead was slowed). New enemies usually start at distance 0 and are appended.
+        Dead enemies leave an empty entry behind, and the entries are only compacted once enough are empty.
+
+        Two segment trees over the order answer the lowest and highest health in any range. They
+        are built once a tower asks for health, then kept up to date across steps: health changes
+        come in through updateHealth(), and only the positions an overtake shifted are rewritten.
+
+        A tower's coverage is a few ranges of this order, so first and last enemy in range are a
+        binary search away, and lowest or highest health a tree query, O(log n) per tower.
+        Health ties go to the enemy furthest along, as in TargetingKernel.
+
+        :param pathLength: Total length of the path in pixels; distances past it count as the end
+        """
+        self.__pathLength = pathLength
+        self.__enemies: list['Enemy | None'] = []  # None for dead enemies not compacted yet
+        self.__keys: list[float] = []        # Negated distances, ascending, so bisect works on them
+        self.__health: list[float] = []
+        self.__positions: dict['Enemy', int] = {}
+        self.__dead = 0
+        self.__capacity = 1
+        self.__lowest = [-1, -1]             # Segment trees of positions, leaves at capacity + position
+        self.__highest = [-1, -1]
+        self.__treesValid = False
+        self.__overtakes = 0
+
+    def add(self, enemy: 'Enemy'):
+        """
+        Insert a newly spawned enemy. It usually starts at the beginning of the path and is appended,
+        but an enemy spawned ahead (see WaveManager's catch-up) is placed by its distance.
+        """
+        key = -min(enemy.getDistance(), self.__pathLength)
+        enemies = self.__enemies
+        if enemies and key < self.__keys[-1]:
+            # Behind everyone at the same distance, like an appended enemy
+            position = bisect.bisect_right(self.__keys, key)
+            enemies.insert(position, enemy)
+            self.__keys.insert(position, key)
+            if self.__treesValid:
+                self.__health.insert(position, 0.0)
+            if self.__treesValid and len(enemies) > self.__capacity:
+                self.__rebuildTrees()
+            self.__relocate(range(position, len(enemies)))
+            return
+        position = len(enemies)
+        enemies.append(enemy)
+        self.__keys.append(key)
+        if self.__treesValid:
+            self.__health.append(0.0)
+            if position >= self.__capacity:
+                self.__rebuildTrees()
+        self.__relocate((position,))
+
+    def update(self):
+        """
+        Drop dead enemies, re-read the distances and restore the progress order. Call after every step.
+        """
+        pathLength = self.__pathLength
+        enemies = self.__enemies
+        keys = self.__keys
+        changed = []
+        for position, enemy in enumerate(enemies):
+            if enemy is None:
+                continue
+            if not enemy.alive():
+                # Keeps its key, so the order stays sorted, until the entries are compacted
+                enemies[position] = None
+                del self.__positions[enemy]
+                self.__dead += 1
+                changed.append(position)
+                continue
+            distance = enemy.getDistance()
+            keys[position] = -distance if distance < pathLength else -pathLength
+        if self.__dead > self.COMPACT_MIN + len(enemies) // 4:
+            self.__compact()
+            enemies = self.__enemies
+            keys = self.__keys
+            changed = []
+
+        for i in range(1, len(keys)):
+            key = keys[i]
+            if key >= keys[i - 1]:
+                continue
+            # Overtook the enemy ahead: move back to the front past everyone it passed
+            enemy = enemies[i]
+            j = i - 1
+            while j >= 0 and keys[j] > key:
+                keys[j + 1] = keys[j]
+                enemies[j + 1] = enemies[j]
+                j -= 1
+            keys[j + 1] = key
+            enemies[j + 1] = enemy
+            self.__overtakes += i - 1 - j
+            changed.extend(range(j + 1, i + 1))
+        if changed:
+            self.__relocate(changed)
+
+    def updateHealth(self, enemy: 'Enemy'):
+        """
+        Record a health change of an indexed enemy. Dead enemies leave the health trees at once.
+        """
+        if not self.__treesValid:
+            return
+        position = self.__positions.get(enemy)
+        if position is None:
+            return
+        self.__health[position] = enemy.getHealth()
+        self.__setLeaf(position, position if enemy.isAlive() else -1)
+
+    def __relocate(self, changed):
+        # Record the enemies now at the changed positions in the position map and, once built, the health trees
+        enemies = self.__enemies
+        positions = self.__positions
+        for position in changed:
+            enemy = enemies[position]
+            if enemy is not None:
+                positions[enemy] = position
+        if not self.__treesValid:
+            return
+        health = self.__health
+        capacity = self.__capacity
+        leaves = set()
+        for position in changed:
+            enemy = enemies[position]
+            alive = enemy is not None and enemy.isAlive()
+            health[position] = enemy.getHealth() if alive else 0.0
+            leaves.add((position, position if alive else -1))
+        for lowest, tree in ((True, self.__lowest), (False, self.__highest)):
+            nodes = set()
+            for position, value in leaves:
+                tree[capacity + position] = value
+                nodes.add((capacity + position) // 2)
+            # Each ancestor once, level by level, however many of its leaves changed
+            while nodes:
+                for node in nodes:
+                    tree[node] = self.__better(lowest, tree[2 * node], tree[2 * node + 1])
+                nodes = {node // 2 for node in nodes if node > 1}
+
+    def __compact(self):
+        live = [position for position, enemy in enumerate(self.__enemies) if enemy is not None]
+        self.__enemies = [self.__enemies[position] for position in live]
+        self.__keys = [self.__keys[position] for position in live]
+        self.__positions = {enemy: position for position, enemy in enumerate(self.__enemies)}
+        self.__dead = 0
+        if self.__treesValid:
+            self.__rebuildTrees()
+
+    def queryCoverage(self, coverage: 'PathCoverage') -> list:
+        """
+        Return the live enemies whose distance lies in the coverage, the furthest along first.
+        """
+        enemies = self.__enemies
+        found = []
+        for start, end in self.__getRanges(coverage):
+            found.extend(enemy for enemy in enemies[start:end] if enemy is not None and enemy.alive())
+        return found
+
+    def selectTarget(self, coverage: 'PathCoverage', priority: str):
+        """
+        Return the enemy a tower with the given coverage and attack priority should attack, or None.
+        """
+        enemies = self.__enemies
+        ranges = self.__getRanges(coverage)
+        if priority == "last_enemy":
+            for start, end in reversed(ranges):
+                for position in range(end - 1, start - 1, -1):
+                    if enemies[position] is not None and enemies[position].alive():
+                        return enemies[position]
+            return None
+        if priority == "lowest_health" or priority == "highest_health":
+            lowest = priority == "lowest_health"
+            if not self.__treesValid:
+                self.__rebuildTrees()
+            best = -1
+            for start, end in ranges:
+                best = self.__better(lowest, best, self.__queryTree(lowest, start, end))
+            return enemies[best] if best >= 0 else None
+        if priority == "random":
+            candidates = self.queryCoverage(coverage)
+            return random.choice(candidates) if candidates else None
+        # first_enemy, and the fallback for unknown priorities
+        for start, end in ranges:
+            for position in range(start, end):
+                if enemies[position] is not None and enemies[position].alive():
+                    return enemies[position]
+        return None
+
+    def getOccupiedBuckets(self, size: float) -> set[int]:
+        """
+        Return the stretches of path (distance // size) holding at least one enemy,
+        jumping from bucket to bucket through the sorted distances.
+        """
+        keys = self.__keys
+        enemies = self.__enemies
+        buckets = set()
+        position = 0
+        while position < len(keys):
+            if enemies[position] is None:
+                position += 1
+                continue
+            bucket = int(-keys[position] // size)
+            buckets.add(bucket)
+            # Skip to the first enemy before the bucket's start
+            position = bisect.bisect_right(keys, -bucket * size, position)
+        return buckets
+
+    def __getRanges(self, coverage: 'PathCoverage') -> list[tuple[int, int]]:
+        # Position ranges of the coverage intervals, the furthest along (the last interval) first
+        keys = self.__keys
+        ranges = []
+        for start, end in reversed(coverage.getIntervals()):
+            first = bisect.bisect_left(keys, -end)
+            last = bisect.bisect_right(keys, -start)
+            if first < last:
+                ranges.append((first, last))
+        return ranges
+
+    def __better(self, lowest: bool, a: int, b: int) -> int:
+        # The position with the lower (or higher) health, or the one further along on a tie; -1 is empty
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        healthA, healthB = self.__health[a], self.__health[b]
+        if healthA == healthB:
+            return min(a, b)
+        if lowest:
+            return a if healthA < healthB else b
+        return a if healthA > healthB else b
+
+    def __setLeaf(self, position: int, value: int):
+        for lowest, tree in ((True, self.__lowest), (False, self.__highest)):
+            node = self.__capacity + position
+            tree[node] = value
+            node //= 2
+            while node:
+                tree[node] = self.__better(lowest, tree[2 * node], tree[2 * node + 1])
+                node //= 2
+
+    def __rebuildTrees(self):
+        count = len(self.__enemies)
+        capacity = self.__capacity
+        while capacity < count:
+            capacity *= 2
+        self.__capacity = capacity
+        alive = [enemy is not None and enemy.isAlive() for enemy in self.__enemies]
+        self.__health = [enemy.getHealth() if isAlive else 0.0 for enemy, isAlive in zip(self.__enemies, alive)]
+        leaves = [position if isAlive else -1 for position, isAlive in enumerate(alive)]
+        leaves.extend([-1] * (capacity - count))
+        self.__lowest = self.__buildTree(True, leaves)
+        self.__highest = self.__buildTree(False, leaves)
+        self.__treesValid = True
+
+    def __buildTree(self, lowest: bool, leaves: list[int]) -> list[int]:
+        capacity = self.__capacity
+        tree = [-1] * capacity + leaves
+        for node in range(capacity - 1, 0, -1):
+            tree[node] = self.__better(lowest, tree[2 * node], tree[2 * node + 1])
+        return tree
+
+    def __queryTree(self, lowest: bool, start: int, end: int) -> int:
+        tree = self.__lowest if lowest else self.__highest
+        best = -1
+        start += self.__capacity
+        end += self.__capacity
+        while start < end:
+            if start & 1:
+                best = self.__better(lowest, best, tree[start])
+                start += 1
+            if end & 1:
+                end -= 1
+                best = self.__better(lowest, best, tree[end])
+            start //= 2
+            end //= 2
+        return best
+
+    def getStats(self) -> dict:
+        """
+        Return the number of indexed enemies, the empty entries left by dead ones
+        and the overtakes patched since the index was created.
+        """
+        return {"enemies": len(self), "dead": self.__dead, "overtakes": self.__overtakes}
+
+    def __len__(self) -> int:
+        return len(self.__enemies) - self.__dead
+
+    def __iter__(self):
+        return iter([enemy for enemy in self.__enemies if enemy is not None])
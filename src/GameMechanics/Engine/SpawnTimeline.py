@@ -0,0 +1,76 @@
+import math
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.GameMechanics.Configs.ConfigRecords import WaveDefinition
+
+
+class SpawnTimeline:
+    EPSILON = 1e-9  # Slack on spawn times, so summed frame times do not push a spawn to the next frame
+
+    def __init__(self, wave: 'WaveDefinition', rng: random.Random | None = None):
+        """
+        The spawns of a wave, compiled when the wave starts.
+
+        Each spawn group spawns one enemy every spawnRate seconds after its delay, so how many of
+        its enemies are due at any time is a division, and a step takes all of them at once,
+        however long it was. The groups run in parallel and their spawns are merged by time.
+
+        The spawn order within a group is a shuffle of its enemies, drawn one swap per spawn
+        (Fisher-Yates) so that starting a wave of tens of thousands of enemies does not stall a frame.
+
+        :param wave: The wave to spawn
+        :param rng: Random generator for the shuffle, the random module by default
+        """
+        self.__rng = rng or random
+        self.__groups = []  # [delay, spawn rate, enemy types, spawned count] per group
+        for group in wave.groups:
+            types = []
+            for enemyType, count in group.enemies:
+                types.extend([enemyType] * count)
+            self.__groups.append([group.delay, group.spawnRate, types, 0])
+        self.__total = sum(len(types) for _, _, types, _ in self.__groups)
+        self.__spawned = 0
+        self.__clock = 0.0
+
+    def advance(self, deltaTime: float) -> list[tuple[str, float]]:
+        """
+        Advance the wave clock and return the spawns that came due, the earliest first,
+        as (enemy type, seconds since it was due) pairs.
+        """
+        self.__clock += deltaTime
+        clock = self.__clock
+        randrange = self.__rng.randrange
+        due = []
+        merge = False
+        for index, group in enumerate(self.__groups):
+            delay, spawnRate, types, start = group
+            count = len(types)
+            if start >= count:
+                continue
+            end = min(count, math.floor((clock - delay + self.EPSILON) / spawnRate))
+            if end <= start:
+                continue
+            merge = merge or bool(due)
+            for spawn in range(start, end):
+                pick = randrange(spawn, count)
+                types[spawn], types[pick] = types[pick], types[spawn]
+                due.append((delay + spawnRate * (spawn + 1), index, types[spawn]))
+            group[3] = end
+            self.__spawned += end - start
+        if merge:
+            due.sort()
+        return [(enemyType, max(clock - time, 0.0)) for time, _, enemyType in due]
+
+    def getClock(self) -> float:
+        return self.__clock
+
+    def getRemaining(self) -> int:
+        return self.__total - self.__spawned
+
+    def isFinished(self) -> bool:
+        return self.__spawned >= self.__total
+
+    def __len__(self) -> int:
+        return self.__total
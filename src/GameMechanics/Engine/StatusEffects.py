@@ -0,0 +1,168 @@
+import heapq
+from typing import Iterator
+
+# Effect kinds, usable as bit flags in a debuff mask
+SLOW = 1
+BLEEDING = 2
+BURNING = 4
+
+# Names used by getDebuffs() and the tower debuff configuration
+KIND_NAMES = {SLOW: 'speed_reduction', BLEEDING: 'bleeding', BURNING: 'burning'}
+DOT_KINDS = {'bleeding': BLEEDING, 'burning': BURNING}
+
+DOT_INTERVAL = 0.5  # Seconds between two damage-over-time ticks
+
+
+class StatusEffect:
+    __slots__ = ("kind", "source", "value", "expiresAt", "nextTick", "due")
+
+    def __init__(self, kind: int, source: str, value: float, expiresAt: float, nextTick: float):
+        """
+        One active effect on an enemy. Times are in seconds on the owning StatusEffects clock.
+
+        :param kind: SLOW, BLEEDING or BURNING
+        :param source: Tower type (or slow key) that applied the effect
+        :param value: Slow multiplier, or damage per tick for damage over time
+        """
+        self.kind = kind
+        self.source = source
+        self.value = value
+        self.expiresAt = expiresAt
+        self.nextTick = nextTick
+        self.due = -1.0  # Time of the live timer entry, -1 once the effect is removed
+
+    def getRemainingMs(self, clock: float) -> float:
+        return max(self.expiresAt - clock, 0.0) * 1000
+
+    def getTimeSinceTick(self, clock: float) -> float:
+        return DOT_INTERVAL - (self.nextTick - clock)
+
+
+class StatusEffects:
+    __slots__ = ("__effects", "__timers", "__clock", "__sequence", "__slowTotal", "__mask")
+
+    def __init__(self):
+        """
+        Slows and damage over time on one enemy. Effects are found by (kind, source) in a dict,
+        and expiries and ticks wait in a heap so advance() only touches effects that are due.
+        The slow total and the debuff mask are kept up to date when effects change.
+        """
+        self.__effects: dict[tuple[int, str], StatusEffect] = {}
+        self.__timers: list[tuple[float, int, StatusEffect]] = []
+        self.__clock = 0.0
+        self.__sequence = 0
+        self.__slowTotal = 0.0
+        self.__mask = 0
+
+    def clear(self):
+        self.__effects.clear()
+        self.__timers.clear()
+        self.__clock = 0.0
+        self.__slowTotal = 0.0
+        self.__mask = 0
+
+    def setSlow(self, source: str, multiplier: float, durationMs: float):
+        """
+        Apply a slow; re-applying an active slow from the same source only refreshes its duration.
+        """
+        effect = self.__effects.get((SLOW, source))
+        expiresAt = self.__clock + durationMs / 1000
+        if effect is not None:
+            effect.expiresAt = expiresAt
+            self.__schedule(effect)
+            return
+        effect = StatusEffect(SLOW, source, multiplier, expiresAt, expiresAt)
+        self.__add(effect)
+
+    def applyDot(self, kind: int, source: str, damage: float, durationMs: float):
+        """
+        Apply damage over time; re-applying an active effect from the same source only refreshes its duration.
+
+        :param kind: BLEEDING or BURNING
+        """
+        effect = self.__effects.get((kind, source))
+        expiresAt = self.__clock + durationMs / 1000
+        if effect is not None:
+            effect.expiresAt = expiresAt
+            self.__schedule(effect)
+            return
+        effect = StatusEffect(kind, source, damage, expiresAt, self.__clock + DOT_INTERVAL)
+        self.__add(effect)
+
+    def removeSlow(self, source: str):
+        effect = self.__effects.get((SLOW, source))
+        if effect is not None:
+            self.__remove(effect)
+
+    def getSlow(self, source: str) -> float:
+        return self.__effects[(SLOW, source)].value
+
+    def advance(self, deltaTime: float) -> float:
+        """
+        Move the clock forward, expire effects and return the damage-over-time damage dealt.
+        An effect that expires during the step does not tick in it.
+        """
+        self.__clock += deltaTime
+        clock = self.__clock
+        timers = self.__timers
+        damage = 0.0
+        while timers and timers[0][0] <= clock:
+            due, _, effect = heapq.heappop(timers)
+            if effect.due != due:
+                continue  # Rescheduled or removed since this entry was pushed
+            if effect.expiresAt <= clock:
+                self.__remove(effect)
+                continue
+            damage += effect.value
+            effect.nextTick += DOT_INTERVAL
+            self.__schedule(effect)
+        return damage
+
+    def getSlowTotal(self) -> float:
+        return self.__slowTotal
+
+    def getMask(self) -> int:
+        """
+        Return the kinds of the active effects OR-ed together, e.g. SLOW | BURNING.
+        """
+        return self.__mask
+
+    def getClock(self) -> float:
+        return self.__clock
+
+    def __add(self, effect: StatusEffect):
+        self.__effects[(effect.kind, effect.source)] = effect
+        self.__schedule(effect)
+        self.__refresh()
+
+    def __remove(self, effect: StatusEffect):
+        effect.due = -1.0
+        del self.__effects[(effect.kind, effect.source)]
+        self.__refresh()
+
+    def __schedule(self, effect: StatusEffect):
+        due = effect.expiresAt if effect.kind == SLOW else min(effect.nextTick, effect.expiresAt)
+        if due == effect.due:
+            return
+        effect.due = due
+        self.__sequence += 1
+        heapq.heappush(self.__timers, (due, self.__sequence, effect))
+
+    def __refresh(self):
+        slowTotal = 0.0
+        mask = 0
+        for effect in self.__effects.values():
+            mask |= effect.kind
+            if effect.kind == SLOW:
+                slowTotal += effect.value
+        self.__slowTotal = slowTotal
+        self.__mask = mask
+
+    def __iter__(self) -> Iterator[StatusEffect]:
+        return iter(self.__effects.values())
+
+    def __len__(self) -> int:
+        return len(self.__effects)
+
+    def __bool__(self) -> bool:
+        return bool(self.__effects)
@@ -0,0 +1,194 @@
+try:
+    import numpy as np
+except ImportError:  # Only used together with EnemyStore, which requires NumPy
+    np = None
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.Scenes.GameScene import GameScene
+    from src.GameMechanics.Engine.EnemyStore import EnemyStore
+    from src.GameMechanics.Entities.Tower import Tower
+
+
+class TargetingKernel:
+    PRIORITIES = ("first_enemy", "last_enemy", "lowest_health", "highest_health", "random")
+
+    def __init__(self, gameScene: 'GameScene', store: 'EnemyStore'):
+        """
+        Batched targeting for the numpy enemy engine. Every ready tower's coverage (see PathCoverage)
+        is turned into ranges of the store's progress order with one searchsorted call, so the first
+        and last enemy in range are read off the range ends, and the lowest and highest health come
+        from a sparse table over the order in O(1) per range. Damage and debuffs are then applied in bulk.
+
+        All towers of a pass target the same snapshot, so two towers may shoot at an enemy
+        the first one already killed. Health ties go to the enemy furthest along.
+        """
+        self.__gameScene = gameScene
+        self.__store = store
+        self.__rng = np.random.default_rng()
+
+    def resolve(self, towers: list['Tower']) -> list['Tower']:
+        """
+        Let every given tower attack and return the ones that had a target.
+        """
+        store = self.__store
+        if not towers or store.getSize() == 0:
+            return []
+        order = store.getProgressOrder()
+        if len(order) == 0:
+            return []
+
+        first, last = self.__coverageRanges(towers, store.getProgressKeys())
+        counts = np.maximum(last - first, 0)
+        hasTarget = counts.sum(axis=1) > 0
+        targets = self.__pickTargets(towers, order, first, last, counts, hasTarget)
+
+        hitSlots = []
+        hitDamage = []
+        fired = []
+        for row, tower in enumerate(towers):
+            if not hasTarget[row]:
+                continue
+            if tower.getAttackType() == "around":
+                slots = np.concatenate([order[start:end] for start, end in zip(first[row], last[row]) if start < end])
+            else:
+                slots = targets[row:row + 1]
+                if tower.getAttackType() == "AOE":
+                    self.__addBlast(tower, int(slots[0]), store.getSize(), hitSlots, hitDamage)
+            hitSlots.append(slots)
+            hitDamage.append(np.full(len(slots), tower.getDamage(), dtype=np.float64))
+            self.__applyDebuffs(tower, slots)
+            fired.append(tower)
+
+        if not hitSlots:
+            return fired
+        slots = np.concatenate(hitSlots)
+        store.damageMany(slots, np.concatenate(hitDamage))
+        for slot in store.getKilled(slots):
+            store.getOwner(slot).killEnemy()
+        return fired
+
+    # noinspection PyMethodMayBeStatic
+    def __coverageRanges(self, towers: list['Tower'], keys):
+        """
+        Return the (first, last) position arrays, towers x intervals, of the progress order ranges
+        inside each coverage interval. Intervals are padded to the same count with empty ones.
+        """
+        intervals = [tower.getCoverage().getIntervals() for tower in towers]
+        width = max(1, max(len(towerIntervals) for towerIntervals in intervals))
+        starts = np.full((len(towers), width), np.inf)
+        ends = np.full((len(towers), width), -np.inf)
+        for row, towerIntervals in enumerate(intervals):
+            for column, (start, end) in enumerate(towerIntervals):
+                starts[row, column] = start
+                ends[row, column] = end
+        # keys are negated distances, so an interval [start, end] is the key range [-end, -start]
+        first = np.searchsorted(keys, -ends, side="left")
+        last = np.searchsorted(keys, -starts, side="right")
+        return first, last
+
+    def __pickTargets(self, towers: list['Tower'], order, first, last, counts, hasTarget):
+        """
+        Return the target slot of every tower row, chosen per attack priority, or the sticky
+        target of towers that keep theirs. Rows without a target hold -1.
+        """
+        size = len(order)
+        positions = np.full(len(towers), -1, dtype=np.intp)
+        priorities = np.asarray([tower.getAttackPriority() for tower in towers], dtype=object)
+        priorities[~np.isin(priorities, self.PRIORITIES)] = "first_enemy"
+        nonEmpty = counts > 0
+
+        rows = hasTarget & (priorities == "first_enemy")
+        if rows.any():
+            positions[rows] = np.where(nonEmpty[rows], first[rows], size).min(axis=1)
+        rows = hasTarget & (priorities == "last_enemy")
+        if rows.any():
+            positions[rows] = np.where(nonEmpty[rows], last[rows] - 1, -1).max(axis=1)
+        for priority, sign in (("lowest_health", 1.0), ("highest_health", -1.0)):
+            rows = hasTarget & (priorities == priority)
+            if rows.any():
+                values = sign * self.__store.health[order]
+                positions[rows] = self.__rangeArgmin(values, first[rows], last[rows], nonEmpty[rows])
+        rows = hasTarget & (priorities == "random")
+        if rows.any():
+            positions[rows] = self.__randomPositions(first[rows], counts[rows])
+
+        targets = np.where(positions >= 0, order[positions], -1)
+        for row, tower in enumerate(towers):
+            if not hasTarget[row] or not tower.isStickyTarget() or tower.getAttackType() == "around":
+                continue
+            target = tower.getStickyTarget()
+            if target is not None:
+                targets[row] = target.getSlot()
+            else:
+                tower.setStickyTarget(self.__store.getOwner(int(targets[row])))
+        return targets
+
+    # noinspection PyMethodMayBeStatic
+    def __rangeArgmin(self, values, first, last, nonEmpty):
+        """
+        Return, per row, the position of the smallest value over all its [first, last) ranges,
+        the lowest position on a tie. Uses a sparse table: level k holds the best position
+        of every window of 2^k values, so each range is answered by two overlapping windows.
+        """
+        size = len(values)
+        levels = [np.arange(size)]
+        span = 1
+        while span * 2 <= size:
+            previous = levels[-1]
+            left = previous[:size - 2 * span + 1]
+            right = previous[span:span + len(left)]
+            # Windows only grow to the right, so left holds the lower position
+            levels.append(np.where(values[right] < values[left], right, left))
+            span *= 2
+        table = np.zeros((len(levels), size), dtype=np.intp)
+        for level, best in enumerate(levels):
+            table[level, :len(best)] = best
+
+        length = np.where(nonEmpty, last - first, 1)
+        level = np.floor(np.log2(length)).astype(np.intp)
+        start = np.where(nonEmpty, first, 0)
+        left = table[level, start]
+        right = table[level, start + length - (1 << level)]
+        candidates = np.where(values[right] < values[left], right, left)
+
+        candidateValues = np.where(nonEmpty, values[candidates], np.inf)
+        best = candidateValues.min(axis=1, keepdims=True)
+        return np.where(nonEmpty & (candidateValues == best), candidates, size).min(axis=1)
+
+    def __randomPositions(self, first, counts):
+        # A uniformly random position among all the ranges of each row
+        totals = counts.sum(axis=1)
+        picks = np.floor(self.__rng.random(len(totals)) * totals).astype(np.intp)
+        ends = np.cumsum(counts, axis=1)
+        column = (ends <= picks[:, None]).sum(axis=1)
+        rows = np.arange(len(totals))
+        return first[rows, column] + picks - (ends[rows, column] - counts[rows, column])
+
+    def __addBlast(self, tower: 'Tower', target: int, n: int, hitSlots: list, hitDamage: list):
+        store = self.__store
+        radius = tower.getBlastRadiusPixels()
+        dx = store.posX[:n] - store.posX[target]
+        dy = store.posY[:n] - store.posY[target]
+        blast = store.active[:n] & (dx * dx + dy * dy <= radius * radius)
+        blast[target] = False
+        slots = np.flatnonzero(blast)
+        if len(slots) == 0:
+            return
+        hitSlots.append(slots)
+        hitDamage.append(np.full(len(slots), tower.getBlastDamage(), dtype=np.float64))
+        self.__applyDebuffs(tower, slots)
+
+    def __applyDebuffs(self, tower: 'Tower', slots):
+        debuffs = tower.getDebuffs()
+        store = self.__store
+        name = tower.getTowerName()
+        if 'slow_percent' in debuffs and 'slow_duration' in debuffs:
+            store.setSlowMany(slots, f"slow_{name}", debuffs['slow_percent'], debuffs['slow_duration'])
+        if 'bleeding_damage' in debuffs and 'bleeding_duration' in debuffs:
+            store.applyDotMany(slots, 'bleeding', name, debuffs['bleeding_damage'], debuffs['bleeding_duration'])
+        if 'burning_damage' in debuffs and 'burning_duration' in debuffs:
+            store.applyDotMany(slots, 'burning', name, debuffs['burning_damage'], debuffs['burning_duration'])
+        if 'add_gold_amount' in debuffs:
+            self.__gameScene.getCurrencyManager().deposit("gold", debuffs['add_gold_amount'] * len(slots))
@@ -0,0 +1,133 @@
+import heapq
+from typing import TYPE_CHECKING, Callable, Collection
+
+if TYPE_CHECKING:
+    from src.GameMechanics.Entities.Tower import Tower
+
+
+class TowerScheduler:
+    EPSILON = 1e-9  # Slack on ready times, so a reload of n steps is not pushed to n + 1 by rounding
+
+    def __init__(self, bucketSize: float):
+        """
+        Decides which towers attack in a simulation step, without visiting the others.
+
+        Towers that are reloading wait in a priority queue keyed by the time they are ready again.
+        A ready tower that found no target goes to sleep, watching the stretches of path its
+        coverage (see PathCoverage) overlaps, and is only woken when an enemy is on one of them.
+        Idle towers therefore cost nothing per step, and the work per step follows the number
+        of towers near enemies.
+
+        :param bucketSize: Length in pixels of the stretches of path enemies are reported in,
+                           see WaveManager.getOccupiedBuckets
+        """
+        self.__bucketSize = bucketSize
+        self.__clock = 0.0
+        self.__queue: list[tuple[float, int, 'Tower']] = []  # (ready time, placement order, tower)
+        self.__order: dict['Tower', int] = {}
+        self.__readyAt: dict['Tower', float] = {}
+        self.__sleeping: dict['Tower', tuple[int, ...]] = {}
+        self.__watchers: dict[int, set['Tower']] = {}
+        self.__stats = {"ready": 0, "woken": 0}
+
+    def add(self, tower: 'Tower'):
+        """
+        Schedule a newly placed tower. It is ready on the next step, like a tower with no cooldown.
+        """
+        self.__order[tower] = len(self.__order)
+        self.__push(tower, self.__clock)
+
+    def tick(self, deltaTime: float, getOccupiedBuckets: Callable[[], Collection[int]]) -> list['Tower']:
+        """
+        Advance the clock and return the towers that are ready to attack, in placement order.
+        Every returned tower must be handed back with reload() or sleep().
+
+        :param getOccupiedBuckets: Returns the stretches of path holding at least one enemy as a set
+                                   or dict keys view; only called while towers sleep
+        """
+        self.__clock += deltaTime
+        if self.__watchers:
+            self.__wake(getOccupiedBuckets())
+
+        ready = []
+        queue = self.__queue
+        limit = self.__clock + self.EPSILON
+        while queue and queue[0][0] <= limit:
+            ready.append(heapq.heappop(queue)[2])
+        if len(ready) > 1:
+            order = self.__order
+            ready.sort(key=order.__getitem__)
+        self.__stats["ready"] += len(ready)
+        return ready
+
+    def reload(self, tower: 'Tower'):
+        """
+        Queue a tower that just attacked until its reload time has passed.
+        """
+        self.__push(tower, self.__clock + tower.getReloadTime())
+
+    def sleep(self, tower: 'Tower'):
+        """
+        Park a ready tower that found no target until an enemy is on a stretch of path it covers.
+        A tower that covers no path at all never wakes up.
+        """
+        buckets = tower.getCoverage().getBuckets(self.__bucketSize)
+        self.__sleeping[tower] = buckets
+        watchers = self.__watchers
+        for bucket in buckets:
+            watchers.setdefault(bucket, set()).add(tower)
+
+    def refresh(self, tower: 'Tower'):
+        """
+        Watch the current coverage of a sleeping tower, e.g. after an upgrade changed its range.
+        Queued towers need nothing, they look for targets with their current coverage when ready.
+        """
+        if tower not in self.__sleeping:
+            return
+        self.__unwatch(tower)
+        self.sleep(tower)
+
+    def __wake(self, occupiedBuckets):
+        watchers = self.__watchers
+        # Visit whichever side is smaller: the watched buckets or the occupied ones
+        if len(watchers) <= len(occupiedBuckets):
+            buckets = [bucket for bucket in watchers if bucket in occupiedBuckets]
+        else:
+            buckets = [bucket for bucket in occupiedBuckets if bucket in watchers]
+        for bucket in buckets:
+            towers = watchers.get(bucket)
+            if not towers:
+                continue
+            for tower in list(towers):
+                self.__unwatch(tower)
+                self.__stats["woken"] += 1
+                # A sleeping tower was already ready when it went to sleep
+                self.__push(tower, self.__readyAt[tower])
+
+    def __unwatch(self, tower: 'Tower'):
+        watchers = self.__watchers
+        for bucket in self.__sleeping.pop(tower):
+            towers = watchers[bucket]
+            towers.discard(tower)
+            if not towers:
+                del watchers[bucket]
+
+    def __push(self, tower: 'Tower', readyAt: float):
+        self.__readyAt[tower] = readyAt
+        heapq.heappush(self.__queue, (readyAt, self.__order[tower], tower))
+
+    def getClock(self) -> float:
+        return self.__clock
+
+    def isSleeping(self, tower: 'Tower') -> bool:
+        return tower in self.__sleeping
+
+    def getStats(self) -> dict:
+        """
+        Return how many towers are queued and asleep, and how many were handed out as ready
+        and woken up since the scheduler was created.
+        """
+        stats = dict(self.__stats)
+        stats["queued"] = len(self.__queue)
+        stats["sleeping"] = len(self.__sleeping)
+        return stats
@@ -0,0 +1,203 @@
+import itertools
+import logging
+from typing import TYPE_CHECKING
+
+import pygame
+
+from src.GameMechanics.Entities.PooledEnemy import PooledEnemy
+from src.GameMechanics.Events.GameEvents import EnemyKilled, EnemyReachedEnd
+
+if TYPE_CHECKING:
+    from src.Scenes.GameScene import GameScene
+    from src.GameMechanics.Engine.EnemyStore import EnemyStore
+
+# Tells apart the enemies a recycled view has been, since slots are reused as well
+_spawnIds = itertools.count(1)
+
+
+class ArrayEnemy(PooledEnemy):
+    __slots__ = ("image", "__main", "__store", "__slot", "__archetype", "__speed", "__reward", "__spawnId", "__final")
+
+    def __init__(self, gameScene: 'GameScene', enemyType: str, store: 'EnemyStore'):
+        """
+        Enemy whose state lives in a slot of an EnemyStore, used by the numpy enemy engine.
+        It exposes the same interface as Enemy so towers and UI can treat both alike.
+        """
+        super().__init__()
+        self.__main = gameScene
+        self.__store = store
+        self.__slot = -1
+        self.__spawnId = 0
+        self.reset(enemyType)
+
+    def reset(self, enemyType: str):
+        """
+        Turn the view into a fresh enemy of the given type. Called when it is taken from an EnemyPool.
+
+        :param enemyType: Enemy type as defined in the enemies configuration
+        """
+        archetype = self.__main.getEnemyConfig().getArchetype(enemyType)
+        self.__archetype = archetype
+        self.__speed = archetype.speed
+        self.__reward = archetype.reward
+        self.__slot = -1
+        self.__final = (0.0, 0.0, 0.0, 0.0)  # Health, distance, x and y when the slot was released
+        self.image = archetype.image
+
+    def spawn(self, distance: float = 0.0):
+        self.__spawnId = next(_spawnIds)
+        self.__slot = self.__store.add(self, self.__speed, self.__archetype.health, distance)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self.image.get_rect(center=self.getPosition())
+
+    def update(self, deltaTime: float):
+        # Movement and effects are stepped for every enemy at once by EnemyStore.step
+        pass
+
+    def draw(self, alpha: float = 1.0):
+        try:
+            x, y = self.getRenderPosition(alpha)
+            return self.__main.getScreen().blit(self.image, (x - self.image.get_width() / 2, y - self.image.get_height() / 2))
+        except Exception as e:
+            logging.error(f"Error drawing enemy: {e}")
+
+    def getRenderPosition(self, alpha: float = 1.0) -> tuple[float, float]:
+        store, slot = self.__store, self.__slot
+        if slot < 0:
+            return self.__final[2], self.__final[3]
+        previousX, previousY = store.prevX[slot], store.prevY[slot]
+        return (
+            previousX + (store.posX[slot] - previousX) * alpha,
+            previousY + (store.posY[slot] - previousY) * alpha
+        )
+
+    def reachEnd(self):
+        self.__release()
+        self.__main.getEventBus().publish(EnemyReachedEnd(self, self.getDamage()))
+
+    def killEnemy(self):
+        self.__main.getEventBus().publish(EnemyKilled(self, self.__reward))
+        self.__release()
+
+    def __release(self):
+        self.kill()
+        store, slot = self.__store, self.__slot
+        # The slot goes to the next enemy, so keep what a view of a dead enemy still reports
+        self.__final = (float(store.health[slot]), float(store.distance[slot]), float(store.posX[slot]), float(store.posY[slot]))
+        store.release(slot)
+        self.__slot = -1
+
+    def applyBleeding(self, damage, duration, tower_type):
+        if not self.alive():
+            return
+        self.__store.applyDot(self.__slot, 'bleeding', tower_type, damage, duration)
+
+    def applyBurning(self, damage, duration, tower_type):
+        if not self.alive():
+            return
+        self.__store.applyDot(self.__slot, 'burning', tower_type, damage, duration)
+
+    def setSpeedMultiplier(self, key: str, multiplier: float, duration_ms: float):
+        if multiplier < 0 or multiplier > 1:
+            raise ValueError("Multiplier should be between 0 and 1.")
+        if not self.alive():
+            return
+        self.__store.setSlow(self.__slot, key, multiplier, duration_ms)
+
+    def getSpeedMultiplier(self, key: str):
+        if self.__slot < 0:
+            raise KeyError(key)
+        return self.__store.getSlow(self.__slot, key)
+
+    def removeSpeedMultiplier(self, key: str):
+        if not self.alive():
+            return
+        self.__store.removeSlow(self.__slot, key)
+
+    def isSlowed(self):
+        return self.__slot >= 0 and self.__store.slowTotal[self.__slot] > 0
+
+    def getTotalSpeedMultiplier(self):
+        if self.__slot < 0:
+            return 0.0
+        return float(self.__store.slowTotal[self.__slot])
+
+    def getDebuffMask(self) -> int:
+        if self.__slot < 0:
+            return 0
+        return self.__store.getDebuffMask(self.__slot)
+
+    def getDebuffs(self):
+        if self.__slot < 0:
+            return []
+        return self.__store.getDebuffs(self.__slot)
+
+    def getSlot(self):
+        return self.__slot
+
+    def getSpawnId(self) -> int:
+        return self.__spawnId
+
+    def getPosition(self):
+        if self.__slot < 0:
+            return pygame.math.Vector2(self.__final[2], self.__final[3])
+        return pygame.math.Vector2(self.__store.posX[self.__slot], self.__store.posY[self.__slot])
+
+    def getRect(self):
+        return self.rect
+
+    def getDamage(self):
+        return self.__archetype.damage
+
+    def getHealth(self):
+        if self.__slot < 0:
+            return self.__final[0]
+        return float(self.__store.health[self.__slot])
+
+    def getMaxHealth(self):
+        return self.__archetype.health
+
+    def getSpeed(self):
+        return self.__speed
+
+    def setSpeed(self, speed: int):
+        self.__speed = speed
+        if self.alive():
+            self.__store.speed[self.__slot] = speed
+
+    def setHealth(self, health: int):
+        if not self.alive():
+            return
+        self.__store.health[self.__slot] = health
+        if health <= 0:
+            self.killEnemy()
+
+    def decreaseHealth(self, damage: int):
+        if not self.alive():
+            return  # The slot may already belong to another enemy
+        self.__store.health[self.__slot] -= damage
+        if self.__store.health[self.__slot] <= 0:
+            self.killEnemy()
+
+    def isAlive(self):
+        return self.alive() and self.__slot >= 0 and self.__store.health[self.__slot] > 0
+
+    def getType(self):
+        return self.__archetype.name
+
+    def setReward(self, reward: int):
+        self.__reward = reward
+
+    def getReward(self):
+        return self.__reward
+
+    def getDistance(self):
+        if self.__slot < 0:
+            return self.__final[1]
+        return float(self.__store.distance[self.__slot])
+
+    def getProgress(self):
+        total = self.__store.getTotalLength()
+        return min(self.getDistance() / total, 1.0) if total > 0 else 1.0
@@ -1,72 +1,71 @@
+import itertools
 import logging
-import os.path
 from typing import TYPE_CHECKING
 
 import pygame
 
-from src.Utils import Events
-from src.Utils.Events import ENEMY_REACHED_END
+from src.GameMechanics.Engine.StatusEffects import StatusEffects, SLOW, BLEEDING, BURNING, KIND_NAMES
+from src.GameMechanics.Entities.PooledEnemy import PooledEnemy
+from src.GameMechanics.Events.GameEvents import EnemyKilled, EnemyReachedEnd
 
 if TYPE_CHECKING:
     from src.Scenes.GameScene import GameScene
 
-class Enemy(pygame.sprite.Sprite):
+# Tells apart the enemies a recycled Enemy instance has been, e.g. for sticky tower targets
+_spawnIds = itertools.count(1)
+
+class Enemy(PooledEnemy):
+    # Instances are recycled through EnemyPool, so keep them small and free of a per-instance __dict__
+    __slots__ = (
+        "image", "rect",
+        "__main", "__path", "__archetype", "__position", "__previousPosition",
+        "__statusEffects", "__distance", "__segment",
+        "__health", "__speed", "__reward", "__spawnId"
+    )
+
     def __init__(self, gameScene: 'GameScene', enemyType: str):
         super().__init__()
-        self.__position = None
         self.__main = gameScene
-        self.__type = enemyType
-        self.__config = gameScene.getEnemyConfig().getConfig()[enemyType]
-        self.__walkPath = gameScene.getStageManager().getStageConfig().getWalkPath()
-        self.__gridSize = gameScene.getStageManager().getStageConfig().getGridSize()
-        self.__speedMultipliers = {}
-        self.__sizeMultiplier = 0.8
-        self.__currentNode = 0
-        self.__maxHealth = 100
-        self.__health = 100
-        self.__damage = 10
-        self.__speed = 100
-        self.__reward = 10
-        self.image = None
-        self.__loadEnemy()
-        self.__total_path_length = self.__calculate_total_path_length()
-        self.__effects = []
-
-    def __loadEnemy(self):
-        if not self.__config:
-            logging.error(f"No configuration found for enemy type '{self.__type}'.")
-            raise ValueError(f"No configuration found for enemy type '{self.__type}'.")
-
-        self.__speed = self.__config.get("speed", 100)
-        self.__damage = self.__config.get("damage", 10)
-        self.__maxHealth = self.__config.get("health", 100)
-        self.__reward = self.__config.get("reward", 10)
-        self.__health = self.__maxHealth
-        self.__loadImage()
-
-    def __loadImage(self):
-        self.__imagePath = os.path.join(self.__main.getProjectRoot(), self.__config["image"])
-        self.__imagePath = os.path.normpath(self.__imagePath)
-        if not os.path.exists(self.__imagePath):
-            raise FileNotFoundError(f"Enemy image not found: {self.__imagePath}")
-        try:
-            self.image = pygame.image.load(self.__imagePath).convert_alpha()
-            grid_size = self.__main.getStageManager().getStageConfig().getGridSize()
-            new_size = int(grid_size * self.__sizeMultiplier)
-            self.image = pygame.transform.scale(self.image, (new_size, new_size))
-            logging.debug(f"Loaded image for '{self.__type}' and scaled to ({new_size}x{new_size}).")
-        except pygame.error as e:
-            raise pygame.error(f"Error loading enemy image '{self.__imagePath}': {e}")
+        self.__path = gameScene.getStageManager().getStageConfig().getCompiledPath()
+        self.__position = pygame.math.Vector2()
+        self.__previousPosition = pygame.math.Vector2()
+        self.__statusEffects = StatusEffects()
+        self.__spawnId = 0
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(enemyType)
+
+    def reset(self, enemyType: str):
+        """
+        Turn the enemy into a fresh enemy of the given type, reusing its containers.
+        Called when the enemy is taken from an EnemyPool.
 
-        self.rect = self.image.get_rect()
+        :param enemyType: Enemy type as defined in the enemies configuration
+        """
+        archetype = self.__main.getEnemyConfig().getArchetype(enemyType)
+        self.__archetype = archetype
+        self.__health = archetype.health
+        self.__speed = archetype.speed
+        self.__reward = archetype.reward
+        self.__distance = 0.0   # Pixels travelled along the path
+        self.__segment = 0      # Path segment the enemy is currently on
+        self.__statusEffects.clear()
+        self.image = archetype.image
+        self.rect.size = archetype.image.get_size()
+
+    def spawn(self, distance: float = 0.0):
+        """
+        Put the enemy on the path.
 
-    def spawn(self):
+        :param distance: Pixels along the path to start at, for an enemy that was due earlier in the frame
+        """
+        self.__spawnId = next(_spawnIds)
         try:
-            x, y = map(int, self.__walkPath[0].split(","))
-            self.__position = pygame.math.Vector2(
-                x * self.__gridSize + (self.__gridSize / 2),
-                y * self.__gridSize + (self.__gridSize / 2)
-            )
+            self.__position.update(self.__path.getWaypoints()[0])
+            if distance > 0:
+                self.__distance = distance
+                x, y, self.__segment = self.__path.positionAt(distance)
+                self.__position.update(x, y)
+            self.__previousPosition.update(self.__position)
             self.rect.center = self.__position
             logging.debug(f"Enemy spawned at {self.__position}.")
         except IndexError:
@@ -77,127 +76,76 @@ class Enemy(pygame.sprite.Sprite):
         if not self.alive():
             return
 
-        # Update speed multipliers durations and remove expired ones
-        self.__update_speed_multipliers(deltaTime)
-        self.__updateEffects(deltaTime)
+        # Remember where the enemy was so draw() can interpolate between simulation steps
+        self.__previousPosition.update(self.__position)
+
+        # Expire effects and apply the damage over time that is due
+        damage = self.__statusEffects.advance(deltaTime)
+        if damage:
+            self.decreaseHealth(damage)
+            if not self.alive():
+                return
 
-        if self.__currentNode >= len(self.__walkPath) - 1:
+        if self.__distance >= self.__path.getTotalLength():
             self.kill()
-            pygame.event.post(pygame.event.Event(ENEMY_REACHED_END, enemy=self))
+            self.__main.getEventBus().publish(EnemyReachedEnd(self, self.getDamage()))
             logging.info("Enemy reached the end.")
             return
 
-        x, y = map(int, self.__walkPath[self.__currentNode + 1].split(","))
-        target = pygame.math.Vector2(
-            x * self.__gridSize + (self.__gridSize / 2),
-            y * self.__gridSize + (self.__gridSize / 2)
-        )
-
-        direction = target - self.__position
-        distance = direction.length()
-
-        if distance == 0:
-            self.__currentNode += 1
-            return
-        direction = direction.normalize()
-
-        # Adjusted speed calculation
-        total_speed_multiplier = sum([effect['multiplier'] for effect in self.__speedMultipliers.values()])
-        total_speed_multiplier = min(total_speed_multiplier, 1)  # Cap at 1.0 (100% slow)
-        speed_multiplier = 1.0 - total_speed_multiplier  # Remaining speed percentage
-        speed_multiplier = max(speed_multiplier, 0.0)  # Ensure speed doesn't go negative
-
-        movement = direction * (self.__speed * speed_multiplier) * (deltaTime * self.__main.getUIManager().pauseUI.getPauseTimeMultiplier())
-        if movement.length() > distance:
-            self.__position = target
-            self.__currentNode += 1
-        else:
-            self.__position += movement
+        speed_multiplier = 1.0 - min(self.__statusEffects.getSlowTotal(), 1.0)  # Cap at 1.0 (100% slow)
+        self.__distance += (self.__speed * speed_multiplier) * (deltaTime * self.__main.getUIManager().pauseUI.getPauseTimeMultiplier())
+        x, y, self.__segment = self.__path.positionAt(self.__distance, self.__segment)
+        self.__position.update(x, y)
 
         self.rect.center = self.__position
 
-    def __update_speed_multipliers(self, deltaTime: float):
-        expired_effects = []
-        for key, effect in self.__speedMultipliers.items():
-            effect['duration'] -= deltaTime * 1000  # Convert deltaTime to milliseconds
-            if effect['duration'] <= 0:
-                expired_effects.append(key)
-        for key in expired_effects:
-            del self.__speedMultipliers[key]
-
-    def __updateEffects(self, deltaTime: float):
-        expired_effects = []
-        for effect in self.__effects:
-            effect['duration'] -= deltaTime * 1000  # Convert deltaTime to milliseconds
-            effect['time_since_last_application'] += deltaTime
-            if effect['duration'] <= 0:
-                expired_effects.append(effect)
-                continue
-            while effect['time_since_last_application'] >= 0.5:
-                self.decreaseHealth(effect['damage'])
-                effect['time_since_last_application'] -= 0.5
-        for effect in expired_effects:
-            self.__effects.remove(effect)
-
     def applyBleeding(self, damage, duration, tower_type):
-        existing_effect = next((e for e in self.__effects if e['type'] == 'bleeding' and e['tower_type'] == tower_type), None)
-        if existing_effect:
-            existing_effect['duration'] = duration
-        else:
-            self.__effects.append({
-                'type': 'bleeding',
-                'tower_type': tower_type,
-                'damage': damage,
-                'duration': duration,
-                'time_since_last_application': 0.0
-            })
+        self.__statusEffects.applyDot(BLEEDING, tower_type, damage, duration)
 
     def applyBurning(self, damage, duration, tower_type):
-        existing_effect = next((e for e in self.__effects if e['type'] == 'burning' and e['tower_type'] == tower_type), None)
-        if existing_effect:
-            existing_effect['duration'] = duration
-        else:
-            self.__effects.append({
-                'type': 'burning',
-                'tower_type': tower_type,
-                'damage': damage,
-                'duration': duration,
-                'time_since_last_application': 0.0
-            })
+        self.__statusEffects.applyDot(BURNING, tower_type, damage, duration)
 
     def setSpeedMultiplier(self, key: str, multiplier: float, duration_ms: float):
         if multiplier < 0 or multiplier > 1:
             raise ValueError("Multiplier should be between 0 and 1.")
-        # If the key already exists, reset the duration
-        if key in self.__speedMultipliers:
-            self.__speedMultipliers[key]['duration'] = duration_ms
-        else:
-            self.__speedMultipliers[key] = {'multiplier': multiplier, 'duration': duration_ms}
+        self.__statusEffects.setSlow(key, multiplier, duration_ms)
 
-    def draw(self):
+    def draw(self, alpha: float = 1.0):
+        """
+        Draw the enemy interpolated between its previous and current simulation position.
+
+        :param alpha: Fraction of a simulation step elapsed since the last update (0..1)
+        :return: The screen rect that was drawn
+        """
         try:
-            # Blit the enemy image onto the screen
-            self.__main.getScreen().blit(self.image, self.rect)
+            x, y = self.getRenderPosition(alpha)
+            return self.__main.getScreen().blit(self.image, (x - self.rect.width / 2, y - self.rect.height / 2))
         except Exception as e:
             logging.error(f"Error drawing enemy: {e}")
 
+    def getRenderPosition(self, alpha: float = 1.0) -> tuple[float, float]:
+        previous = self.__previousPosition
+        current = self.__position
+        return (
+            previous.x + (current.x - previous.x) * alpha,
+            previous.y + (current.y - previous.y) * alpha
+        )
+
     def isSlowed(self):
-        total_speed_multiplier = sum([effect['multiplier'] for effect in self.__speedMultipliers.values()])
-        return total_speed_multiplier > 0
+        return self.__statusEffects.getSlowTotal() > 0
 
     def getTotalSpeedMultiplier(self):
-        return sum([effect['multiplier'] for effect in self.__speedMultipliers.values()])
+        return self.__statusEffects.getSlowTotal()
 
     def getSpeedMultiplier(self, key: str):
-        return self.__speedMultipliers[key]['multiplier']
+        return self.__statusEffects.getSlow(key)
 
     def removeSpeedMultiplier(self, key: str):
-        if key in self.__speedMultipliers:
-            del self.__speedMultipliers[key]
+        self.__statusEffects.removeSlow(key)
 
     def killEnemy(self):
         #self.__main.getStageManager().sound['break'].play()
-        pygame.event.post(pygame.event.Event(Events.ENEMY_KILLED, enemy=self))
+        self.__main.getEventBus().publish(EnemyKilled(self, self.__reward))
         self.kill()
 
     def getPosition(self):
@@ -207,13 +155,13 @@ class Enemy(pygame.sprite.Sprite):
         return self.rect
 
     def getDamage(self):
-        return self.__damage
+        return self.__archetype.damage
 
     def getHealth(self):
         return self.__health
 
     def getMaxHealth(self):
-        return self.__maxHealth
+        return self.__archetype.health
 
     def getSpeed(self):
         return self.__speed
@@ -225,17 +173,19 @@ class Enemy(pygame.sprite.Sprite):
         self.__health = health
         if self.__health <= 0:
             self.killEnemy()
+        self.__main.getWaveManager().getProgressIndex().updateHealth(self)
 
     def decreaseHealth(self, damage: int):
         self.__health -= damage
         if self.__health <= 0:
             self.killEnemy()
+        self.__main.getWaveManager().getProgressIndex().updateHealth(self)
 
     def isAlive(self):
         return self.__health > 0 and self.alive()
 
     def getType(self):
-        return self.__type
+        return self.__archetype.name
 
     def setReward(self, reward: int):
         self.__reward = reward
@@ -243,59 +193,50 @@ class Enemy(pygame.sprite.Sprite):
     def getReward(self):
         return self.__reward
 
-    def __calculate_total_path_length(self):
-        # Calculate the total length of the path for progress calculation
-        total_length = 0
-        for i in range(len(self.__walkPath) - 1):
-            current_node_coords = list(map(int, self.__walkPath[i].split(",")))
-            next_node_coords = list(map(int, self.__walkPath[i + 1].split(",")))
-            current_node = pygame.math.Vector2(current_node_coords[0], current_node_coords[1])
-            next_node = pygame.math.Vector2(next_node_coords[0], next_node_coords[1])
-            total_length += current_node.distance_to(next_node)
-        return total_length
+    def getSpawnId(self) -> int:
+        return self.__spawnId
+
+    def getDistance(self):
+        """
+        Return how many pixels the enemy has travelled along the path.
+        """
+        return self.__distance
 
     def getProgress(self):
-        # Calculate how far the enemy has progressed along the path
-        progress = 0
-        for i in range(self.__currentNode):
-            current_node_coords = list(map(int, self.__walkPath[i].split(",")))
-            next_node_coords = list(map(int, self.__walkPath[i + 1].split(",")))
-            current_node = pygame.math.Vector2(current_node_coords[0], current_node_coords[1])
-            next_node = pygame.math.Vector2(next_node_coords[0], next_node_coords[1])
-            progress += current_node.distance_to(next_node)
-        # Add the distance from current position to next node
-        if self.__currentNode < len(self.__walkPath) - 1:
-            next_node_coords = list(map(int, self.__walkPath[self.__currentNode + 1].split(",")))
-            next_node = pygame.math.Vector2(next_node_coords[0], next_node_coords[1])
-            progress += self.__position.distance_to(next_node)
-        return progress / self.__total_path_length
+        # Fraction of the path the enemy has covered, 0 at the spawn and 1 at the end
+        return self.__path.getProgress(self.__distance)
+
+    def getDebuffMask(self) -> int:
+        """
+        Return the active debuff kinds as StatusEffects flags (SLOW, BLEEDING, BURNING) without allocating.
+        """
+        return self.__statusEffects.getMask()
+
+    def getStatusEffects(self) -> StatusEffects:
+        return self.__statusEffects
 
     def getDebuffs(self):
         """
         Returns a list of current debuffs affecting the enemy.
         Each debuff is represented as a dictionary containing its details.
+        Builds new dicts on every call; per-frame code should use getDebuffMask() instead.
         """
         debuffs = []
-
-        # Collect speed debuffs
-        for key, effect in self.__speedMultipliers.items():
-            debuff = {
-                'type': 'speed_reduction',
-                'source': key,
-                'multiplier': effect['multiplier'],
-                'remaining_duration_ms': effect['duration']
-            }
-            debuffs.append(debuff)
-
-        # Collect other effects (e.g., bleeding, burning)
-        for effect in self.__effects:
-            debuff = {
-                'type': effect['type'],
-                'source': effect['tower_type'],
-                'damage': effect['damage'],
-                'remaining_duration_ms': effect['duration'],
-                'time_since_last_application_s': effect['time_since_last_application']
-            }
-            debuffs.append(debuff)
-
+        clock = self.__statusEffects.getClock()
+        for effect in self.__statusEffects:
+            if effect.kind == SLOW:
+                debuffs.append({
+                    'type': KIND_NAMES[SLOW],
+                    'source': effect.source,
+                    'multiplier': effect.value,
+                    'remaining_duration_ms': effect.getRemainingMs(clock)
+                })
+            else:
+                debuffs.append({
+                    'type': KIND_NAMES[effect.kind],
+                    'source': effect.source,
+                    'damage': effect.value,
+                    'remaining_duration_ms': effect.getRemainingMs(clock),
+                    'time_since_last_application_s': effect.getTimeSinceTick(clock)
+                })
         return debuffs
@@ -1,8 +1,6 @@
 from typing import TYPE_CHECKING
 
-import pygame
-
-from src.Utils.Events import PLAYER_DAMAGED
+from src.GameMechanics.Events.GameEvents import PlayerDamaged
 
 if TYPE_CHECKING:
     from src.Scenes.GameScene import GameScene
@@ -34,9 +32,9 @@ class Player:
         self.__checkHealthOverflow()
         self.__checkGameOver()
 
-    def doDamage(self, enemy: 'Enemy'):
-        self.decreaseHealth(enemy.getDamage())
-        pygame.event.post(pygame.event.Event(PLAYER_DAMAGED, enemy=enemy))
+    def doDamage(self, damage: int, enemy: 'Enemy' = None):
+        self.decreaseHealth(damage)
+        self.__main.getEventBus().publish(PlayerDamaged(enemy, damage))
 
     def __checkGameOver(self):
         if self.__health <= 0:
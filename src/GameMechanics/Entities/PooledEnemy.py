@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.GameMechanics.Manager.EnemyGroup import EnemyGroup
+
+
+class PooledEnemy:
+    # Subclasses declare their own __slots__ too, so enemies carry no per-instance __dict__
+    __slots__ = ("__group",)
+
+    def __init__(self):
+        """
+        Base of the enemies recycled through an EnemyPool. Like pygame.sprite.Sprite it knows the
+        group it is in, but an enemy is only ever in the WaveManager's EnemyGroup, so it keeps a
+        single reference instead of a dict of groups.
+        """
+        self.__group: 'EnemyGroup | None' = None
+
+    def addInternal(self, group: 'EnemyGroup'):
+        self.__group = group
+
+    def removeInternal(self):
+        self.__group = None
+
+    def alive(self) -> bool:
+        return self.__group is not None
+
+    def kill(self):
+        """
+        Remove the enemy from its group. It stays usable and can be spawned again.
+        """
+        if self.__group is not None:
+            self.__group.remove(self)
@@ -1,20 +1,10 @@
 import logging
-import os
-import random
 
 import pygame
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from src.Scenes.GameScene import GameScene
-    from src.GameMechanics.Entities.Enemy import Enemy
-
-import logging
-import os
-import random
-
-import pygame
-from typing import TYPE_CHECKING
+from src.GameMechanics.Configs.ConfigRecords import TowerDefinition, TowerLevel
+from src.GameMechanics.Engine.PathCoverage import PathCoverage
 
 if TYPE_CHECKING:
     from src.Scenes.GameScene import GameScene
@@ -29,10 +19,10 @@ class Tower(pygame.sprite.Sprite):
         self._position = None
         self._truePosition = None
         self._isPlaced = False
-        self._config = None
+        self._config: TowerDefinition | None = None
+        self._levelConfig: TowerLevel | None = None
         self._level = 1
         self._damage = 0
-        self._cooldown = 0
         self._speed = 0
         self._range = 0
         self._cost = 0
@@ -41,6 +31,10 @@ class Tower(pygame.sprite.Sprite):
         self._attack_type = "single_target"
         self._attack_priority = "first_enemy"
         self._debuffs = {}
+        self._coverage: PathCoverage | None = None
+        self._sticky_target = False
+        self._target = None          # Enemy a sticky tower keeps attacking
+        self._target_spawn_id = -1   # Spawn id of that enemy, since enemies are recycled
         try:
             self._loadTowerConfig()
             self._loadImage()
@@ -56,48 +50,40 @@ class Tower(pygame.sprite.Sprite):
             logging.error(f"Configuration for tower '{self._towerName}' not found.")
             raise ValueError(f"Configuration for tower '{self._towerName}' not found.")
 
-        self._max_level = self._config.get("max_level", 1)
-        self._attack_type = self._config.get("attack_type", "single_target")
-        self._attack_priority = self._config.get("attack_priority", "first_enemy")
+        self._max_level = self._config.maxLevel
+        self._attack_type = self._config.attackType
+        self._attack_priority = self._config.attackPriority
+        self._sticky_target = self._config.stickyTarget
         self._updateStatsForLevel()
 
     def _updateStatsForLevel(self):
-        level_config = self._config.get(str(self._level))
-        if not level_config:
+        level_config = self._config.getLevel(self._level)
+        if level_config is None:
             logging.error(f"Level {self._level} config for tower '{self._towerName}' not found.")
             raise ValueError(f"Level {self._level} config for tower '{self._towerName}' not found.")
 
-        self._damage = level_config.get("damage", 0)
-        self._speed = level_config.get("speed", 0)
-        self._range = level_config.get("range", 0)
-        self._cost = level_config.get("cost", 0)
-        self._debuffs = self._extractxDebuffs(level_config)
+        self._levelConfig = level_config
+        self._damage = level_config.damage
+        self._speed = level_config.speed
+        self._range = level_config.range
+        self._cost = level_config.cost
+        self._debuffs = dict(level_config.debuffs)
         # Additional attributes for specific attack types
         if self._attack_type == "AOE":
-            self._blast_radius = level_config.get("blast_radius", 0)
-            self._blast_damage = level_config.get("blast_damage", 0)
-
-    # noinspection PyMethodMayBeStatic
-    def _extractxDebuffs(self, level_config):
-        debuffs = {}
-        for key in ['slow_percent', 'slow_duration', 'slow_type',
-                    'bleeding_damage', 'bleeding_duration', 'bleeding_type',
-                    'burning_damage', 'burning_duration', 'add_gold_amount']:
-            if key in level_config:
-                debuffs[key] = level_config[key]
-        return debuffs
-
-    def tick(self, dt: float):
-        if self._isPlaced:
-            self._cooldown -= dt
-            if self._cooldown <= 0:
-                self.attack()
+            self._blast_radius = level_config.blastRadius
+            self._blast_damage = level_config.blastDamage
 
     def upgrade(self):
+        """
+        Go up one level if possible and return True. Placed towers are upgraded through
+        PlacementManager.upgrade, which also refreshes what depends on the tower's coverage.
+        """
         if self._level < self._max_level:
             self._level += 1
             self._updateStatsForLevel()
             self._loadImage()
+            if self._isPlaced:
+                self._updateCoverage()
             return True
         return False
 
@@ -108,7 +94,7 @@ class Tower(pygame.sprite.Sprite):
                 self._truePosition.x - self._image.get_width() // 2,
                 self._truePosition.y - self._image.get_height() // 2
             )
-            screen.blit(self._image, center)
+            return screen.blit(self._image, center)
 
     def place(self, position: tuple[int, int]):
         self._position = position
@@ -118,51 +104,101 @@ class Tower(pygame.sprite.Sprite):
         )
         self._isPlaced = True
         self._rect = self._image.get_rect(center=self._truePosition)
+        self._updateCoverage()
         logging.info(f"Placed tower '{self._towerName}' at {self._truePosition}")
 
-    def attack(self):
-        enemies_in_range = self._getEnemiesInRange()
-        if not enemies_in_range:
-            return
+    def _updateCoverage(self):
+        # The stretches of path within range, so range checks compare travelled distances
+        path = self._gameScene.getStageManager().getStageConfig().getCompiledPath()
+        self._coverage = path.getCoverage(self._truePosition.x, self._truePosition.y, self.getRangePixels())
 
+    def attack(self) -> bool:
+        """
+        Attack the enemies in range and return True, or return False if there was nothing to attack.
+        When the tower attacks again is decided by the TowerScheduler.
+        """
         if self._attack_type == 'around':
+            enemies_in_range = self._getEnemiesInRange()
             for enemy in enemies_in_range:
                 self._applyEffect(enemy)
-            self._cooldown = self._speed
-        else:
-            target_enemy = self._selectTarget(enemies_in_range)
-            if target_enemy:
-                self._applyEffect(target_enemy)
-                self._cooldown = self._speed
+            return bool(enemies_in_range)
+        target_enemy = self._selectTarget()
+        if target_enemy:
+            self._applyEffect(target_enemy)
+            return True
+        return False
 
-    def _getEnemiesInRange(self):
-        enemies_in_range = []
-        for enemy in self._gameScene.getWaveManager().getEnemies():
-            enemy: "Enemy" = enemy
-            enemyLoc = pygame.math.Vector2(enemy.rect.centerx, enemy.rect.centery)
-            if enemyLoc.distance_to(self._truePosition) <= self._range * self._gridSize:
-                enemies_in_range.append(enemy)
-        return enemies_in_range
-
-    def _selectTarget(self, enemies):
-        if not enemies:
+    def getTowerName(self) -> str:
+        return self._towerName
+
+    def getTruePosition(self) -> pygame.math.Vector2:
+        return self._truePosition
+
+    def getReloadTime(self) -> float:
+        """
+        Return the seconds between two attacks (the level's "speed").
+        """
+        return self._speed
+
+    def getRangePixels(self) -> float:
+        return self._range * self._gridSize
+
+    def isStickyTarget(self) -> bool:
+        return self._sticky_target
+
+    def getStickyTarget(self):
+        """
+        Return the enemy this sticky tower attacked last if it is still alive and in range, otherwise None.
+        """
+        target = self._target
+        if target is None:
             return None
+        if target.isAlive() and target.getSpawnId() == self._target_spawn_id and self._coverage.contains(target.getDistance()):
+            return target
+        self._target = None
+        return None
+
+    def setStickyTarget(self, enemy):
+        self._target = enemy
+        self._target_spawn_id = enemy.getSpawnId() if enemy is not None else -1
+
+    def getCoverage(self) -> PathCoverage | None:
+        """
+        Return the stretches of path within the tower's range, or None before the tower is placed.
+        """
+        return self._coverage
+
+    def getDamage(self):
+        return self._damage
+
+    def getDebuffs(self) -> dict:
+        return self._debuffs
+
+    def getAttackType(self) -> str:
+        return self._attack_type
+
+    def getAttackPriority(self) -> str:
+        return self._attack_priority
+
+    def getBlastRadiusPixels(self) -> float:
+        return getattr(self, "_blast_radius", 0) * self._gridSize
 
-        # Prioritize enemies based on attack priority
-        if self._attack_priority == "first_enemy":
-            enemies.sort(key=lambda e: e.getProgress())
-        elif self._attack_priority == "last_enemy":
-            enemies.sort(key=lambda e: -e.getProgress())
-        elif self._attack_priority == "lowest_health":
-            enemies.sort(key=lambda e: e.getHealth())
-        elif self._attack_priority == "highest_health":
-            enemies.sort(key=lambda e: -e.getHealth())
-        elif self._attack_priority == "random":
-            random.shuffle(enemies)
-        else:
-            enemies.sort(key=lambda e: e.getProgress())
-
-        return enemies[0]  # Return the first enemy after sorting
+    def getBlastDamage(self):
+        return getattr(self, "_blast_damage", 0)
+
+    def _getEnemiesInRange(self):
+        return self._gameScene.getWaveManager().getEnemiesInCoverage(self._coverage)
+
+    def _selectTarget(self):
+        if self._sticky_target:
+            target = self.getStickyTarget()
+            if target is not None:
+                return target
+        # The wave manager keeps enemies in progress order, so this is a lookup rather than a scan
+        target = self._gameScene.getWaveManager().selectTarget(self._coverage, self._attack_priority)
+        if self._sticky_target:
+            self.setStickyTarget(target)
+        return target
 
     def _applyEffect(self, target_enemy: "Enemy"):
         # Apply direct damage to the target enemy
@@ -176,17 +212,13 @@ class Tower(pygame.sprite.Sprite):
             self._applyBlastDamage(target_enemy)
 
     def _applyBlastDamage(self, target_enemy: "Enemy"):
-        enemies = self._gameScene.getWaveManager().getEnemies()
-        target_position = pygame.math.Vector2(target_enemy.rect.centerx, target_enemy.rect.centery)
-        for enemy in enemies:
-            if enemy == target_enemy:
-                continue  # Skip the target enemy
-            enemy_position = pygame.math.Vector2(enemy.rect.centerx, enemy.rect.centery)
-            distance = enemy_position.distance_to(target_position)
-            if distance <= self._blast_radius * self._gridSize:
-                enemy.decreaseHealth(self._blast_damage)
-                # Apply debuffs to enemies hit by the blast
-                self._applyDebuffs(enemy)
+        target_x, target_y = target_enemy.getPosition()
+        for enemy in self._gameScene.getWaveManager().getEnemiesInRadius(target_x, target_y, self._blast_radius * self._gridSize):
+            if enemy == target_enemy or not enemy.alive():
+                continue  # Skip the target enemy and anything already killed
+            enemy.decreaseHealth(self._blast_damage)
+            # Apply debuffs to enemies hit by the blast
+            self._applyDebuffs(enemy)
 
     def _applyDebuffs(self, enemy: "Enemy"):
         if 'slow_percent' in self._debuffs and 'slow_duration' in self._debuffs:
@@ -200,33 +232,13 @@ class Tower(pygame.sprite.Sprite):
             self._gameScene.getCurrencyManager().deposit("gold", self._debuffs['add_gold_amount'])
 
     def _loadImage(self):
-        # Get the image path for the current level
-        level_config = self._config.get(str(self._level), {})
-        image_path = level_config.get("image")
-
-        if not image_path:
-            # Fallback to the default image if level-specific image is not provided
-            image_path = self._config.get("image")
-
-        if not image_path:
-            logging.error(f"No image specified for tower '{self._towerName}' at level {self._level}.")
-            raise FileNotFoundError(f"No image specified for tower '{self._towerName}' at level {self._level}.")
-
-        self._imagePath = os.path.join(
-            self._gameScene.getProjectRoot(),
-            image_path
-        )
-        self._imagePath = os.path.normpath(self._imagePath)
-        if not os.path.exists(self._imagePath):
-            raise FileNotFoundError(f"{self.__class__.__name__} image not found: {self._imagePath}")
+        # The level's image, or the tower's default image when the level has none
+        image_path = self._levelConfig.image
+        self._imagePath = self._gameScene.getAssetCache().resolvePath(image_path)
         try:
-            self._image = pygame.image.load(self._imagePath).convert_alpha()
-            self._image = pygame.transform.scale(
-                self._image,
+            self._image = self._gameScene.getAssetCache().getImage(
+                self._imagePath,
                 (int(self._gridSize * 0.8), int(self._gridSize * 0.8))
             )
-            logging.debug(
-                f"Loaded image for '{self.__class__.__name__}' at level {self._level} and scaled to ({self._gridSize}x{self._gridSize})."
-            )
         except pygame.error as e:
             raise pygame.error(f"Error loading {self.__class__.__name__} image '{self._imagePath}': {e}")
\ No newline at end of file
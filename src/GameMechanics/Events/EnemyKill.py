@@ -1,15 +1,11 @@
-import pygame
-
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    from src.GameMechanics.Entities.Enemy import Enemy
+    from src.GameMechanics.Events.GameEvents import EnemyKilled
     from src.Scenes.GameScene import GameScene
-    from Game import Main
 
 
-def handle(event, scene: 'GameScene', main: 'Main'):
-    enemy: Enemy =  event.enemy
-    scene.getCurrencyManager().deposit("gold", enemy.getReward())
-    pass
\ No newline at end of file
+def handle(events: list['EnemyKilled'], scene: 'GameScene'):
+    # One deposit for every enemy killed since the last delivery
+    scene.getCurrencyManager().deposit("gold", sum(event.reward for event in events))
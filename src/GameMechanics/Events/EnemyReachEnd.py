@@ -1,15 +1,13 @@
-import pygame
-
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from src.GameMechanics.Events.GameEvents import EnemyReachedEnd
     from src.Scenes.GameScene import GameScene
 
 
 class EnemyReachEnd:
 
     @staticmethod
-    def handle(event: 'pygame.event.Event', scene: 'GameScene'):
-        scene.getUIManager().getHurtUI().hurt()
-        scene.getPlayer().doDamage(event.enemy)
-        pass
+    def handle(events: list['EnemyReachedEnd'], scene: 'GameScene'):
+        for event in events:
+            scene.getPlayer().doDamage(event.damage, event.enemy)
@@ -0,0 +1,55 @@
+import logging
+from typing import Callable
+
+
+class GameEventBus:
+    # Deliveries per flush() that may publish further events before the rest waits for the next flush
+    MAX_ROUNDS = 8
+
+    def __init__(self):
+        """
+        In-process queue for gameplay events, which used to go through the SDL event queue.
+        Events are queued by type and delivered in batches on flush(), so a subscriber gets
+        every event of its type published since the last flush in one call.
+        """
+        self.__subscribers: dict[type, list[Callable[[list], None]]] = {}
+        self.__pending: dict[type, list] = {}
+        self.__published = 0
+        self.__batches = 0
+
+    def subscribe(self, eventType: type, handler: Callable[[list], None]):
+        """
+        :param eventType: Event class from GameEvents
+        :param handler: Called with the list of events of that type, in the order they were published
+        """
+        self.__subscribers.setdefault(eventType, []).append(handler)
+
+    def publish(self, event):
+        pending = self.__pending.get(type(event))
+        if pending is None:
+            self.__pending[type(event)] = [event]
+        else:
+            pending.append(event)
+        self.__published += 1
+
+    def flush(self):
+        """
+        Deliver the queued events, types in order of their first event. Events published by
+        the handlers are delivered in the same flush.
+        """
+        for _ in range(self.MAX_ROUNDS):
+            if not self.__pending:
+                return
+            pending, self.__pending = self.__pending, {}
+            for eventType, events in pending.items():
+                for handler in self.__subscribers.get(eventType, ()):
+                    handler(events)
+                    self.__batches += 1
+        if self.__pending:
+            logging.warning(f"Event handlers kept publishing after {self.MAX_ROUNDS} rounds. Delivering the rest next frame.")
+
+    def clear(self):
+        self.__pending.clear()
+
+    def getStats(self) -> dict:
+        return {"published": self.__published, "batches": self.__batches}
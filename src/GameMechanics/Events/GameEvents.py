@@ -0,0 +1,31 @@
+from typing import NamedTuple, Any
+
+
+# Gameplay events delivered through GameEventBus. Enemies may be recycled by the pool before
+# delivery, so the values handlers need travel with the event instead of being read from the enemy.
+
+class EnemyKilled(NamedTuple):
+    enemy: Any
+    reward: int
+
+
+class EnemyReachedEnd(NamedTuple):
+    enemy: Any
+    damage: int
+
+
+class PlayerDamaged(NamedTuple):
+    enemy: Any
+    damage: int
+
+
+class PlayerGameOver(NamedTuple):
+    pass
+
+
+class PlayerVictory(NamedTuple):
+    pass
+
+
+class WaveEnded(NamedTuple):
+    wave: int
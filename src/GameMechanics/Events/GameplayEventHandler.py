@@ -0,0 +1,49 @@
+from typing import TYPE_CHECKING
+
+from src.GameMechanics.Events import EnemyKill
+from src.GameMechanics.Events.EnemyReachEnd import EnemyReachEnd
+from src.GameMechanics.Events.GameEvents import EnemyKilled, EnemyReachedEnd, PlayerDamaged, PlayerGameOver, PlayerVictory, WaveEnded
+
+if TYPE_CHECKING:
+    from src.GameMechanics.Events.GameEventBus import GameEventBus
+    from src.Scenes.GameScene import GameScene
+
+
+class GameplayEventHandler:
+    def __init__(self, scene: 'GameScene', bus: 'GameEventBus'):
+        """
+        Subscribes the game scene to the gameplay events on its event bus.
+        Input events are still handled by GameSceneHandler.
+        """
+        self.__scene = scene
+        bus.subscribe(EnemyKilled, self.__onEnemyKilled)
+        bus.subscribe(EnemyReachedEnd, self.__onEnemyReachedEnd)
+        bus.subscribe(PlayerDamaged, self.__onPlayerDamaged)
+        bus.subscribe(PlayerGameOver, self.__onGameOver)
+        bus.subscribe(PlayerVictory, self.__onVictory)
+        bus.subscribe(WaveEnded, self.__onWaveEnded)
+
+    def __onEnemyKilled(self, events: list[EnemyKilled]):
+        EnemyKill.handle(events, self.__scene)
+
+    def __onEnemyReachedEnd(self, events: list[EnemyReachedEnd]):
+        EnemyReachEnd.handle(events, self.__scene)
+
+    def __onPlayerDamaged(self, events: list[PlayerDamaged]):
+        self.__scene.getUIManager().getHurtUI().hurt()
+
+    def __onGameOver(self, events: list[PlayerGameOver]):
+        self.__scene.getStageManager().isLost = True
+
+    def __onVictory(self, events: list[PlayerVictory]):
+        self.__scene.getStageManager().isVictory = True
+
+    def __onWaveEnded(self, events: list[WaveEnded]):
+        scene = self.__scene
+        for event in events:
+            if scene.getStageManager().isVictory:
+                return
+            if event.wave == 0:
+                scene.getWaveManager().startNextWave()
+                continue
+            scene.getUIManager().waveChangeUI.trigger(event.wave)
@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from src.GameMechanics.Entities.PooledEnemy import PooledEnemy
+
+
+class EnemyGroup:
+    def __init__(self):
+        """
+        The spawned enemies in spawn order, in place of a pygame.sprite.Group, which only holds Sprites.
+        Iterating or updating works on a copy, so enemies can be killed meanwhile.
+        """
+        self.__enemies: dict['PooledEnemy', None] = {}
+
+    def add(self, enemy: 'PooledEnemy'):
+        if enemy not in self.__enemies:
+            self.__enemies[enemy] = None
+            enemy.addInternal(self)
+
+    def remove(self, enemy: 'PooledEnemy'):
+        if self.__enemies.pop(enemy, 0) is None:
+            enemy.removeInternal()
+
+    def update(self, deltaTime: float):
+        for enemy in list(self.__enemies):
+            enemy.update(deltaTime)
+
+    def __iter__(self) -> Iterator['PooledEnemy']:
+        return iter(list(self.__enemies))
+
+    def __contains__(self, enemy) -> bool:
+        return enemy in self.__enemies
+
+    def __len__(self) -> int:
+        return len(self.__enemies)
@@ -0,0 +1,57 @@
+import logging
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.GameMechanics.Entities.PooledEnemy import PooledEnemy
+
+
+class EnemyPool:
+    def __init__(self, factory: Callable[[str], 'PooledEnemy']):
+        """
+        Free list of dead enemies that are reset and handed out again instead of building new ones.
+        Pooled enemies must provide reset(enemyType).
+
+        :param factory: Builds a new enemy of the given type when the pool is empty
+        """
+        self.__factory = factory
+        self.__free = []
+        self.__created = 0
+        self.__reused = 0
+
+    def acquire(self, enemyType: str) -> 'PooledEnemy':
+        """
+        Return an enemy of the given type, recycled from the pool when one is free.
+        """
+        if self.__free:
+            enemy = self.__free.pop()
+            try:
+                enemy.reset(enemyType)
+            except Exception:
+                self.__free.append(enemy)
+                raise
+            self.__reused += 1
+            return enemy
+        enemy = self.__factory(enemyType)
+        self.__created += 1
+        return enemy
+
+    def release(self, enemy: 'PooledEnemy'):
+        """
+        Hand a dead enemy back to the pool. It must no longer be referenced by groups or indexes.
+        """
+        if enemy is None:
+            return
+        self.__free.append(enemy)
+
+    def clear(self):
+        self.__free.clear()
+        logging.debug("Enemy pool cleared.")
+
+    def getStats(self) -> dict:
+        """
+        Return how many enemies were built, how many spawns reused one, and how many are waiting in the pool.
+        """
+        return {"created": self.__created, "reused": self.__reused, "free": len(self.__free)}
+
+    def __len__(self):
+        return len(self.__free)
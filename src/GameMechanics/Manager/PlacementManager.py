@@ -1,8 +1,11 @@
 import logging
 from typing import TYPE_CHECKING
 
-from pygame import Vector2
+import pygame
 
+from src.GameMechanics.Engine.OccupancyGrid import OccupancyGrid, PATH, TOWER
+from src.GameMechanics.Engine.TargetingKernel import TargetingKernel
+from src.GameMechanics.Engine.TowerScheduler import TowerScheduler
 from src.GameMechanics.Entities.Tower import Tower
 
 if TYPE_CHECKING:
@@ -12,36 +15,67 @@ class PlacementManager:
     def __init__(self, gameScene: 'GameScene'):
         self.__gameScene = gameScene
         self.placedTower = {}
+        self.__targetingKernel = None
+        # The stage's path and HUD cells plus the towers of this run
+        self.__grid = gameScene.getStageManager().getOccupancyGrid().copy()
+        self.__scheduler = TowerScheduler(gameScene.getStageManager().getStageConfig().getGridSize())
+        self.__heatmap: list[int] | None = None
 
     def place(self, position: tuple[int, int]) -> bool:
         towerType = self.__gameScene.getInventoryManager().getSelectedTower()
-        if position in self.placedTower:
+        if not self.__grid.isBuildable(*position):
+            if self.__grid.getState(*position) == PATH:
+                logging.info("Cannot place tower on path.")
             return False
 
-        if position[1] == 0:
-            return False
-
-        tower = self.__createTower(towerType)
-        if tower is None:
+        levelConfig = self.__gameScene.getTowerConfig().getTowerLevelConfig(towerType, 1)
+        if levelConfig is None:
             logging.error(f"Invalid tower type: {towerType}, please check tower configurations.")
             return False
 
-        if Vector2(*position) in self.__gameScene.getStageManager().getPath().getFullPathCoordinates():
-            logging.info("Cannot place tower on path.")
-            return False
-
-        cost: int = self.__gameScene.getTowerConfig().getTowerLevelConfig(towerType, 1).get("cost")
-
+        cost: int = levelConfig.cost
         if self.__gameScene.getCurrencyManager().getCurrency("gold") < cost:
             self.__gameScene.getUIManager().currencyUI.setTick()
             return False
 
+        # Only build the tower (and load its image) once the cell and the price are known to be fine
+        tower = self.__createTower(towerType)
+        if tower is None:
+            return False
+
         self.__gameScene.getCurrencyManager().withdraw("gold", cost)
 
         tower.place(position)
         self.placedTower[position] = tower
+        self.__grid.mark(*position, TOWER)
+        self.__scheduler.add(tower)
+        self.__heatmap = None
         return True
 
+    def upgrade(self, position: tuple[int, int]) -> bool:
+        """
+        Upgrade the tower on the cell and refresh what depends on its range. Return False if
+        there is no tower there or it is already at its highest level.
+        """
+        tower = self.placedTower.get(position)
+        if tower is None or not tower.upgrade():
+            return False
+        self.__scheduler.refresh(tower)
+        self.__heatmap = None
+        return True
+
+    def canPlace(self, position: tuple[int, int]) -> bool:
+        """
+        Return True if a tower may be placed on the cell: inside the stage, off the path and the HUD, and free.
+        """
+        return self.__grid.isBuildable(*position)
+
+    def getBuildableCells(self) -> list[tuple[int, int]]:
+        return self.__grid.getBuildableCells()
+
+    def getOccupancyGrid(self) -> OccupancyGrid:
+        return self.__grid
+
     def __createTower(self, towerType: str) -> Tower | None:
         try:
             tower = Tower(self.__gameScene, towerType)
@@ -51,12 +85,57 @@ class PlacementManager:
             return None
 
     def tick(self, deltaTime: float):
-        for tower in self.placedTower.values():
-            try:
-                tower.tick(deltaTime)
-            except Exception as e:
-                logging.error(f"Error ticking tower: {e}")
-
-    def draw(self):
-        for tower in self.placedTower.values():
-            tower.draw()
+        waveManager = self.__gameScene.getWaveManager()
+        ready = self.__scheduler.tick(deltaTime, waveManager.getOccupiedBuckets)
+        if not ready:
+            return
+
+        store = waveManager.getStore()
+        if store is not None:
+            fired = self.__attackBatched(ready, store)
+        else:
+            fired = set()
+            for tower in ready:
+                try:
+                    if tower.attack():
+                        fired.add(tower)
+                except Exception as e:
+                    logging.error(f"Error ticking tower: {e}")
+
+        for tower in ready:
+            if tower in fired:
+                self.__scheduler.reload(tower)
+            else:
+                self.__scheduler.sleep(tower)
+
+    def __attackBatched(self, ready: list, store) -> set:
+        # With the numpy enemy engine all ready towers pick and hit their targets in one pass
+        if self.__targetingKernel is None:
+            self.__targetingKernel = TargetingKernel(self.__gameScene, store)
+        try:
+            return set(self.__targetingKernel.resolve(ready))
+        except Exception as e:
+            logging.error(f"Error resolving tower attacks: {e}")
+            return set()
+
+    def getCoverageHeatmap(self) -> list[int]:
+        """
+        Return how many towers cover each point of the path, sampled every grid_size pixels:
+        entry i counts the towers whose coverage contains distance i * grid_size.
+        The list is rebuilt only after a tower was placed or upgraded.
+        """
+        if self.__heatmap is None:
+            stageConfig = self.__gameScene.getStageManager().getStageConfig()
+            gridSize = stageConfig.getGridSize()
+            counts = [0] * (int(stageConfig.getCompiledPath().getTotalLength() // gridSize) + 1)
+            for tower in self.placedTower.values():
+                for sample in tower.getCoverage().getSamples(gridSize):
+                    counts[sample] += 1
+            self.__heatmap = counts
+        return self.__heatmap
+
+    def getScheduler(self) -> TowerScheduler:
+        return self.__scheduler
+
+    def draw(self) -> list[pygame.Rect]:
+        return [tower.draw() for tower in self.placedTower.values()]
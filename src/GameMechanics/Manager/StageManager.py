@@ -2,35 +2,86 @@ import logging
 
 import pygame
 
-from src.Utils import Events
+from src.GameMechanics.Events.GameEvents import PlayerGameOver
 from src.GameMechanics.Elements.BackgroundElement import BackgroundElement
 from src.GameMechanics.Elements.PathElement import PathElement
+from src.GameMechanics.Elements.StaticStageLayer import StaticStageLayer
+from src.GameMechanics.Elements.UI.EnemyOverlayUI import EnemyOverlayUI
 from src.GameMechanics.Configs.StageConfig import StageConfig
+from src.GameMechanics.Engine.OccupancyGrid import OccupancyGrid, HUD, PATH
+from src.Utils.DirtyRenderer import DirtyRenderer
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.Scenes.GameScene import GameScene
 
 class StageManager:
-    
+    # Pixels above an enemy sprite covered by its health bar. The bar is as wide as the sprite and
+    # the debuff tint covers the sprite exactly, so no other margin is needed.
+    ENEMY_DIRTY_MARGIN_TOP = EnemyOverlayUI.BAR_OFFSET
+    HUD_ROWS = 1  # Grid rows at the top of the screen covered by the hotbar, health and gold
+    SOUNDS = {
+        'wave': "config/Sounds/Event_raidhorn1.ogg",
+        'break': "config/Sounds/Amethyst_break1.ogg"
+    }
+    MUSIC = "config/Sounds/Minecraft.mp3"
+
     def __init__(self, gameScene: 'GameScene', stage: str):
         self.__main = gameScene
         logging.info(f"StageManager Initialized with Project Root: {gameScene.getProjectRoot()}")
 
-        self.__stageConfig = StageConfig(gameScene.getProjectRoot(), stage)
+        self.__stageConfig = StageConfig(gameScene.getProjectRoot(), stage, gameScene.getCompiledConfig())
         self.__background = BackgroundElement(self.__stageConfig, gameScene.getConfig(), gameScene.getScreen())
         self.__path = PathElement(self.__stageConfig, gameScene, gameScene.getScreen())
+        self.__staticLayer = StaticStageLayer(gameScene, self.__background, self.__path)
+        self.__occupancyGrid = self.__createOccupancyGrid()
         self.timeScale = 1.0 #Time Scale, Use in events like time slow or speed up some element of the game, like time stop skill
         self.__isPaused = False
         self.isVictory = False
         self.isLost = False
-        self.sound = {
-            'wave': pygame.mixer.Sound("config/Sounds/Event_raidhorn1.ogg"),
-            'break': pygame.mixer.Sound("config/Sounds/Amethyst_break1.ogg")
-        }
-        pygame.mixer.music.load("config/Sounds/Minecraft.mp3")
+        self.__renderer = self.__createRenderer()
+        self.sound = {}
+        self.__musicLoaded = False
+        if not gameScene.isHeadless():
+            assetCache = gameScene.getAssetCache()
+            self.sound = {name: assetCache.getSound(path) for name, path in self.SOUNDS.items()}
+
+    def reset(self):
+        """
+        Prepare the stage for a new run. The stage config, background, path, static layer and
+        sounds are kept; the music restarts from the beginning when the scene is entered again.
+        """
+        self.timeScale = 1.0
+        self.__isPaused = False
+        self.isVictory = False
+        self.isLost = False
+        self.__renderer = self.__createRenderer()
+
+    def playMusic(self):
+        """
+        Start the stage music from the beginning, loading it the first time.
+        """
+        if self.__main.isHeadless():
+            return
+        if not self.__musicLoaded:
+            pygame.mixer.music.load(self.__main.getAssetCache().resolvePath(self.MUSIC))
+            self.__musicLoaded = True
         pygame.mixer.music.play(-1)
 
+    def __createOccupancyGrid(self) -> OccupancyGrid:
+        gridSize = self.__stageConfig.getGridSize()
+        screen = self.__main.getScreen()
+        grid = OccupancyGrid(-(-screen.get_width() // gridSize), -(-screen.get_height() // gridSize), gridSize)
+        grid.markRows(0, self.HUD_ROWS, HUD)
+        grid.markAll(self.__path.getPathCells(), PATH)
+        return grid
+
+    def __createRenderer(self) -> DirtyRenderer | None:
+        renderMode = self.__main.getConfig().getGameSettings("render_mode") or "full"
+        if renderMode != "dirty" or self.__main.isHeadless():
+            return None
+        logging.info("Using the dirty-rect renderer.")
+        return DirtyRenderer(self.__main.getScreen())
 
     def getStageConfig(self):
         """
@@ -50,31 +101,38 @@ class StageManager:
         """
         return self.__path
 
+    def getOccupancyGrid(self) -> OccupancyGrid:
+        """
+        Return the stage's path and HUD cells. Every run works on a copy it adds its towers to,
+        see PlacementManager.getOccupancyGrid().
+        """
+        return self.__occupancyGrid
+
+    def getStaticLayer(self) -> StaticStageLayer:
+        """
+        Return the baked background, path and hotbar frame layer.
+        """
+        return self.__staticLayer
+
     def tick(self, deltaTime: float):
-        if self.__main.getUIManager().pauseUI.getPauseTimeMultiplier() > 0 and not self.isVictory and not self.isLost:
+        self.update(deltaTime)
+        self.draw()
+
+    def update(self, deltaTime: float):
+        """
+        Advance the simulation and every UI timer by deltaTime without drawing anything.
+        """
+        running = self.__main.getUIManager().pauseUI.getPauseTimeMultiplier() > 0
+        if running and not self.isVictory and not self.isLost:
             self.__main.getWaveManager().update(deltaTime)
             self.__main.getPlacementManager().tick(deltaTime)
             self.__main.getUIManager().currencyUI.tick(deltaTime)
-            self.__main.getUIManager().debuffIndicator.tick(deltaTime)
             self.__main.getUIManager().getHurtUI().tick(deltaTime)
-            pygame.mixer.music.unpause()
+            self.__setMusicPaused(False)
         else:
-            pygame.mixer.music.pause()
-
-        self.__main.getStageManager().getBackground().draw()
-        self.__main.getStageManager().getPath().draw()
-        self.__main.getPlacementManager().draw()
-        self.__main.getWaveManager().draw()
-
-        self.__main.getUIManager().updateHealthBar()
-        self.__main.getUIManager().updateCurrency()
-        self.__main.getUIManager().updateEnemyHealthBar()
-        self.__main.getUIManager().updateHotbarInventory()
-        self.__main.getUIManager().waveChangeUI.drawUI()
-        self.__main.getUIManager().debuffIndicator.draw()
+            self.__setMusicPaused(True)
 
-        if self.__main.getUIManager().pauseUI.getPauseTimeMultiplier() > 0:
-            self.__main.getUIManager().towerStatusUI.draw()
+        if running:
             self.__main.getUIManager().waveChangeUI.tick(deltaTime)
 
         if self.isVictory:
@@ -84,9 +142,91 @@ class StageManager:
             self.__main.getUIManager().playerLostUI.tick(deltaTime)
 
         self.__main.getUIManager().pauseUI.tick(deltaTime)
+
+    def draw(self, alpha: float = 1.0):
+        """
+        Draw the current state of the stage and its UI onto the screen.
+
+        :param alpha: Fraction of a simulation step elapsed since the last update, used to interpolate enemies
+        """
+        renderer = self.__renderer
+        if renderer is None or renderer.needsBackground():
+            self.__staticLayer.draw()
+            if renderer is not None:
+                renderer.setBackground(self.__staticLayer.getSurface())
+        else:
+            renderer.beginFrame()
+
+        towerRects = self.__main.getPlacementManager().draw()
+        if not self.isVictory and not self.isLost:
+            towerRects.extend(self.__main.getUIManager().updateCoverageHeatmap())
+        if self.__main.getUIManager().pauseUI.getPauseTimeMultiplier() > 0 and not self.isVictory and not self.isLost:
+            towerRects.append(self.__main.getUIManager().updatePlacementPreview())
+        enemyRects = self.__main.getWaveManager().draw(alpha)
+
+        hudRects = [
+            self.__main.getUIManager().updateHealthBar(),
+            self.__main.getUIManager().updateCurrency()
+        ]
+        self.__main.getUIManager().updateEnemyOverlays(alpha)
+        hudRects.append(self.__main.getUIManager().updateHotbarInventory())
+        hudRects.append(self.__main.getUIManager().waveChangeUI.drawUI())
+        self.__main.getUIManager().getHurtUI().draw()
+
+        if self.__main.getUIManager().pauseUI.getPauseTimeMultiplier() > 0:
+            hudRects.append(self.__main.getUIManager().towerStatusUI.draw())
+            hudRects.append(self.__main.getUIManager().waveChangeUI.draw())
+
+        if self.isVictory:
+            self.__main.getUIManager().playerVictoryUI.draw()
+
+        if self.isLost:
+            self.__main.getUIManager().playerLostUI.draw()
+
+        self.__main.getUIManager().pauseUI.draw()
+
+        if renderer is not None:
+            self.__trackDirtyRects(renderer, towerRects, enemyRects, hudRects)
+
+    def __trackDirtyRects(self, renderer: DirtyRenderer, towerRects: list, enemyRects: list, hudRects: list):
+        uiManager = self.__main.getUIManager()
+        if (self.isVictory or self.isLost or self.__isPaused or uiManager.getHurtUI().isVisible()
+                or uiManager.waveChangeUI.isShowingTitle()):
+            renderer.markFull()  # Full-screen overlays
+        renderer.addAll(towerRects)
+        renderer.addAll(hudRects)
+        # Enemy overlays are drawn at the same interpolated position as the sprites, so only the
+        # health bar above them reaches outside the sprite rect
+        margin = self.ENEMY_DIRTY_MARGIN_TOP
+        for rect in enemyRects:
+            if rect:
+                renderer.add(pygame.Rect(rect.left, rect.top - margin, rect.width, rect.height + margin))
+
+    def present(self):
+        """
+        Push the drawn frame to the display, only the changed rects when the dirty-rect renderer is enabled.
+        """
+        if self.__renderer is None:
+            pygame.display.flip()
+        else:
+            self.__renderer.present()
+
+    def getRenderer(self) -> DirtyRenderer | None:
+        """
+        Return the dirty-rect renderer when game_settings.render_mode is "dirty", otherwise None.
+        """
+        return self.__renderer
+
+    def __setMusicPaused(self, paused: bool):
+        if self.__main.isHeadless():
+            return
+        if paused:
+            pygame.mixer.music.pause()
+        else:
+            pygame.mixer.music.unpause()
     # noinspection PyMethodMayBeStatic
     def gameOver(self):
-        pygame.event.post(pygame.event.Event(Events.PLAYER_GAME_OVER))
+        self.__main.getEventBus().publish(PlayerGameOver())
 
     def pauseGame(self, state: bool = None):
         if state is not None:
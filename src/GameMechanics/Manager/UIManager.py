@@ -1,12 +1,13 @@
 from typing import TYPE_CHECKING
 
+from src.GameMechanics.Elements.UI.CoverageHeatmapUI import CoverageHeatmapUI
 from src.GameMechanics.Elements.UI.CurrencyUI import CurrencyUI
-from src.GameMechanics.Elements.UI.DebuffIndicator import DebuffIndicator
-from src.GameMechanics.Elements.UI.EnemyHealthBar import EnemyHealthBar
+from src.GameMechanics.Elements.UI.EnemyOverlayUI import EnemyOverlayUI
 from src.GameMechanics.Elements.UI.HealthBarUI import HealthBarUI
 from src.GameMechanics.Elements.InventoryElement import InventoryUI
 from src.GameMechanics.Elements.UI.HurtUI import HurtUI
 from src.GameMechanics.Elements.UI.PauseUI import PauseUI
+from src.GameMechanics.Elements.UI.PlacementPreviewUI import PlacementPreviewUI
 from src.GameMechanics.Elements.UI.PlayerLostUI import PlayerLostUI
 from src.GameMechanics.Elements.UI.PlayerVictoryUI import PlayerVictoryUI
 from src.GameMechanics.Elements.UI.TowerStatusUI import TowerStatusUI
@@ -19,27 +20,49 @@ class UIManager:
     def __init__(self, gameScene: 'GameScene'):
         self.healthUI = HealthBarUI(gameScene)
         self.currencyUI = CurrencyUI(gameScene)
-        self.EnemyHealthUI = EnemyHealthBar(gameScene)
+        self.enemyOverlayUI = EnemyOverlayUI(gameScene)
         self.hotbarUI = InventoryUI(gameScene)
         self.hurtUI = HurtUI(gameScene)
         self.pauseUI = PauseUI(gameScene)
         self.towerStatusUI = TowerStatusUI(gameScene)
+        self.placementPreviewUI = PlacementPreviewUI(gameScene)
+        self.coverageHeatmapUI = CoverageHeatmapUI(gameScene)
         self.waveChangeUI = WaveChangeUI(gameScene)
         self.playerVictoryUI = PlayerVictoryUI(gameScene)
         self.playerLostUI = PlayerLostUI(gameScene)
-        self.debuffIndicator = DebuffIndicator(gameScene)
+
+    def reset(self):
+        """
+        Clear the state a run left in the UI (timers, selections, pause and end screens).
+        The UI objects and their cached surfaces are kept.
+        """
+        self.hotbarUI.clearSelection()
+        self.currencyUI.reset()
+        self.hurtUI.reset()
+        self.pauseUI.reset()
+        self.towerStatusUI.reset()
+        self.coverageHeatmapUI.reset()
+        self.waveChangeUI.reset()
+        self.playerVictoryUI.reset()
+        self.playerLostUI.reset()
 
     def updateHealthBar(self):
-        self.healthUI.display()
+        return self.healthUI.display()
+
+    def updateEnemyOverlays(self, alpha: float = 1.0):
+        self.enemyOverlayUI.display(alpha)
+
+    def updatePlacementPreview(self):
+        return self.placementPreviewUI.draw()
 
-    def updateEnemyHealthBar(self):
-        self.EnemyHealthUI.display()
+    def updateCoverageHeatmap(self):
+        return self.coverageHeatmapUI.draw()
 
     def updateHotbarInventory(self):
-        self.hotbarUI.display()
+        return self.hotbarUI.display()
 
     def updateCurrency(self):
-        self.currencyUI.display()
+        return self.currencyUI.display()
 
     def getHurtUI(self):
         return self.hurtUI
@@ -3,91 +3,191 @@ import pygame
 import logging
 from typing import TYPE_CHECKING
 
+from src.GameMechanics.Engine.EnemyStore import EnemyStore
+from src.GameMechanics.Engine.ProgressIndex import ProgressIndex
+from src.GameMechanics.Engine.SpawnTimeline import SpawnTimeline
+from src.GameMechanics.Entities.ArrayEnemy import ArrayEnemy
 from src.GameMechanics.Entities.Enemy import Enemy
-from src.Utils.Events import PLAYER_VICTORY, STAGE_WAVE_END
+from src.GameMechanics.Manager.EnemyGroup import EnemyGroup
+from src.GameMechanics.Manager.EnemyPool import EnemyPool
+from src.Utils.SpatialHash import SpatialHashGrid
+from src.GameMechanics.Events.GameEvents import PlayerVictory, WaveEnded
 
 if TYPE_CHECKING:
     from src.Scenes.GameScene import GameScene
+    from src.GameMechanics.Engine.PathCoverage import PathCoverage
 
 class WaveManager:
     def __init__(self, gameScene: 'GameScene'):
         self.__main = gameScene
-        self.__waveConfig = gameScene.getStageManager().getStageConfig().getConfig().get("waves", {})
-        self.__enemyConfig = gameScene.getEnemyConfig().getConfig()
+        self.__waves = gameScene.getStageManager().getStageConfig().getWaves()
 
-        self.__spawnTimer = 0.0       # Time since last enemy spawn
-        self.__spawnRate = 2.0        # Time between enemy spawns (default)
-        self.__enemies = []           # List of enemies to spawn
+        self.__timeline: SpawnTimeline | None = None  # Spawns of the current wave
 
         self.__currentWave = 0        # Current wave number
         self.__delay = 0.0            # Time since wave completed
 
-        self.__spawnedEnemy = pygame.sprite.Group()  # Group of spawned enemies
+        self.__spawnedEnemy = EnemyGroup()  # Group of spawned enemies
+        self.__gridSize = gameScene.getStageManager().getStageConfig().getGridSize()
+        self.__spatialIndex = SpatialHashGrid(self.__gridSize)
+        self.__progressIndex = ProgressIndex(gameScene.getStageManager().getStageConfig().getCompiledPath().getTotalLength())
+        self.__store = self.__createStore()
+        self.__pool = EnemyPool(self.__createEnemy)
 
 
         logging.info("WaveManager initialized.")
 
+    def __createStore(self) -> EnemyStore | None:
+        engine = self.__main.getConfig().getGameSettings("enemy_engine") or "sprite"
+        if engine != "numpy":
+            return None
+        if not EnemyStore.isAvailable():
+            logging.warning("enemy_engine is 'numpy' but NumPy is not installed. Using the sprite engine.")
+            return None
+        logging.info("Using the numpy enemy engine.")
+        return EnemyStore(self.__main.getStageManager().getStageConfig().getCompiledPath())
+
+    def __createEnemy(self, enemyType: str):
+        if self.__store is not None:
+            return ArrayEnemy(self.__main, enemyType, self.__store)
+        return Enemy(self.__main, enemyType)
+
     def startNextWave(self):
         self.__currentWave += 1
-        wave_key = str(self.__currentWave)
-        if wave_key in self.__waveConfig:
+        if self.__currentWave <= len(self.__waves):
             #self.__main.getStageManager().sound['wave'].play()
-            wave_info = self.__waveConfig[wave_key]
-            self.__spawnRate = wave_info.get("spawn_rate", 2.0)
-            if not isinstance(self.__spawnRate, (int, float)) or self.__spawnRate <= 0:
-                logging.warning(f"Invalid spawn_rate '{self.__spawnRate}' in wave {self.__currentWave}. Using default 2.0.")
-                self.__spawnRate = 2.0
-
-            enemies = wave_info.get("enemies", {})
-            if not enemies:
-                logging.warning(f"No enemies defined for wave {self.__currentWave}.")
-            for enemy_type, count in enemies.items():
-                if enemy_type not in self.__enemyConfig:
-                    logging.error(f"Enemy type '{enemy_type}' not defined in enemies configuration.")
-                    continue
-                if not isinstance(count, int) or count <= 0:
-                    logging.warning(f"Invalid count '{count}' for enemy '{enemy_type}' in wave {self.__currentWave}. Skipping.")
-                    continue
-                for _ in range(count):
-                    self.__enemies.append(enemy_type)
-            logging.info(f"Wave {self.__currentWave} started with {len(self.__enemies)} enemies.")
+            # Spawn groups, rates, enemy types and counts were validated by the ConfigCompiler
+            self.__timeline = SpawnTimeline(self.__waves[self.__currentWave - 1])
+            logging.info(f"Wave {self.__currentWave} started with {len(self.__timeline)} enemies.")
         else:
             logging.info("All waves completed. Victory!")
-            pygame.event.post(pygame.event.Event(PLAYER_VICTORY))
+            self.__main.getEventBus().publish(PlayerVictory())
 
     def update(self, deltaTime: float):
         if self.__main.getUIManager().waveChangeUI.canStart:
-            self.__spawnRandomEnemy(deltaTime)
-            self.__checkWaveCompleted()
             self.__updateEnemies(deltaTime)
+            # After the step, so enemies due during it only move by the time since they were due
+            self.__spawnDueEnemies(deltaTime)
+            self.__checkWaveCompleted()
 
-    def draw(self):
+    def draw(self, alpha: float = 1.0) -> list[pygame.Rect]:
+        """
+        Draw every spawned enemy and return the screen rects they cover.
+        """
+        rects = []
         try:
-            self.__spawnedEnemy.draw(self.__main.getScreen())
+            for enemy in self.__spawnedEnemy:
+                rects.append(enemy.draw(alpha))
         except Exception as e:
             logging.error(f"Error drawing enemies: {e}")
+        return rects
 
-    def getEnemies(self) -> pygame.sprite.Group:
+    def getEnemies(self) -> EnemyGroup:
         return self.__spawnedEnemy
 
-    def __spawnRandomEnemy(self, deltaTime: float):
-        if self.__enemies:
-            self.__spawnTimer += deltaTime
-            if self.__spawnTimer >= self.__spawnRate:
-                enemy_type = self.__selectRandomEnemy()
-                self.__spawnEnemy(enemy_type)
-                self.__spawnTimer = 0.0
-
-    def __selectRandomEnemy(self):
-        selected = random.choice(self.__enemies)
-        self.__enemies.remove(selected)
-        return selected
-
-    def __spawnEnemy(self, enemyType: str):
+    def getEnemiesInRadius(self, x: float, y: float, radius: float) -> list:
+        """
+        Return the live enemies within radius pixels of (x, y).
+        """
+        if self.__store is not None:
+            return self.__store.queryRadius(x, y, radius)
+        return [enemy for enemy in self.__spatialIndex.queryRadius(x, y, radius) if enemy.alive()]
+
+    def getEnemiesInCoverage(self, coverage: 'PathCoverage') -> list:
+        """
+        Return the live enemies whose travelled distance lies in the coverage, e.g. a tower's range.
+        """
+        if self.__store is not None:
+            return self.__store.queryCoverage(coverage)
+        return self.__progressIndex.queryCoverage(coverage)
+
+    def selectTarget(self, coverage: 'PathCoverage', priority: str):
+        """
+        Return the enemy a tower with the given coverage and attack priority should attack, or None.
+        Health ties go to the enemy furthest along.
+        """
+        if self.__store is None:
+            return self.__progressIndex.selectTarget(coverage, priority)
+        # The numpy engine targets in batches (see TargetingKernel); this serves single lookups
+        enemies = self.__store.queryCoverage(coverage)
+        if not enemies:
+            return None
+        if priority == "last_enemy":
+            return enemies[-1]
+        elif priority == "lowest_health":
+            return min(enemies, key=lambda e: e.getHealth())
+        elif priority == "highest_health":
+            return max(enemies, key=lambda e: e.getHealth())
+        elif priority == "random":
+            return random.choice(enemies)
+        return enemies[0]
+
+    def getOccupiedBuckets(self):
+        """
+        Return the stretches of path (distance // grid_size) holding at least one live enemy,
+        as a set or set-like view, see PathCoverage.getBuckets.
+        """
+        if self.__store is not None:
+            return self.__store.getOccupiedBuckets(self.__gridSize)
+        return self.__progressIndex.getOccupiedBuckets(self.__gridSize)
+
+    def getStore(self) -> EnemyStore | None:
+        """
+        Return the EnemyStore when the numpy enemy engine is enabled, otherwise None.
+        """
+        return self.__store
+
+    def getSpatialIndex(self) -> SpatialHashGrid:
+        """
+        Return the grid index of live enemy positions, used for blast queries.
+        Entries can lag behind kills made since the last update, so callers should check alive().
+        """
+        return self.__spatialIndex
+
+    def getProgressIndex(self) -> ProgressIndex:
+        """
+        Return the live enemies of the sprite engine in progress order, used for tower range
+        queries and targeting. It stays empty with the numpy engine, which orders its EnemyStore.
+        """
+        return self.__progressIndex
+
+    def getPool(self) -> EnemyPool:
+        return self.__pool
+
+    def getCurrentWave(self) -> int:
+        return self.__currentWave
+
+    def getRemainingSpawns(self) -> int:
+        """
+        Return how many enemies of the current wave have not spawned yet.
+        """
+        return self.__timeline.getRemaining() if self.__timeline is not None else 0
+
+    def __spawnDueEnemies(self, deltaTime: float):
+        if self.__timeline is None or self.__timeline.isFinished():
+            return
+        due = self.__timeline.advance(deltaTime)
+        if not due:
+            return
+        # Every enemy due this step spawns, however long the step was, as far along as it would be by now
+        timeScale = self.__main.getUIManager().pauseUI.getPauseTimeMultiplier()
+        enemyConfig = self.__main.getEnemyConfig()
+        for enemyType, late in due:
+            self.__spawnEnemy(enemyType, enemyConfig.getArchetype(enemyType).speed * late * timeScale)
+
+    def spawnEnemy(self, enemyType: str):
+        """
+        Spawn a single enemy of the given type at the start of the path.
+        """
+        self.__spawnEnemy(enemyType)
+
+    def __spawnEnemy(self, enemyType: str, distance: float = 0.0):
         try:
-            enemy = Enemy(self.__main, enemyType)
-            enemy.spawn()
-            # noinspection PyTypeChecker
+            enemy = self.__pool.acquire(enemyType)
+            enemy.spawn(distance)
+            if self.__store is None:
+                self.__spatialIndex.insert(enemy, *enemy.getPosition())
+                self.__progressIndex.add(enemy)
             self.__spawnedEnemy.add(enemy)
             logging.info(f"Spawned enemy: {enemyType.capitalize()}")
         except FileNotFoundError as e:
@@ -96,19 +196,42 @@ class WaveManager:
             logging.error(f"Unexpected error spawning enemy '{enemyType}': {e}")
 
     def __checkWaveCompleted(self):
-        if not self.__enemies and not self.__spawnedEnemy:
+        if not self.getRemainingSpawns() and not self.__spawnedEnemy:
             self.completeWave()
 
     def completeWave(self):
-        if str(self.__currentWave + 1) in self.__waveConfig:
-            self.__spawnTimer = 0.0
-            pygame.event.post(pygame.event.Event(STAGE_WAVE_END, wave=self.__currentWave))
+        if self.__currentWave < len(self.__waves):
+            self.__main.getEventBus().publish(WaveEnded(self.__currentWave))
         else:
             logging.info("All waves completed. Victory!")
-            pygame.event.post(pygame.event.Event(PLAYER_VICTORY))
+            self.__main.getEventBus().publish(PlayerVictory())
 
     def __updateEnemies(self, deltaTime: float):
+        if self.__store is not None:
+            self.__stepStore(deltaTime)
+            return
         try:
             self.__spawnedEnemy.update(deltaTime)
         except Exception as e:
-            logging.error(f"Error updating WaveManager: {e}")
\ No newline at end of file
+            logging.error(f"Error updating WaveManager: {e}")
+        self.__syncSpatialIndex()
+
+    def __stepStore(self, deltaTime: float):
+        timeScale = self.__main.getUIManager().pauseUI.getPauseTimeMultiplier()
+        killed, reached = self.__store.step(deltaTime, timeScale)
+        for slot in killed:
+            self.__store.getOwner(slot).killEnemy()
+        for slot in reached:
+            self.__store.getOwner(slot).reachEnd()
+        # Includes enemies killed by towers since the last step
+        for enemy in self.__store.popReleased():
+            self.__pool.release(enemy)
+
+    def __syncSpatialIndex(self):
+        for enemy in self.__spatialIndex:
+            if not enemy.alive():
+                self.__spatialIndex.remove(enemy)
+                self.__pool.release(enemy)
+        for enemy in self.__spawnedEnemy:
+            self.__spatialIndex.move(enemy, *enemy.getPosition())
+        self.__progressIndex.update()
\ No newline at end of file
@@ -16,4 +16,4 @@ class MainMenuEventHandler:
         scene: MainMenuScene = self.__main.getCurrentScene()
         scene.startBtn.handle_event(event)
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-            self.__main.setCurrentScene("game")
+            self.__main.setCurrentScene("loading")
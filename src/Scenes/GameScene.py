@@ -2,8 +2,11 @@ import pygame
 
 from typing import TYPE_CHECKING
 from ConfigLoader import ConfigLoader
+from src.GameMechanics.Configs.ConfigRecords import CompiledConfig
 from src.GameMechanics.Configs.TowerConfig import TowerConfig
 from src.GameMechanics.Entities.Player import Player
+from src.GameMechanics.Events.GameEventBus import GameEventBus
+from src.GameMechanics.Events.GameplayEventHandler import GameplayEventHandler
 from src.GameMechanics.Configs.EnemyConfig import EnemyConfig
 from src.GameMechanics.Manager.CurrencyManager import CurrencyManager
 from src.GameMechanics.Manager.InventoryManager import InventoryManager
@@ -11,38 +14,101 @@ from src.GameMechanics.Manager.PlacementManager import PlacementManager
 from src.GameMechanics.Manager.StageManager import StageManager
 from src.GameMechanics.Manager.UIManager import UIManager
 from src.GameMechanics.Manager.WaveManager import WaveManager
+from src.Utils.AssetCache import AssetCache
 from src.Utils.GradientUtils import GradientUtils
+from src.Utils.TextCache import TextCache
 from src.Scenes.Scene import Scene
 
 if TYPE_CHECKING:
     import Main
 
 class GameScene(Scene):
-    def __init__(self, main: 'Main'):
+    UI_IMAGES = [
+        "config/images/UI/heart.png",
+        "config/images/UI/gold_ingot.png",
+        "config/images/UI/diamond_sword.png",
+        "config/images/UI/hotbar.png"
+    ]
+
+    def __init__(self, main: 'Main', stage: str = "default"):
         super().__init__()
         self.__main: 'Main' = main
+        self.__stage = stage
+        self.__eventBus = GameEventBus()
+        # Kept across runs: configs, stage elements, sounds and the hotbar
         self.__enemyConfig = EnemyConfig(self)
         self.__towerConfig = TowerConfig(self)
-        self.__stageManager = StageManager(self, "default")
+        self.__stageManager = StageManager(self, stage)
         self.__UIManager = UIManager(self)
+        self.__InventoryManager = InventoryManager(self, self.__UIManager.hotbarUI)
+        # Rebuilt by reset() for every run
+        self.__player = Player(self)
+        self.__waveManager = WaveManager(self)
+        self.__placementManager = PlacementManager(self)
+        self.__currencyManager = CurrencyManager(self)
+        self.__gameplayEventHandler = GameplayEventHandler(self, self.__eventBus)
+
+    def reset(self):
+        """
+        Start a new run on the same stage. The player, enemies, towers, currency and the run's
+        UI state start over, while loaded configs, images, sounds and the static layer are reused.
+        """
+        self.__eventBus.clear()
+        self.__stageManager.reset()
+        self.__UIManager.reset()
+        self.__InventoryManager.reset()
         self.__player = Player(self)
         self.__waveManager = WaveManager(self)
         self.__placementManager = PlacementManager(self)
-        self.__InventoryManager = InventoryManager(self, self.__UIManager.hotbarUI)
         self.__currencyManager = CurrencyManager(self)
 
-    def tick(self, dt: float):
-        self.__stageManager.tick(dt)
+    @staticmethod
+    def collectAssets(compiledConfig: CompiledConfig) -> tuple[list[str], list[str]]:
+        """
+        Return the image and sound paths a game scene loads, so they can be preloaded
+        on a worker thread before the scene exists.
+        """
+        images = list(GameScene.UI_IMAGES)
+        for tower in compiledConfig.towers.values():
+            images.append(tower.image)
+            images.extend(level.image for level in tower.levels)
+        images.extend(enemy.image for enemy in compiledConfig.enemies.values())
+        return list(dict.fromkeys(images)), list(StageManager.SOUNDS.values())
+
+    def onEnter(self):
+        self.__stageManager.playMusic()
+
+    def update(self, dt: float):
+        self.__stageManager.update(dt)
+        self.__eventBus.flush()
+
+    def draw(self, alpha: float = 1.0):
+        self.__stageManager.draw(alpha)
+
+    def present(self):
+        self.__stageManager.present()
+
+    def getStage(self) -> str:
+        return self.__stage
+
+    def isHeadless(self) -> bool:
+        return self.__main.isHeadless()
 
     def getConfig(self) -> ConfigLoader:
         return self.__main.getConfig()
 
+    def getCompiledConfig(self) -> CompiledConfig:
+        return self.__main.getCompiledConfig()
+
     def getProjectRoot(self) -> str:
         return self.__main.getProjectRoot()
 
     def getScreen(self) -> pygame.Surface:
         return self.__main.getScreen()
 
+    def getEventBus(self) -> GameEventBus:
+        return self.__eventBus
+
     def getStageManager(self) -> StageManager:
         return self.__stageManager
 
@@ -61,9 +127,15 @@ class GameScene(Scene):
     def getGradientUtils(self) -> GradientUtils:
         return self.__main.getGradientUtils()
 
+    def getAssetCache(self) -> AssetCache:
+        return self.__main.getAssetCache()
+
     def getFont(self, size: int) -> pygame.font.Font:
         return self.__main.getFont(size)
 
+    def getTextCache(self) -> TextCache:
+        return self.__main.getTextCache()
+
     def getPlacementManager(self) -> PlacementManager:
         return self.__placementManager
 
@@ -0,0 +1,46 @@
+import pygame
+
+from src.Scenes.Scene import Scene
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Game import Main
+
+class LoadingScene(Scene):
+    BAR_SIZE = (400, 24)
+    BAR_COLORS = [(0, 128, 0), (0, 255, 0)]
+
+    def __init__(self, main: 'Main'):
+        """
+        Shown between the main menu and the game while game assets are still being preloaded.
+        Switches to the game scene as soon as the preloader is done.
+        """
+        super().__init__()
+        self.__main = main
+        self.__screen: pygame.Surface = main.getScreen()
+        width, height = self.BAR_SIZE
+        self.__barRect = pygame.Rect(0, 0, width, height)
+        self.__barRect.center = (self.__screen.get_width() / 2, self.__screen.get_height() / 2 + 40)
+        self.__titleCenter = (self.__screen.get_width() / 2, self.__screen.get_height() / 2 - 20)
+
+    def update(self, dt: float):
+        preloader = self.__main.getAssetPreloader()
+        if preloader is None or preloader.isDone():
+            self.__main.setCurrentScene("game")
+
+    def draw(self, alpha: float = 1.0):
+        preloader = self.__main.getAssetPreloader()
+        progress = preloader.getProgress() if preloader is not None else 1.0
+        textCache = self.__main.getTextCache()
+
+        self.__screen.fill((0, 0, 0))
+        title = textCache.render(32, "Loading...", (255, 255, 255))
+        self.__screen.blit(title, title.get_rect(center=self.__titleCenter))
+
+        bar = self.__barRect
+        gradient = self.__main.getGradientUtils().get_bar_gradient(bar.width, bar.height, self.BAR_COLORS)
+        fillWidth = int(bar.width * progress)
+        if gradient and fillWidth > 0:
+            self.__screen.blit(gradient, bar.topleft, (0, 0, fillWidth, bar.height))
+        pygame.draw.rect(self.__screen, (255, 255, 255), bar.inflate(4, 4), 2)
+        textCache.getDigitAtlas(16, (255, 255, 255)).draw(self.__screen, str(int(progress * 100)), (bar.centerx, bar.bottom + 16))
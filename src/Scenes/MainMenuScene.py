@@ -31,7 +31,7 @@ class MainMenuScene(Scene):
             w=bw,
             h=bh,
             visible=True,
-            onLeftClick=lambda: self.__main.setCurrentScene("game")
+            onLeftClick=lambda: self.__main.setCurrentScene("loading")
         )
 
         self.title_text = "Tower Defense"
@@ -47,7 +47,7 @@ class MainMenuScene(Scene):
         self.title_rect.centerx = self.__screen.get_width() / 2
         self.title_rect.centery = (self.__screen.get_height() / 2) - 150  # Y offset of -150
 
-    def tick(self, dt: float):
+    def draw(self, alpha: float = 1.0):
         # Draw the main menu background
         self.__screen.blit(self.__screen, (0, 0))
 
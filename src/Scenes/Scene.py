@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+import pygame
+
 if TYPE_CHECKING:
     import Main
 
@@ -8,4 +10,20 @@ class Scene:
         pass
 
     def tick(self, dt: float):
-        pass
\ No newline at end of file
+        self.update(dt)
+        self.draw()
+
+    def onEnter(self):
+        """
+        Called when the scene becomes the current scene.
+        """
+        pass
+
+    def update(self, dt: float):
+        pass
+
+    def draw(self, alpha: float = 1.0):
+        pass
+
+    def present(self):
+        pygame.display.flip()
@@ -0,0 +1,162 @@
+import argparse
+import logging
+import random
+import sys
+import time
+
+import pygame
+
+from Game import Main
+
+
+class SimulationResult:
+    def __init__(self, victory: bool, lost: bool, health: int, gold: int, wave: int, simTime: float, wallTime: float):
+        """
+        Outcome of a single headless stage run.
+
+        :param victory: True if every wave was cleared
+        :param lost: True if the player's health reached zero
+        :param health: Remaining player health
+        :param gold: Gold held when the run ended
+        :param wave: Last wave that was started
+        :param simTime: Simulated seconds that elapsed
+        :param wallTime: Real seconds the run took
+        """
+        self.victory = victory
+        self.lost = lost
+        self.health = health
+        self.gold = gold
+        self.wave = wave
+        self.simTime = simTime
+        self.wallTime = wallTime
+
+    def isTimedOut(self) -> bool:
+        return not self.victory and not self.lost
+
+    def matches(self, other: 'SimulationResult') -> bool:
+        """
+        Return True if other ended the same way at the same simulated time; wall time is ignored.
+        """
+        return ((self.victory, self.lost, self.health, self.gold, self.wave, round(self.simTime, 6)) ==
+                (other.victory, other.lost, other.health, other.gold, other.wave, round(other.simTime, 6)))
+
+    def __repr__(self):
+        return (f"SimulationResult(victory={self.victory}, lost={self.lost}, health={self.health}, "
+                f"gold={self.gold}, wave={self.wave}, simTime={self.simTime:.2f}, wallTime={self.wallTime:.2f})")
+
+
+class HeadlessRunner:
+    def __init__(self, stage: str = "default", timeStep: float = 1 / 60, maxSimTime: float = 3600.0, main: Main = None):
+        """
+        Run a stage without a window, stepping the simulation as fast as the CPU allows.
+
+        :param stage: Name of the stage config to load
+        :param timeStep: Simulated seconds per step
+        :param maxSimTime: Simulated seconds after which a run is stopped
+        :param main: Headless Main instance to reuse, created on first use if None
+        """
+        self.__stage = stage
+        self.__timeStep = timeStep
+        self.__maxSimTime = maxSimTime
+        self.__main = main
+
+    def getMain(self) -> Main:
+        if self.__main is None:
+            self.__main = Main(headless=True)
+        return self.__main
+
+    def run(self, towers: list[tuple[str, tuple[int, int]]] = None, gold: int = None, seed: int = None) -> SimulationResult:
+        """
+        Build a fresh GameScene, place the given towers and step it until victory, defeat or maxSimTime.
+
+        :param towers: List of (towerName, (gridX, gridY)) to place before the first wave
+        :param gold: Starting gold, or None to keep the stage default
+        :param seed: Seed for the random module so runs are reproducible
+        """
+        if seed is not None:
+            random.seed(seed)
+
+        main = self.getMain()
+        pygame.event.clear()
+        main.resetScene("game", self.__stage)
+        main.setCurrentScene("game")
+        scene = main.getCurrentScene()
+
+        if gold is not None:
+            scene.getCurrencyManager().setCurrency("gold", gold)
+        for towerName, position in towers or []:
+            scene.getInventoryManager().setSelectedTower(towerName)
+            if not scene.getPlacementManager().place(position):
+                logging.warning(f"Could not place tower '{towerName}' at {position}.")
+
+        stageManager = scene.getStageManager()
+        eventHandler = main.getEventHandler()
+        simTime = 0.0
+        start = time.perf_counter()
+        while simTime < self.__maxSimTime and not stageManager.isVictory and not stageManager.isLost:
+            eventHandler.handle()
+            scene.update(self.__timeStep)
+            simTime += self.__timeStep
+        wallTime = time.perf_counter() - start
+
+        return SimulationResult(
+            victory=stageManager.isVictory,
+            lost=stageManager.isLost,
+            health=scene.getPlayer().getHealth(),
+            gold=scene.getCurrencyManager().getCurrency("gold"),
+            wave=scene.getWaveManager().getCurrentWave(),
+            simTime=simTime,
+            wallTime=wallTime
+        )
+
+    def compareEngines(self, towers: list[tuple[str, tuple[int, int]]] = None, gold: int = None,
+                       seed: int = 0) -> tuple[SimulationResult, SimulationResult]:
+        """
+        Run the same seeded game with the sprite and the numpy enemy engine and return both results.
+        The engines are meant to play out identically, see SimulationResult.matches.
+        """
+        settings = self.getMain().getConfig().getGameSettings()
+        engine = settings.get("enemy_engine")
+        try:
+            settings["enemy_engine"] = "sprite"
+            spriteResult = self.run(towers, gold, seed)
+            settings["enemy_engine"] = "numpy"
+            numpyResult = self.run(towers, gold, seed)
+        finally:
+            settings["enemy_engine"] = engine
+        return spriteResult, numpyResult
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a stage headless and report the outcome.")
+    parser.add_argument("--stage", default="default")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-time", type=float, default=3600.0)
+    parser.add_argument("--gold", type=int, default=None)
+    parser.add_argument("--tower", action="append", default=[], metavar="NAME:X,Y",
+                        help="Tower to place before the first wave, may be repeated")
+    parser.add_argument("--compare-engines", action="store_true",
+                        help="Run every seed with both enemy engines and fail if the outcomes differ")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    placements = []
+    for spec in args.tower:
+        name, coords = spec.split(":")
+        x, y = map(int, coords.split(","))
+        placements.append((name, (x, y)))
+
+    runner = HeadlessRunner(args.stage, maxSimTime=args.max_time)
+    mismatches = 0
+    for i in range(args.runs):
+        seed = args.seed + i if args.seed is not None else None
+        if not args.compare_engines:
+            print(runner.run(placements, gold=args.gold, seed=seed))
+            continue
+        spriteResult, numpyResult = runner.compareEngines(placements, gold=args.gold, seed=seed if seed is not None else i)
+        same = spriteResult.matches(numpyResult)
+        mismatches += not same
+        print(f"sprite: {spriteResult}\nnumpy:  {numpyResult}\n{'match' if same else 'MISMATCH'}")
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,134 @@
+import logging
+import os
+import threading
+
+import pygame
+
+
+class AssetCache:
+    PIXEL_FORMATS = ("alpha", "opaque", "raw")
+
+    def __init__(self, projectRoot: str):
+        """
+        Process-wide cache of decoded and scaled images, and of sounds.
+        Images may be decoded ahead of time on another thread with preloadImage();
+        conversion to the display format always happens on the thread calling getImage().
+
+        :param projectRoot: Directory relative image paths are resolved against
+        """
+        self.__projectRoot = projectRoot
+        self.__sources = {}  # (path, pixelFormat) -> decoded surface at its original size
+        self.__images = {}   # (path, size, pixelFormat) -> scaled surface
+        self.__decoded = {}  # path -> surface decoded by preloadImage(), not yet converted
+        self.__sounds = {}   # path -> pygame.mixer.Sound
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def getImage(self, path: str, size: tuple[float, float] | None = None, pixelFormat: str = "alpha") -> pygame.Surface:
+        """
+        Return the image at the given path, scaled to size and converted to pixelFormat.
+        The image is decoded and scaled only the first time a combination is requested;
+        the returned surface is shared, so callers must copy it before modifying it.
+
+        :param path: Image path, absolute or relative to the project root
+        :param size: Target (width, height), or None to keep the original size
+        :param pixelFormat: "alpha" (convert_alpha), "opaque" (convert) or "raw" (no conversion)
+        """
+        if pixelFormat not in self.PIXEL_FORMATS:
+            raise ValueError(f"Unknown pixel format '{pixelFormat}'.")
+
+        fullPath = self.resolvePath(path)
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (fullPath, size, pixelFormat)
+
+        image = self.__images.get(key)
+        if image is not None:
+            self.__hits += 1
+            return image
+
+        self.__misses += 1
+        image = self.__getSource(fullPath, pixelFormat)
+        if size is not None and size != image.get_size():
+            image = pygame.transform.scale(image, size)
+        self.__images[key] = image
+        logging.debug(f"Cached image '{fullPath}' at size {size} ({pixelFormat}).")
+        return image
+
+    def preloadImage(self, path: str):
+        """
+        Decode an image so a later getImage() only converts and scales it. Safe to call from a worker thread.
+        """
+        fullPath = self.resolvePath(path)
+        with self.__lock:
+            if fullPath in self.__decoded:
+                return
+        try:
+            image = pygame.image.load(fullPath)
+        except (pygame.error, FileNotFoundError) as e:
+            logging.warning(f"Could not preload image '{fullPath}': {e}")
+            return
+        with self.__lock:
+            self.__decoded[fullPath] = image
+
+    def getSound(self, path: str) -> pygame.mixer.Sound:
+        """
+        Return the sound at the given path, loading it on first use. Safe to call from a worker thread.
+        """
+        fullPath = self.resolvePath(path)
+        with self.__lock:
+            sound = self.__sounds.get(fullPath)
+        if sound is not None:
+            return sound
+        sound = pygame.mixer.Sound(fullPath)
+        with self.__lock:
+            return self.__sounds.setdefault(fullPath, sound)
+
+    def resolvePath(self, path: str) -> str:
+        return os.path.normpath(os.path.join(self.__projectRoot, path))
+
+    def __getSource(self, fullPath: str, pixelFormat: str) -> pygame.Surface:
+        sourceKey = (fullPath, pixelFormat)
+        source = self.__sources.get(sourceKey)
+        if source is not None:
+            return source
+
+        with self.__lock:
+            source = self.__decoded.pop(fullPath, None)
+        if source is None:
+            if not os.path.exists(fullPath):
+                logging.error(f"Image not found: {fullPath}")
+                raise FileNotFoundError(f"Image not found: {fullPath}")
+            source = pygame.image.load(fullPath)
+
+        if pixelFormat == "alpha":
+            source = source.convert_alpha()
+        elif pixelFormat == "opaque":
+            source = source.convert()
+        self.__sources[sourceKey] = source
+        return source
+
+    def getStats(self) -> dict:
+        """
+        Return the hit/miss counters and the number of cached surfaces.
+        """
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "images": len(self.__images),
+            "sources": len(self.__sources),
+            "sounds": len(self.__sounds)
+        }
+
+    def clear(self):
+        """
+        Drop every cached surface and reset the counters.
+        """
+        self.__sources.clear()
+        self.__images.clear()
+        with self.__lock:
+            self.__decoded.clear()
+            self.__sounds.clear()
+        self.__hits = 0
+        self.__misses = 0
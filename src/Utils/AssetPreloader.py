@@ -0,0 +1,78 @@
+import logging
+import threading
+import time
+from typing import Callable
+
+import pygame
+
+from src.Utils.AssetCache import AssetCache
+
+
+class AssetPreloader:
+    def __init__(self, assetCache: AssetCache, collect: Callable[[], tuple[list[str], list[str]]]):
+        """
+        Decodes images and loads sounds into an AssetCache on a daemon thread, so a scene built
+        later only has to convert and scale them on the main thread.
+
+        :param assetCache: Cache the assets are loaded into
+        :param collect: Returns the (image paths, sound paths) to load; called on the worker thread
+        """
+        self.__assetCache = assetCache
+        self.__collect = collect
+        self.__thread: threading.Thread | None = None
+        self.__finished = threading.Event()
+        self.__total = 0
+        self.__loaded = 0
+        self.__elapsedMs = 0.0
+
+    def start(self):
+        if self.__thread is not None:
+            return
+        self.__thread = threading.Thread(target=self.__run, name="AssetPreloader", daemon=True)
+        self.__thread.start()
+
+    def __run(self):
+        start = time.perf_counter()
+        try:
+            images, sounds = self.__collect()
+            if not pygame.mixer.get_init():
+                sounds = []
+            self.__total = len(images) + len(sounds)
+            for path in images:
+                self.__assetCache.preloadImage(path)
+                self.__loaded += 1
+            for path in sounds:
+                try:
+                    self.__assetCache.getSound(path)
+                except (pygame.error, FileNotFoundError) as e:
+                    logging.warning(f"Could not preload sound '{path}': {e}")
+                self.__loaded += 1
+        except Exception as e:
+            logging.error(f"Asset preloading failed: {e}")
+        finally:
+            self.__elapsedMs = (time.perf_counter() - start) * 1000
+            logging.info(f"Preloaded {self.__loaded}/{self.__total} assets in {self.__elapsedMs:.1f} ms.")
+            self.__finished.set()
+
+    def isDone(self) -> bool:
+        return self.__finished.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until preloading is done or the timeout (in seconds) runs out, and return isDone().
+        """
+        return self.__finished.wait(timeout)
+
+    def getProgress(self) -> float:
+        """
+        Return the share of assets loaded so far, from 0.0 to 1.0.
+        """
+        if self.__finished.is_set():
+            return 1.0
+        return self.__loaded / self.__total if self.__total else 0.0
+
+    def getElapsedMs(self) -> float:
+        """
+        Return how long preloading took, or 0.0 while it is still running.
+        """
+        return self.__elapsedMs
@@ -5,6 +5,11 @@ from src.Utils.GradientUtils import GradientUtils
 
 
 class Button:
+    # Render cache counters shared by every button, see pop_render_stats()
+    _render_hits = 0
+    _render_rebuilds = 0
+    _default_font = None  # Shared by buttons created without a font, loading it is slow
+
     def __init__(self, x, y, w, h, rect=None,
                  onHover=None, onHoverStop=None, onLeftClick=None, onRightClick=None,
                  onMiddleClick=None, onLongPress=None, long_press_duration=1.0,
@@ -48,7 +53,7 @@ class Button:
         self.selected_color = selected_color if selected_color else self.color
         self.text = text
         self.text_color = text_color
-        self.font = font if font is not None else pygame.font.Font(None, 36)
+        self.font = font if font is not None else self._get_default_font()
         self.text_align = text_align
         self.text_valign = text_valign
         self.text_offset = text_offset
@@ -80,30 +85,67 @@ class Button:
         self._border_gradient_surface = None
         self._text_gradient_surface = None
 
+        # Composed surface per visual state: state -> (render key, surface or None when fully transparent)
+        self._render_cache = {}
+
     def draw(self, screen):
         if not self.visible:
             return
         if self.transparent and not self.hovered and not self.selected:
             return  # Skip drawing if transparent and neither hovered nor selected
 
-        # Create a surface with per-pixel alpha
-        button_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        button_surface = self._get_render_surface()
+        if button_surface is None:
+            return  # Nothing visible, e.g. an overlay faded to alpha 0
+
+        # Blit the button surface onto the main screen
+        return screen.blit(button_surface, (self.x, self.y))
+
+    def _get_render_surface(self):
+        """
+        Return the composed button surface for the current state, rebuilding it only when
+        one of the properties it is drawn from changed since it was last composed.
+        """
         # Determine current state and corresponding color and alpha
         text = self.text
         if self.selected:
+            state = 'selected'
             color = self.selected_color
             alpha = self.selected_alpha
             border_color = self.selected_border_color
         elif self.hovered:
+            state = 'hover'
             color = self.hover_color
             alpha = self.hover_alpha
             border_color = self.hover_border_color
             text = self.hover_text
         else:
+            state = 'normal'
             color = self.color
             alpha = self.alpha
             border_color = self.border_color
 
+        key = (
+            self.width, self.height, color, alpha, border_color, text, self.text_color, self.font,
+            self.text_align, self.text_valign, self.text_offset, self.image, self.border_width,
+            self.background_gradient is not None, self.border_gradient is not None, self.text_gradient is not None
+        )
+        cached = self._render_cache.get(state)
+        if cached is not None and cached[0] == key:
+            Button._render_hits += 1
+            return cached[1]
+
+        Button._render_rebuilds += 1
+        button_surface = self._compose(color, alpha, border_color, text)
+        if button_surface.get_bounding_rect().width == 0:
+            button_surface = None
+        self._render_cache[state] = (key, button_surface)
+        return button_surface
+
+    def _compose(self, color, alpha, border_color, text):
+        # Create a surface with per-pixel alpha
+        button_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+
         # Adjust color with alpha
         color = (*color[:3], alpha)
 
@@ -156,8 +198,24 @@ class Button:
 
             button_surface.blit(text_surf, text_rect)
 
-        # Blit the button surface onto the main screen
-        screen.blit(button_surface, (self.x, self.y))
+        return button_surface
+
+    @classmethod
+    def _get_default_font(cls):
+        if cls._default_font is None:
+            cls._default_font = pygame.font.Font(None, 36)
+        return cls._default_font
+
+    @classmethod
+    def pop_render_stats(cls):
+        """
+        Return how many button draws reused a cached surface and how many had to rebuild it
+        since the last call, then reset both counters.
+        """
+        stats = {"hits": cls._render_hits, "rebuilds": cls._render_rebuilds}
+        cls._render_hits = 0
+        cls._render_rebuilds = 0
+        return stats
 
     def _get_background_gradient_surface(self):
         if self._background_gradient_surface:
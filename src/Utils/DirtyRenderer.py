@@ -0,0 +1,147 @@
+import logging
+
+import pygame
+
+
+class DirtyRenderer:
+    def __init__(self, screen: pygame.Surface, maxRects: int = 96, tileSize: int = 64):
+        """
+        Push only the parts of the screen that changed to the display.
+
+        The static layer (the baked stage background) is kept as an offscreen surface. Each frame it
+        is restored under the rects drawn in the previous frame, then the dynamic elements
+        draw on top and report their rects, and display.update() gets the old and the new rects.
+
+        :param screen: Display surface
+        :param maxRects: Above this many rects in one frame they are merged into runs of tiles
+        :param tileSize: Size in pixels of the tiles rects are merged into
+        """
+        self.__screen = screen
+        self.__screenRect = screen.get_rect()
+        self.__maxRects = maxRects
+        self.__tileSize = tileSize
+        self.__columns = -(-self.__screenRect.width // tileSize)
+        self.__rows = -(-self.__screenRect.height // tileSize)
+        self.__tiles = bytearray(self.__columns * self.__rows)
+        self.__background: pygame.Surface | None = None
+        self.__previous: list[pygame.Rect] = []
+        self.__current: list[pygame.Rect] = []
+        self.__full = True            # This frame pushes the whole display
+        self.__previousFull = True    # The last frame drew over the whole display
+        self.__stats = {"frames": 0, "full_frames": 0, "pushed_pixels": 0}
+
+    def needsBackground(self) -> bool:
+        """
+        Return True when the static layer must be drawn onto the screen and passed to setBackground().
+        """
+        return self.__background is None
+
+    def setBackground(self, surface: pygame.Surface):
+        """
+        Store the static layer. The frame it was drawn in is pushed in full.
+        """
+        self.__background = surface
+        self.__full = True
+
+    def invalidate(self):
+        """
+        Drop the static layer, e.g. after the background or path changed.
+        """
+        self.__background = None
+        self.__full = True
+
+    def beginFrame(self):
+        """
+        Erase what the previous frame drew by restoring the static layer underneath it.
+        """
+        if self.__background is None:
+            return
+        if self.__previousFull:
+            self.__screen.blit(self.__background, (0, 0))
+            return
+        for rect in self.__previous:
+            self.__screen.blit(self.__background, rect, rect)
+
+    def add(self, rect: pygame.Rect | None):
+        """
+        Record a rect drawn this frame. None is ignored, so draw() return values can be passed as is.
+        """
+        if rect:
+            self.__current.append(rect.clip(self.__screenRect))
+
+    def addAll(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def markFull(self):
+        """
+        Push the whole display this frame, for overlays that cover the screen.
+        """
+        self.__full = True
+
+    def present(self):
+        """
+        Push this frame to the display and remember its rects for the next beginFrame().
+        """
+        stats = self.__stats
+        stats["frames"] += 1
+        full = self.__full or self.__previousFull
+        try:
+            if full:
+                pygame.display.flip()
+                stats["full_frames"] += 1
+                stats["pushed_pixels"] += self.__screenRect.width * self.__screenRect.height
+            else:
+                rects = self.__previous + self.__current
+                if len(rects) > self.__maxRects:
+                    rects = self.__coalesce(rects)
+                pygame.display.update(rects)
+                stats["pushed_pixels"] += sum(rect.width * rect.height for rect in rects)
+        except pygame.error as e:
+            logging.error(f"Error updating display: {e}")
+
+        self.__previousFull = self.__full
+        self.__previous, self.__current = self.__current, self.__previous
+        self.__current.clear()
+        self.__full = False
+
+    def __coalesce(self, rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """
+        Merge many rects into horizontal runs of the tiles they touch, which bounds the rect count.
+        """
+        size = self.__tileSize
+        columns = self.__columns
+        tiles = self.__tiles
+        for rect in rects:
+            if not rect:
+                continue
+            first = rect.left // size
+            last = (rect.right - 1) // size
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                start = row * columns
+                tiles[start + first:start + last + 1] = b"\x01" * (last - first + 1)
+
+        merged = []
+        for row in range(self.__rows):
+            start = row * columns
+            column = 0
+            while column < columns:
+                if not tiles[start + column]:
+                    column += 1
+                    continue
+                runStart = column
+                while column < columns and tiles[start + column]:
+                    column += 1
+                merged.append(pygame.Rect(runStart * size, row * size, (column - runStart) * size, size).clip(self.__screenRect))
+        tiles[:] = bytes(len(tiles))
+        return merged
+
+    def getStats(self) -> dict:
+        """
+        Return the number of frames presented, how many were pushed in full,
+        and the share of the display pushed per frame on average.
+        """
+        stats = dict(self.__stats)
+        area = self.__screenRect.width * self.__screenRect.height
+        stats["pushed_ratio"] = stats["pushed_pixels"] / (area * stats["frames"]) if stats["frames"] else 0.0
+        return stats
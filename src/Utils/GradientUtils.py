@@ -1,12 +1,25 @@
 import pygame
+from collections import OrderedDict
 from typing import List, Tuple, Optional
 
+try:
+    import numpy as np
+except ImportError:  # Without NumPy the gradients are drawn line by line and pixel by pixel
+    np = None
+
 class GradientUtils:
-    def __init__(self):
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
         """
         Initializes the GradientUtils class with an empty cache.
+
+        :param max_bytes: Pixel memory the cached gradients may use before the least recently used are dropped
         """
-        self.cache = {}
+        self.cache = OrderedDict()
+        self.max_bytes = max_bytes
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def get_vertical_gradient(
         self, width: int, height: int, colors: List[Tuple[int, int, int]]
@@ -15,27 +28,20 @@ class GradientUtils:
         Creates or retrieves a vertical gradient surface with multi-color support.
         """
         key = ('vertical', width, height, tuple(colors))
-        if key in self.cache:
-            return self.cache[key]
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
 
         try:
-            gradient = pygame.Surface((width, height), pygame.SRCALPHA)
-            num_colors = len(colors)
-            if num_colors < 2:
+            if len(colors) < 2:
                 raise ValueError("At least two colors are required for a gradient.")
-
-            segment_height = height / (num_colors - 1)
-            for i in range(num_colors - 1):
-                start_color = colors[i]
-                end_color = colors[i + 1]
-                for y in range(int(segment_height)):
-                    factor = y / segment_height
-                    color = self._interpolate_color(start_color, end_color, factor)
-                    pos_y = int(i * segment_height + y)
-                    if pos_y >= height:
-                        break
-                    pygame.draw.line(gradient, color, (0, pos_y), (width, pos_y))
-            self.cache[key] = gradient
+            if np is not None:
+                # One column of colors, stretched (nearest neighbour) to the full width
+                column = self._get_multi_color_array(colors, np.arange(height) / height)
+                gradient = pygame.transform.scale(self._surface_from_array(column[None, :, :]), (width, height))
+            else:
+                gradient = self._draw_vertical_gradient(width, height, colors)
+            self._store(key, gradient)
             return gradient
         except Exception as e:
             print(f"Error creating vertical gradient: {e}")
@@ -48,27 +54,20 @@ class GradientUtils:
         Creates or retrieves a horizontal gradient surface with multi-color support.
         """
         key = ('horizontal', width, height, tuple(colors))
-        if key in self.cache:
-            return self.cache[key]
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
 
         try:
-            gradient = pygame.Surface((width, height), pygame.SRCALPHA)
-            num_colors = len(colors)
-            if num_colors < 2:
+            if len(colors) < 2:
                 raise ValueError("At least two colors are required for a gradient.")
-
-            segment_width = width / (num_colors - 1)
-            for i in range(num_colors - 1):
-                start_color = colors[i]
-                end_color = colors[i + 1]
-                for x in range(int(segment_width)):
-                    factor = x / segment_width
-                    color = self._interpolate_color(start_color, end_color, factor)
-                    pos_x = int(i * segment_width + x)
-                    if pos_x >= width:
-                        break
-                    pygame.draw.line(gradient, color, (pos_x, 0), (pos_x, height))
-            self.cache[key] = gradient
+            if np is not None:
+                # One row of colors, stretched (nearest neighbour) to the full height
+                row = self._get_multi_color_array(colors, np.arange(width) / width)
+                gradient = pygame.transform.scale(self._surface_from_array(row[:, None, :]), (width, height))
+            else:
+                gradient = self._draw_horizontal_gradient(width, height, colors)
+            self._store(key, gradient)
             return gradient
         except Exception as e:
             print(f"Error creating horizontal gradient: {e}")
@@ -81,22 +80,21 @@ class GradientUtils:
         Creates or retrieves a diagonal gradient surface with multi-color support.
         """
         key = ('diagonal', width, height, tuple(colors))
-        if key in self.cache:
-            return self.cache[key]
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
 
         try:
-            gradient = pygame.Surface((width, height), pygame.SRCALPHA)
-            num_colors = len(colors)
-            if num_colors < 2:
+            if len(colors) < 2:
                 raise ValueError("At least two colors are required for a gradient.")
-
-            max_distance = (width + height)
-            for y in range(height):
-                for x in range(width):
-                    position = (x + y) / max_distance
-                    color = self._get_multi_color(colors, position)
-                    gradient.set_at((x, y), color)
-            self.cache[key] = gradient
+            if np is not None:
+                # Every pixel on an anti-diagonal (same x + y) has the same color
+                ramp = self._get_multi_color_array(colors, np.arange(width + height - 1) / (width + height))
+                diagonal = np.arange(width)[:, None] + np.arange(height)[None, :]
+                gradient = self._surface_from_array(ramp[diagonal])
+            else:
+                gradient = self._draw_diagonal_gradient(width, height, colors)
+            self._store(key, gradient)
             return gradient
         except Exception as e:
             print(f"Error creating diagonal gradient: {e}")
@@ -109,38 +107,162 @@ class GradientUtils:
         Creates or retrieves a radial gradient surface with multi-color support.
         """
         key = ('radial', width, height, tuple(colors), center)
-        if key in self.cache:
-            return self.cache[key]
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
 
         try:
-            gradient = pygame.Surface((width, height), pygame.SRCALPHA)
             if center is None:
                 center = (width // 2, height // 2)
-            max_distance = ((max(center[0], width - center[0])) ** 2 + (max(center[1], height - center[1])) ** 2) ** 0.5
-            num_colors = len(colors)
-            if num_colors < 2:
+            if len(colors) < 2:
                 raise ValueError("At least two colors are required for a gradient.")
-
-            for y in range(height):
-                for x in range(width):
-                    dx = x - center[0]
-                    dy = y - center[1]
-                    distance = (dx**2 + dy**2) ** 0.5 / max_distance
-                    if distance > 1:
-                        distance = 1
-                    color = self._get_multi_color(colors, distance)
-                    gradient.set_at((x, y), (*color, 255))
-            self.cache[key] = gradient
+            if np is not None:
+                max_distance = ((max(center[0], width - center[0])) ** 2 + (max(center[1], height - center[1])) ** 2) ** 0.5
+                dx = np.arange(width, dtype=np.float64)[:, None] - center[0]
+                dy = np.arange(height, dtype=np.float64)[None, :] - center[1]
+                distance = np.minimum(np.sqrt(dx * dx + dy * dy) / max_distance, 1.0)
+                gradient = self._surface_from_array(self._get_multi_color_array(colors, distance))
+            else:
+                gradient = self._draw_radial_gradient(width, height, colors, center)
+            self._store(key, gradient)
             return gradient
         except Exception as e:
             print(f"Error creating radial gradient: {e}")
             return None
 
+    def get_bar_gradient(self, width: int, height: int, colors: List[Tuple[int, int, int]]) -> Optional[pygame.Surface]:
+        """
+        Returns the horizontal gradient of a full bar. Draw a partly filled bar by blitting only its
+        left part, e.g. screen.blit(bar, position, (0, 0, current_width, height)), so one surface
+        serves every fill level instead of caching a gradient per width.
+        """
+        return self.get_horizontal_gradient(width, height, colors)
+
     def clear_cache(self):
         """
         Clears the gradient cache.
         """
         self.cache.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> dict:
+        """
+        Returns the cache hits, misses and evictions, and the number and pixel bytes of cached gradients.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "surfaces": len(self.cache),
+            "bytes": self._bytes
+        }
+
+    def _get_cached(self, key: tuple) -> Optional[pygame.Surface]:
+        gradient = self.cache.get(key)
+        if gradient is None:
+            self._misses += 1
+            return None
+        self.cache.move_to_end(key)
+        self._hits += 1
+        return gradient
+
+    def _store(self, key: tuple, gradient: pygame.Surface):
+        """
+        Caches a gradient and drops the least recently used ones while the cache is over max_bytes.
+        """
+        self.cache[key] = gradient
+        self._bytes += self._size_of(gradient)
+        while self._bytes > self.max_bytes and len(self.cache) > 1:
+            _, evicted = self.cache.popitem(last=False)
+            self._bytes -= self._size_of(evicted)
+            self._evictions += 1
+
+    @staticmethod
+    def _size_of(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _surface_from_array(self, rgb) -> pygame.Surface:
+        """
+        Creates an opaque per-pixel alpha surface from an array of colors indexed [x, y].
+        """
+        width, height = rgb.shape[:2]
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[...] = rgb
+        del pixels
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha.fill(255)
+        del alpha
+        return surface
+
+    def _get_multi_color_array(self, colors: List[Tuple[int, int, int]], positions):
+        """
+        Vectorized _get_multi_color: maps an array of positions in [0, 1] to an array of colors
+        with one more trailing axis of size 3.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        stops = np.linspace(0.0, 1.0, len(colors))
+        result = np.empty(positions.shape + (3,), dtype=np.uint8)
+        for channel in range(3):
+            # Linear interpolation between the color stops, truncated like _interpolate_color
+            result[..., channel] = np.interp(positions, stops, [color[channel] for color in colors])
+        return result
+
+    def _draw_vertical_gradient(self, width: int, height: int, colors: List[Tuple[int, int, int]]) -> pygame.Surface:
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        segment_height = height / (len(colors) - 1)
+        for i in range(len(colors) - 1):
+            start_color = colors[i]
+            end_color = colors[i + 1]
+            for y in range(int(segment_height)):
+                factor = y / segment_height
+                color = self._interpolate_color(start_color, end_color, factor)
+                pos_y = int(i * segment_height + y)
+                if pos_y >= height:
+                    break
+                pygame.draw.line(gradient, color, (0, pos_y), (width, pos_y))
+        return gradient
+
+    def _draw_horizontal_gradient(self, width: int, height: int, colors: List[Tuple[int, int, int]]) -> pygame.Surface:
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        segment_width = width / (len(colors) - 1)
+        for i in range(len(colors) - 1):
+            start_color = colors[i]
+            end_color = colors[i + 1]
+            for x in range(int(segment_width)):
+                factor = x / segment_width
+                color = self._interpolate_color(start_color, end_color, factor)
+                pos_x = int(i * segment_width + x)
+                if pos_x >= width:
+                    break
+                pygame.draw.line(gradient, color, (pos_x, 0), (pos_x, height))
+        return gradient
+
+    def _draw_diagonal_gradient(self, width: int, height: int, colors: List[Tuple[int, int, int]]) -> pygame.Surface:
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        max_distance = (width + height)
+        for y in range(height):
+            for x in range(width):
+                position = (x + y) / max_distance
+                color = self._get_multi_color(colors, position)
+                gradient.set_at((x, y), color)
+        return gradient
+
+    def _draw_radial_gradient(
+        self, width: int, height: int, colors: List[Tuple[int, int, int]], center: Tuple[int, int]
+    ) -> pygame.Surface:
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        max_distance = ((max(center[0], width - center[0])) ** 2 + (max(center[1], height - center[1])) ** 2) ** 0.5
+        for y in range(height):
+            for x in range(width):
+                dx = x - center[0]
+                dy = y - center[1]
+                distance = (dx**2 + dy**2) ** 0.5 / max_distance
+                if distance > 1:
+                    distance = 1
+                color = self._get_multi_color(colors, distance)
+                gradient.set_at((x, y), (*color, 255))
+        return gradient
 
     def _interpolate_color(
         self, start_color: Tuple[int, int, int], end_color: Tuple[int, int, int], factor: float
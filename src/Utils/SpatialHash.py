@@ -0,0 +1,92 @@
+class SpatialHashGrid:
+    def __init__(self, cellSize: float):
+        """
+        Uniform grid index for point objects, used for radius queries.
+
+        :param cellSize: Width and height of a cell in pixels, normally the stage grid_size
+        """
+        if cellSize <= 0:
+            raise ValueError("Cell size must be positive.")
+        self.__cellSize = cellSize
+        self.__cells: dict[tuple[int, int], set] = {}
+        self.__objectCells: dict[object, tuple[int, int]] = {}
+        self.__positions: dict[object, tuple[float, float]] = {}
+
+    def __cellOf(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self.__cellSize), int(y // self.__cellSize)
+
+    def insert(self, obj, x: float, y: float):
+        cell = self.__cellOf(x, y)
+        self.__cells.setdefault(cell, set()).add(obj)
+        self.__objectCells[obj] = cell
+        self.__positions[obj] = (x, y)
+
+    def move(self, obj, x: float, y: float):
+        """
+        Update the position of an object, inserting it if it is not indexed yet.
+        The object only changes bucket when it crosses into another cell.
+        """
+        oldCell = self.__objectCells.get(obj)
+        if oldCell is None:
+            self.insert(obj, x, y)
+            return
+        self.__positions[obj] = (x, y)
+        cell = self.__cellOf(x, y)
+        if cell != oldCell:
+            self.__removeFromCell(obj, oldCell)
+            self.__cells.setdefault(cell, set()).add(obj)
+            self.__objectCells[obj] = cell
+
+    def remove(self, obj):
+        cell = self.__objectCells.pop(obj, None)
+        if cell is None:
+            return
+        del self.__positions[obj]
+        self.__removeFromCell(obj, cell)
+
+    def __removeFromCell(self, obj, cell: tuple[int, int]):
+        bucket = self.__cells[cell]
+        bucket.discard(obj)
+        if not bucket:
+            del self.__cells[cell]
+
+    def queryRadius(self, x: float, y: float, radius: float) -> list:
+        """
+        Return every indexed object whose position is within radius of (x, y).
+        Only the cells overlapping the query circle's bounding box are visited.
+        """
+        minX, minY = self.__cellOf(x - radius, y - radius)
+        maxX, maxY = self.__cellOf(x + radius, y + radius)
+        radiusSquared = radius * radius
+        cells = self.__cells
+        positions = self.__positions
+        found = []
+        for cellX in range(minX, maxX + 1):
+            for cellY in range(minY, maxY + 1):
+                bucket = cells.get((cellX, cellY))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    objX, objY = positions[obj]
+                    dx = objX - x
+                    dy = objY - y
+                    if dx * dx + dy * dy <= radiusSquared:
+                        found.append(obj)
+        return found
+
+    def getPosition(self, obj) -> tuple[float, float] | None:
+        return self.__positions.get(obj)
+
+    def clear(self):
+        self.__cells.clear()
+        self.__objectCells.clear()
+        self.__positions.clear()
+
+    def __contains__(self, obj) -> bool:
+        return obj in self.__objectCells
+
+    def __iter__(self):
+        return iter(list(self.__objectCells))
+
+    def __len__(self) -> int:
+        return len(self.__objectCells)
@@ -0,0 +1,120 @@
+import logging
+from collections import OrderedDict
+from typing import Callable
+
+import pygame
+
+
+class GlyphAtlas:
+    def __init__(self, font: pygame.font.Font, color: tuple, characters: str):
+        """
+        Pre-rendered glyphs of one font and color, so strings made only of those characters
+        (e.g. numbers) can be drawn by blitting glyphs instead of rasterizing the text.
+
+        :param font: Font the glyphs are rendered with
+        :param color: Text color
+        :param characters: Characters to pre-render
+        """
+        self.__glyphs = {char: font.render(char, True, color) for char in characters}
+        self.__height = max((glyph.get_height() for glyph in self.__glyphs.values()), default=0)
+
+    def canDraw(self, text: str) -> bool:
+        glyphs = self.__glyphs
+        return all(char in glyphs for char in text)
+
+    def getSize(self, text: str) -> tuple[int, int]:
+        glyphs = self.__glyphs
+        return sum(glyphs[char].get_width() for char in text), self.__height
+
+    def draw(self, surface: pygame.Surface, text: str, center: tuple[float, float], alpha: int | None = None) -> pygame.Rect:
+        """
+        Draw text centered on center and return the rect it covers.
+
+        :param alpha: Opacity (0..255) of the glyphs, or None to draw them opaque
+        """
+        glyphs = self.__glyphs
+        width, height = self.getSize(text)
+        left = int(center[0] - width / 2)
+        y = int(center[1] - height / 2)
+        x = left
+        for char in text:
+            glyph = glyphs[char]
+            glyph.set_alpha(alpha)
+            surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return pygame.Rect(left, y, width, height)
+
+
+class TextCache:
+    DIGITS = "0123456789/-"
+
+    def __init__(self, fontLoader: Callable[[int], pygame.font.Font], maxBytes: int = 4 * 1024 * 1024):
+        """
+        Least-recently-used cache of rendered text surfaces, keyed by font size, string and color.
+
+        :param fontLoader: Returns the font of a given size, e.g. Main.getFont
+        :param maxBytes: Pixel memory the cached surfaces may use before the oldest are dropped
+        """
+        self.__fontLoader = fontLoader
+        self.__maxBytes = maxBytes
+        self.__surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.__atlases: dict[tuple, GlyphAtlas] = {}
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def render(self, size: int, text: str, color: tuple) -> pygame.Surface:
+        """
+        Return text rendered with antialiasing at the given font size and color.
+        The surface is shared: callers that change its alpha must set it before every blit.
+        """
+        key = (size, text, tuple(color))
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.__surfaces.move_to_end(key)
+            self.__hits += 1
+            return surface
+
+        self.__misses += 1
+        surface = self.__fontLoader(size).render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.__surfaces[key] = surface
+        self.__bytes += self.__sizeOf(surface)
+        while self.__bytes > self.__maxBytes and len(self.__surfaces) > 1:
+            _, evicted = self.__surfaces.popitem(last=False)
+            self.__bytes -= self.__sizeOf(evicted)
+            self.__evictions += 1
+        return surface
+
+    def getDigitAtlas(self, size: int, color: tuple) -> GlyphAtlas:
+        """
+        Return the glyph atlas for digits, '/' and '-' at the given font size and color.
+        """
+        key = (size, tuple(color))
+        atlas = self.__atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(self.__fontLoader(size), color, self.DIGITS)
+            self.__atlases[key] = atlas
+            logging.debug(f"Built digit atlas for size {size} and color {color}.")
+        return atlas
+
+    def clear(self):
+        self.__surfaces.clear()
+        self.__atlases.clear()
+        self.__bytes = 0
+
+    def getStats(self) -> dict:
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "surfaces": len(self.__surfaces),
+            "bytes": self.__bytes,
+            "atlases": len(self.__atlases)
+        }
+
+    @staticmethod
+    def __sizeOf(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()